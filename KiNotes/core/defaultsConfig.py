@@ -71,6 +71,8 @@ PERFORMANCE_DEFAULTS = {
     'timer_min_ms': 3000,            # Minimum allowed interval
     'timer_max_ms': 60000,           # Maximum allowed interval
     'timer_display_divisor': 1,      # Update timer display every N ticks
+    'todo_save_debounce_ms': 500,    # Todo text edits are saved after this pause
+    'settings_flush_ms': 2000,       # Local settings changes are written after this pause
 }
 
 # ============================================================
@@ -65,14 +65,20 @@ class ImageHandler:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{prefix}_{timestamp}.{ext}"
         
-        # Add counter if file exists (rare edge case)
-        full_path = os.path.join(self.images_dir, filename)
-        if os.path.exists(full_path):
+        # Add counter if file exists (rare edge case) - one directory scan
+        # for the taken names instead of a stat() per candidate
+        if os.path.exists(os.path.join(self.images_dir, filename)):
+            stem = f"{prefix}_{timestamp}_"
+            try:
+                with os.scandir(self.images_dir) as it:
+                    taken = {e.name for e in it if e.name.startswith(stem)}
+            except OSError:
+                taken = set()
             counter = 1
-            while os.path.exists(full_path):
-                filename = f"{prefix}_{timestamp}_{counter}.{ext}"
-                full_path = os.path.join(self.images_dir, filename)
+            filename = f"{stem}{counter}.{ext}"
+            while filename in taken:
                 counter += 1
+                filename = f"{stem}{counter}.{ext}"
         
         return filename
     
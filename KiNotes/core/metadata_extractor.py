@@ -28,10 +28,12 @@ class MetadataExtractor:
     
     def __init__(self):
         """Initialize the extractor."""
-        self._board = None
+        self._board = None  # Pinned by extract_all() for the duration of one run
     
     def _get_board(self):
         """Get current PCB board safely."""
+        if self._board is not None:
+            return self._board
         try:
             if HAS_PCBNEW:
                 return pcbnew.GetBoard()
@@ -824,18 +826,31 @@ class MetadataExtractor:
         
         return "\n".join(lines)
     
-    def extract_all(self):
-        """Extract all metadata types."""
-        sections = [
-            self.extract_board_size(),
-            self.extract_layers(),
-            self.extract_bom(),
-            self.extract_netlist(),
-            self.extract_diff_pairs(),
-            self.extract_drill_table(),
-            self.extract_design_rules(),
-            self.extract_stackup(),
-        ]
+    def extract_all(self, date_str=None):
+        """Extract all metadata types.
+        
+        Sections run sequentially - pcbnew is not thread-safe - but share one
+        board handle instead of each calling pcbnew.GetBoard() again.
+        
+        Args:
+            date_str: Optional preformatted timestamp for the header
+        """
+        self._board = self._get_board()
+        try:
+            sections = [
+                self.extract_board_size(),
+                self.extract_layers(),
+                self.extract_bom(),
+                self.extract_netlist(),
+                self.extract_diff_pairs(),
+                self.extract_drill_table(),
+                self.extract_design_rules(),
+                self.extract_stackup(),
+            ]
+        finally:
+            self._board = None
         
-        header = f"# Board Metadata\n*Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n"
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y-%m-%d %H:%M')
+        header = f"# Board Metadata\n*Extracted: {date_str}*\n\n"
         return header + "\n---\n\n".join(sections)
@@ -15,7 +15,7 @@ from .themes import (
     DARK_THEME, LIGHT_THEME,
     BACKGROUND_COLORS, TEXT_COLORS,
     DARK_BACKGROUND_COLORS, DARK_TEXT_COLORS,
-    hex_to_colour
+    hex_to_colour, theme_colours
 )
 
 from .scaling import (
@@ -49,6 +49,7 @@ __all__ = [
     'BACKGROUND_COLORS', 'TEXT_COLORS',
     'DARK_BACKGROUND_COLORS', 'DARK_TEXT_COLORS',
     'hex_to_colour',
+    'theme_colours',
     
     # Scaling
     'get_dpi_scale_factor', 'scale_size', 'scale_font_size',
@@ -4,6 +4,7 @@ Interactive BOM dialog with column selection and grouping options.
 Similar to Interactive BOM (IBOM) plugin functionality.
 """
 
+import re
 import wx
 
 try:
@@ -13,6 +14,8 @@ except ImportError:
     HAS_PCBNEW = False
     pcbnew = None
 
+_REF_SPLIT = re.compile(r'([A-Za-z]+)(\d+)')
+
 
 class BOMConfigDialog(wx.Dialog):
     """
@@ -259,12 +262,18 @@ class BOMGenerator:
     def _extract_components(self, board, config):
         """Extract component data from board."""
         components = []
+        exclude_dnp = config.get('exclude_dnp', True)
+        exclude_fiducials = config.get('exclude_fiducials', True)
+        exclude_testpoints = config.get('exclude_testpoints', True)
         
         for fp in board.GetFootprints():
             ref = fp.GetReference()
+            ref_upper = ref.upper()  # Upper-cased once for every filter below
+            value = fp.GetValue()
+            value_upper = value.upper()
             
             # Apply filters
-            if config.get('exclude_dnp', True):
+            if exclude_dnp:
                 # Check DNP attribute (KiCad 9+)
                 try:
                     if hasattr(fp, 'GetAttributes'):
@@ -272,23 +281,23 @@ class BOMGenerator:
                         if hasattr(attrs, 'IsExcludedFromBOM') and attrs.IsExcludedFromBOM():
                             continue
                     # Also check for DNP in reference or "DNP" field
-                    if 'DNP' in ref.upper():
+                    if 'DNP' in ref_upper:
                         continue
                 except:
                     pass
             
-            if config.get('exclude_fiducials', True):
-                if ref.upper().startswith('FID') or 'FIDUCIAL' in fp.GetValue().upper():
+            if exclude_fiducials:
+                if ref_upper.startswith('FID') or 'FIDUCIAL' in value_upper:
                     continue
             
-            if config.get('exclude_testpoints', True):
-                if ref.upper().startswith('TP') or 'TESTPOINT' in fp.GetValue().upper():
+            if exclude_testpoints:
+                if ref_upper.startswith('TP') or 'TESTPOINT' in value_upper:
                     continue
             
             # Extract all possible fields
             comp = {
                 'reference': ref,
-                'value': fp.GetValue(),
+                'value': value,
                 'footprint': self._get_footprint_name(fp),
                 'quantity': 1,
                 'description': self._get_field(fp, 'Description') or self._get_field(fp, 'Desc') or '',
@@ -300,7 +309,7 @@ class BOMGenerator:
                 'x_pos': f"{pcbnew.ToMM(fp.GetPosition().x):.2f}",
                 'y_pos': f"{pcbnew.ToMM(fp.GetPosition().y):.2f}",
                 'rotation': f"{fp.GetOrientationDegrees():.1f}°",
-                'dnp': 'Yes' if 'DNP' in ref.upper() else 'No',
+                'dnp': 'Yes' if 'DNP' in ref_upper else 'No',
             }
             
             components.append(comp)
@@ -379,8 +388,7 @@ class BOMGenerator:
     
     def _ref_sort_key(self, ref):
         """Sort key for references (R1 < R2 < R10 < C1)."""
-        import re
-        match = re.match(r'([A-Za-z]+)(\d+)', ref)
+        match = _REF_SPLIT.match(ref)
         if match:
             prefix, num = match.groups()
             return (prefix, int(num))
@@ -13,12 +13,75 @@ Usage:
     btn = RoundedButton(parent, "Save", size=(100, 40), bg_color="#4CAF50")
     btn.Bind_Click(on_click_handler)
 """
+import sys
+
 import wx
 from ..themes import hex_to_colour
 from ..scaling import scale_size, scale_font_size
 
+# On MSW a composited window skips the DDB-backed paint buffer entirely
+_IS_MSW = sys.platform.startswith("win")
+
+
+def _paint_dc(window):
+    """Paint DC for an EVT_PAINT handler, buffered only if the system isn't."""
+    if window.IsDoubleBuffered():
+        return wx.PaintDC(window)
+    return wx.BufferedPaintDC(window)
+
+
+_HAND_CURSOR = None  # Created on first use; wx.App must exist first
+
+
+def _hand_cursor():
+    """Hand cursor shared by every button instead of one per widget."""
+    global _HAND_CURSOR
+    if _HAND_CURSOR is None:
+        _HAND_CURSOR = wx.Cursor(wx.CURSOR_HAND)
+    return _HAND_CURSOR
+
 
-class RoundedButton(wx.Panel):
+def _repaint(window):
+    """Queue one repaint of the widget face, coalescing calls in the same tick."""
+    if window._refresh_pending:
+        return
+    window._refresh_pending = True
+    wx.CallAfter(_do_repaint, window)
+
+
+def _do_repaint(window):
+    if not window:  # Destroyed before the queued call ran
+        return
+    window._refresh_pending = False
+    window.RefreshRect(window.GetClientRect(), eraseBackground=False)
+
+
+class _ParentBackgroundMixin:
+    """Caches the brush for the parent's background colour between paints.
+    
+    The parent colour is read on every paint - parents get recoloured by
+    theme passes that never touch the button - but the brush is only
+    rebuilt when that colour actually changed.
+    """
+    
+    _parent_bg = None
+    _parent_bg_brush = None
+    _refresh_pending = False  # See _repaint()
+    
+    def _get_parent_bg(self):
+        parent = self.GetParent()
+        colour = parent.GetBackgroundColour() if parent else wx.WHITE
+        if colour != self._parent_bg:
+            self._parent_bg = colour
+            self._parent_bg_brush = wx.Brush(colour)
+        return self._parent_bg
+    
+    def _on_sys_colour_changed(self, event):
+        self.Refresh()
+        event.Skip()
+
+
+class RoundedButton(_ParentBackgroundMixin, wx.Panel):
     """
     Custom rounded button with hover effects.
     Industry-standard button with modern styling.
@@ -42,10 +105,13 @@ class RoundedButton(wx.Panel):
         scaled_size = scale_size(size, parent)
         super().__init__(parent, size=scaled_size)
         
-        self.label = label
-        self.icon = icon
+        self._text_extent = None  # Measured lazily on first paint
+        self._cache = {}  # {(state, w, h, parent_rgb): wx.Bitmap}, state 0/1/2
+        self._path_cache = {}  # {(w, h, corner): wx.GraphicsPath}
+        self._set_text(label, icon)
         self.bg_color = hex_to_colour(bg_color) if isinstance(bg_color, str) else bg_color
         self.fg_color = hex_to_colour(fg_color) if isinstance(fg_color, str) else fg_color
+        self._refresh_state_colors()
         self.corner_radius = scale_size(corner_radius, parent)
         self.corner_flags = corner_flags
         self.is_hovered = False
@@ -57,16 +123,44 @@ class RoundedButton(wx.Panel):
         
         self.SetMinSize(scaled_size)
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        if _IS_MSW:
+            self.SetDoubleBuffered(True)
         
         self.font = wx.Font(self.base_font_size, wx.FONTFAMILY_DEFAULT,
                            wx.FONTSTYLE_NORMAL, font_weight)
         
         self.Bind(wx.EVT_PAINT, self._on_paint)
+        self.Bind(wx.EVT_SYS_COLOUR_CHANGED, self._on_sys_colour_changed)
+        self.Bind(wx.EVT_SIZE, self._on_size)
         self.Bind(wx.EVT_ENTER_WINDOW, self._on_enter)
         self.Bind(wx.EVT_LEAVE_WINDOW, self._on_leave)
         self.Bind(wx.EVT_LEFT_DOWN, self._on_press)
         self.Bind(wx.EVT_LEFT_UP, self._on_release)
-        self.SetCursor(wx.Cursor(wx.CURSOR_HAND))
+        self.SetCursor(_hand_cursor())
+    
+    @property
+    def label(self):
+        return self._label
+    
+    @label.setter
+    def label(self, value):
+        self._set_text(value, self._icon)
+    
+    @property
+    def icon(self):
+        return self._icon
+    
+    @icon.setter
+    def icon(self, value):
+        self._set_text(self._label, value)
+    
+    def _set_text(self, label, icon):
+        """Store label/icon and the joined text painted on the button."""
+        self._label = label
+        self._icon = icon
+        self._display_text = f"{icon}  {label}" if icon else label
+        self._text_extent = None
+        self._cache.clear()
     
     def _darken_color(self, color, amount):
         """Darken a color by amount."""
@@ -75,54 +169,49 @@ class RoundedButton(wx.Panel):
         b = max(0, color.Blue() - amount)
         return wx.Colour(r, g, b)
 
+    def _refresh_state_colors(self):
+        """Precompute normal/hover/pressed fills, indexed by paint state."""
+        self._state_bg = (
+            self.bg_color,
+            self._darken_color(self.bg_color, 15),
+            self._darken_color(self.bg_color, 40),
+        )
+
     def _on_press(self, event):
-        self.is_pressed = True
-        self.Refresh()
+        if not self.is_pressed:
+            self.is_pressed = True
+            _repaint(self)
         event.Skip()
 
     def _on_release(self, event):
         if self.is_pressed:
             self.is_pressed = False
-            self.Refresh()
+            _repaint(self)
             pos = event.GetPosition()
             rect = self.GetClientRect()
             if rect.Contains(pos) and self.callback:
                 self.callback(event)
 
-    def _on_paint(self, event):
-        dc = wx.AutoBufferedPaintDC(self)
-        gc = wx.GraphicsContext.Create(dc)
-        
-        w, h = self.GetSize()
-        if w <= 0 or h <= 0:
-            return
-        
-        # Clear with parent background
-        parent = self.GetParent()
-        parent_bg = parent.GetBackgroundColour() if parent else wx.WHITE
-        gc.SetBrush(wx.Brush(parent_bg))
-        gc.SetPen(wx.TRANSPARENT_PEN)
-        gc.DrawRectangle(0, 0, w, h)
-        
-        # Button color based on state
-        if self.is_pressed:
-            bg = self._darken_color(self.bg_color, 40)
-        elif self.is_hovered:
-            bg = self._darken_color(self.bg_color, 15)
-        else:
-            bg = self.bg_color
-        
-        # Draw button with selective corner rounding
+    def _on_size(self, event):
+        self._cache.clear()
+        self._path_cache.clear()
+        self.Refresh()
+        event.Skip()
+
+    def _face_path(self, gc, w, h):
+        """Rounded outline of the button face, built once per size for all states."""
         corner = min(self.corner_radius, h // 3)
-        gc.SetBrush(wx.Brush(bg))
-        gc.SetPen(wx.TRANSPARENT_PEN)
+        key = (w, h, corner)
+        path = self._path_cache.get(key)
+        if path is not None:
+            return path
         
+        path = gc.CreatePath()
         if self.corner_flags == self.CORNER_ALL:
             # All corners rounded - use standard method
-            gc.DrawRoundedRectangle(0, 0, w, h, corner)
+            path.AddRoundedRectangle(0, 0, w, h, corner)
         else:
             # Selective corners - build custom path
-            path = gc.CreatePath()
             tl = corner if (self.corner_flags & self.CORNER_TL) else 0
             tr = corner if (self.corner_flags & self.CORNER_TR) else 0
             bl = corner if (self.corner_flags & self.CORNER_BL) else 0
@@ -143,38 +232,103 @@ class RoundedButton(wx.Panel):
             if tl > 0:
                 path.AddArc(tl, tl, tl, 3.14159, 3.14159 * 1.5, True)
             path.CloseSubpath()
-            gc.DrawPath(path)
+        self._path_cache[key] = path
+        return path
+
+    def _get_bitmap(self, state, w, h, parent_bg):
+        """Return the pre-rendered bitmap for a state, drawing it on first use."""
+        key = (state, w, h, parent_bg.GetRGB())
+        bmp = self._cache.get(key)
+        if bmp is not None:
+            return bmp
+        
+        bmp = wx.Bitmap(w, h, 32)
+        mdc = wx.MemoryDC(bmp)
+        gc = wx.GraphicsContext.Create(mdc)
         
-        # Draw text with icon
+        # Parent background only shows through the rounded corner cut-outs;
+        # the face covers the rest, so fill just those squares
+        gc.SetPen(wx.TRANSPARENT_PEN)
+        corner = min(self.corner_radius, h // 3)
+        if corner > 0:
+            gc.SetBrush(self._parent_bg_brush)
+            for flag, x, y in ((self.CORNER_TL, 0, 0),
+                               (self.CORNER_TR, w - corner, 0),
+                               (self.CORNER_BL, 0, h - corner),
+                               (self.CORNER_BR, w - corner, h - corner)):
+                if self.corner_flags & flag:
+                    gc.DrawRectangle(x, y, corner, corner)
+        
+        # Button color based on state
+        bg = self._state_bg[state]
+        
+        # Draw button with selective corner rounding
+        gc.SetBrush(wx.Brush(bg))
+        gc.FillPath(self._face_path(gc, w, h))
+        
+        # Draw text with icon (extent is re-measured only when label/icon change)
         gc.SetFont(self.font, self.fg_color)
-        display_text = f"{self.icon}  {self.label}" if self.icon else self.label
-        text_w, text_h = gc.GetTextExtent(display_text)[:2]
+        if self._text_extent is None:
+            self._text_extent = gc.GetTextExtent(self._display_text)[:2]
+        text_w, text_h = self._text_extent
         
         x = (w - text_w) / 2
         y = (h - text_h) / 2
-        gc.DrawText(display_text, x, y)
+        gc.DrawText(self._display_text, x, y)
+        
+        del gc
+        mdc.SelectObject(wx.NullBitmap)
+        self._cache[key] = bmp
+        return bmp
+
+    def _on_paint(self, event):
+        dc = _paint_dc(self)
+        
+        w, h = self.GetSize()
+        if w <= 0 or h <= 0:
+            return
+        
+        state = 2 if self.is_pressed else 1 if self.is_hovered else 0
+        
+        parent_bg = self._get_parent_bg()
+        dc.DrawBitmap(self._get_bitmap(state, w, h, parent_bg), 0, 0, True)
     
     def _on_enter(self, event):
+        if self.is_hovered:
+            return
         self.is_hovered = True
-        self.Refresh()
+        _repaint(self)
     
     def _on_leave(self, event):
+        if not (self.is_hovered or self.is_pressed):
+            return
         self.is_hovered = False
         self.is_pressed = False
-        self.Refresh()
+        _repaint(self)
     
     def Bind_Click(self, callback):
         """Bind click callback."""
         self.callback = callback
     
+    def SetLabel(self, label):
+        """Update button label text."""
+        self.label = label
+        self.Refresh()
+    
     def SetColors(self, bg_color, fg_color):
-        """Update button colors."""
-        self.bg_color = hex_to_colour(bg_color) if isinstance(bg_color, str) else bg_color
-        self.fg_color = hex_to_colour(fg_color) if isinstance(fg_color, str) else fg_color
+        """Update button colors; repaints only if they actually changed."""
+        bg_color = hex_to_colour(bg_color) if isinstance(bg_color, str) else bg_color
+        fg_color = hex_to_colour(fg_color) if isinstance(fg_color, str) else fg_color
+        if bg_color == self.bg_color and fg_color == self.fg_color:
+            return
+        self.bg_color = bg_color
+        self.fg_color = fg_color
+        self._refresh_state_colors()
+        self._cache.clear()
         self.Refresh()
 
 
-class PlayPauseButton(wx.Panel):
+class PlayPauseButton(_ParentBackgroundMixin, wx.Panel):
     """
     Industry-standard Play/Stop timer button.
     Green (Play) / Red (Stop) toggle with clear visual states.
@@ -189,75 +343,109 @@ class PlayPauseButton(wx.Panel):
         self._hover = False
         
         # Colors - green/red for start/stop
-        self._color_play = "#4CAF50"
-        self._color_play_hover = "#66BB6A"
-        self._color_stop = "#F44336"
-        self._color_stop_hover = "#EF5350"
+        self._color_play = hex_to_colour("#4CAF50")
+        self._color_play_hover = hex_to_colour("#66BB6A")
+        self._color_stop = hex_to_colour("#F44336")
+        self._color_stop_hover = hex_to_colour("#EF5350")
+        
+        # Icon font and glyph extents never change, so measure them once
+        self._font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        mdc = wx.MemoryDC(wx.Bitmap(1, 1))
+        mdc.SetFont(self._font)
+        self._metrics = {icon: mdc.GetTextExtent(icon) for icon in ("▶", "■")}
+        mdc.SelectObject(wx.NullBitmap)
+        
+        self._cache = {}  # {(is_on, hover, w, h, parent_rgb): wx.Bitmap}
         
         self.SetMinSize(scaled_size)
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        if _IS_MSW:
+            self.SetDoubleBuffered(True)
         
         self.Bind(wx.EVT_PAINT, self._on_paint)
+        self.Bind(wx.EVT_SYS_COLOUR_CHANGED, self._on_sys_colour_changed)
+        self.Bind(wx.EVT_SIZE, self._on_size)
         self.Bind(wx.EVT_LEFT_DOWN, self._on_click)
         self.Bind(wx.EVT_ENTER_WINDOW, self._on_enter)
         self.Bind(wx.EVT_LEAVE_WINDOW, self._on_leave)
-        self.SetCursor(wx.Cursor(wx.CURSOR_HAND))
+        self.SetCursor(_hand_cursor())
+    
+    def _on_size(self, event):
+        self._cache.clear()
+        self.Refresh()
+        event.Skip()
     
     def _on_paint(self, event):
-        dc = wx.AutoBufferedPaintDC(self)
-        gc = wx.GraphicsContext.Create(dc)
-        if not gc:
-            return
+        dc = _paint_dc(self)
         
         w, h = self.GetSize()
         if w <= 0 or h <= 0:
             return
         
+        parent_bg = self._get_parent_bg()
+        key = (self._is_on, self._hover, w, h, parent_bg.GetRGB())
+        bmp = self._cache.get(key)
+        if bmp is None:
+            bmp = self._cache[key] = self._render_state(w, h)
+        dc.DrawBitmap(bmp, 0, 0, True)
+    
+    def _render_state(self, w, h):
+        """Draw the button for the current on/hover state into a new bitmap."""
+        bmp = wx.Bitmap(w, h, 32)
+        mdc = wx.MemoryDC(bmp)
+        gc = wx.GraphicsContext.Create(mdc)
+        
         # Clear with parent background
-        parent = self.GetParent()
-        parent_bg = parent.GetBackgroundColour() if parent else wx.WHITE
-        gc.SetBrush(wx.Brush(parent_bg))
+        gc.SetBrush(self._parent_bg_brush)
         gc.SetPen(wx.TRANSPARENT_PEN)
         gc.DrawRectangle(0, 0, w, h)
         
         # Color and icon based on state
         if self._is_on:
-            bg_color = hex_to_colour(self._color_stop_hover if self._hover else self._color_stop)
+            bg_color = self._color_stop_hover if self._hover else self._color_stop
             icon = "■"  # Stop
         else:
-            bg_color = hex_to_colour(self._color_play_hover if self._hover else self._color_play)
+            bg_color = self._color_play_hover if self._hover else self._color_play
             icon = "▶"  # Play
         
         # Draw rounded button
         corner_radius = min(h // 3, 8)
         gc.SetBrush(wx.Brush(bg_color))
-        gc.SetPen(wx.TRANSPARENT_PEN)
         gc.DrawRoundedRectangle(2, 2, w - 4, h - 4, corner_radius)
         
         # Draw icon centered
-        font = wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        gc.SetFont(font, wx.WHITE)
-        dc.SetFont(font)
-        text_w, text_h = dc.GetTextExtent(icon)
+        gc.SetFont(self._font, wx.WHITE)
+        text_w, text_h = self._metrics[icon]
         gc.DrawText(icon, (w - text_w) / 2, (h - text_h) / 2)
+        
+        del gc
+        mdc.SelectObject(wx.NullBitmap)
+        return bmp
     
     def _on_click(self, event):
         self._is_on = not self._is_on
-        self.Refresh()
+        _repaint(self)
         if self._callback:
             self._callback(self._is_on)
     
     def _on_enter(self, event):
+        if self._hover:
+            return
         self._hover = True
-        self.Refresh()
+        _repaint(self)
     
     def _on_leave(self, event):
+        if not self._hover:
+            return
         self._hover = False
-        self.Refresh()
+        _repaint(self)
     
     def SetValue(self, value):
-        """Set the on/off state."""
-        self._is_on = bool(value)
+        """Set the on/off state; repaints only on a real change."""
+        value = bool(value)
+        if value == self._is_on:
+            return
+        self._is_on = value
         self.Refresh()
     
     def GetValue(self):
@@ -274,11 +462,10 @@ class PlayPauseButton(wx.Panel):
     
     @is_on.setter
     def is_on(self, value):
-        self._is_on = bool(value)
-        self.Refresh()
+        self.SetValue(value)
 
 
-class ToggleSwitch(wx.Panel):
+class ToggleSwitch(_ParentBackgroundMixin, wx.Panel):
     """iOS-style toggle switch for settings."""
     
     def __init__(self, parent, size=(50, 26), is_on=False):
@@ -292,44 +479,87 @@ class ToggleSwitch(wx.Panel):
         self.track_color_off = hex_to_colour("#CCCCCC")
         self.knob_color = wx.WHITE
         
+        # Pre-rendered ON/OFF images, valid for _bmp_key = (w, h, parent_rgb)
+        self._bmp_on = self._bmp_off = None
+        self._bmp_key = None
+        self._geom = None  # (w, h, track_y, track_h, knob_on_x, knob_off_x, knob_y, knob_size)
+        
         self.SetMinSize(scaled_size)
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        if _IS_MSW:
+            self.SetDoubleBuffered(True)
         
         self.Bind(wx.EVT_PAINT, self._on_paint)
+        self.Bind(wx.EVT_SYS_COLOUR_CHANGED, self._on_sys_colour_changed)
+        self.Bind(wx.EVT_SIZE, self._on_size)
         self.Bind(wx.EVT_LEFT_DOWN, self._on_click)
-        self.SetCursor(wx.Cursor(wx.CURSOR_HAND))
+        self.SetCursor(_hand_cursor())
     
-    def _on_paint(self, event):
-        dc = wx.AutoBufferedPaintDC(self)
-        gc = wx.GraphicsContext.Create(dc)
-        
-        w, h = self.GetSize()
-        if w <= 0 or h <= 0:
-            return
+    def _geometry(self, w, h):
+        """Track/knob layout for a size, shared by the ON and OFF renders."""
+        geom = self._geom
+        if geom is None or geom[:2] != (w, h):
+            track_h = max(h - 4, 4)
+            track_y = (h - track_h) / 2
+            knob_size = max(track_h - 4, 2)
+            geom = self._geom = (w, h, track_y, track_h, w - knob_size - 4, 4,
+                                 track_y + 2, knob_size)
+        return geom
+    
+    def _render_state(self, on, w, h, parent_bg):
+        """Draw the switch in one state into a new bitmap."""
+        bmp = wx.Bitmap(w, h, 32)
+        mdc = wx.MemoryDC(bmp)
+        gc = wx.GraphicsContext.Create(mdc)
         
         # Clear with parent background
-        parent = self.GetParent()
-        parent_bg = parent.GetBackgroundColour() if parent else wx.WHITE
-        gc.SetBrush(wx.Brush(parent_bg))
+        gc.SetBrush(self._parent_bg_brush)
         gc.SetPen(wx.TRANSPARENT_PEN)
         gc.DrawRectangle(0, 0, w, h)
         
-        # Track dimensions
-        track_h = max(h - 4, 4)
-        track_y = (h - track_h) / 2
-        knob_size = max(track_h - 4, 2)
+        _, _, track_y, track_h, knob_on_x, knob_off_x, knob_y, knob_size = self._geometry(w, h)
         
         # Draw track
-        track_color = self.track_color_on if self.is_on else self.track_color_off
+        track_color = self.track_color_on if on else self.track_color_off
         gc.SetBrush(wx.Brush(track_color))
-        gc.SetPen(wx.TRANSPARENT_PEN)
         gc.DrawRoundedRectangle(0, track_y, w, track_h, track_h / 2)
         
         # Draw knob
-        knob_x = w - knob_size - 4 if self.is_on else 4
-        knob_y = track_y + 2
         gc.SetBrush(wx.Brush(self.knob_color))
-        gc.DrawEllipse(knob_x, knob_y, knob_size, knob_size)
+        gc.DrawEllipse(knob_on_x if on else knob_off_x, knob_y, knob_size, knob_size)
+        
+        del gc
+        mdc.SelectObject(wx.NullBitmap)
+        return bmp
+    
+    def _on_size(self, event):
+        self._bmp_on = self._bmp_off = None
+        self._geom = None
+        self.Refresh()
+        event.Skip()
+    
+    def _on_paint(self, event):
+        dc = _paint_dc(self)
+        
+        w, h = self.GetSize()
+        if w <= 0 or h <= 0:
+            return
+        
+        parent_bg = self._get_parent_bg()
+        key = (w, h, parent_bg.GetRGB())
+        if key != self._bmp_key:
+            self._bmp_on = self._bmp_off = None
+            self._bmp_key = key
+        
+        if self.is_on:
+            if self._bmp_on is None:
+                self._bmp_on = self._render_state(True, w, h, parent_bg)
+            bmp = self._bmp_on
+        else:
+            if self._bmp_off is None:
+                self._bmp_off = self._render_state(False, w, h, parent_bg)
+            bmp = self._bmp_off
+        dc.DrawBitmap(bmp, 0, 0, True)
     
     def _on_click(self, event):
         self.is_on = not self.is_on
@@ -338,6 +568,8 @@ class ToggleSwitch(wx.Panel):
             self.callback(self.is_on)
     
     def SetValue(self, value):
+        if value == self.is_on:
+            return
         self.is_on = value
         self.Refresh()
     
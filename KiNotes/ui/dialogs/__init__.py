@@ -6,8 +6,8 @@ Provides:
 - AboutDialog: About KiNotes information dialog
 - FabImportDialog: Fab info section selector
 """
-from .settings_dialog import show_settings_dialog
+from .settings_dialog import SettingsDialog, show_settings_dialog
 from .about_dialog import show_about_dialog
 from .fab_import_dialog import show_fab_import_dialog
 
-__all__ = ['show_settings_dialog', 'show_about_dialog', 'show_fab_import_dialog']
+__all__ = ['SettingsDialog', 'show_settings_dialog', 'show_about_dialog', 'show_fab_import_dialog']
@@ -13,7 +13,7 @@ Usage:
 """
 import wx
 
-from ..themes import hex_to_colour
+from ..themes import theme_colours
 from ..components import RoundedButton
 
 # Import version from single source
@@ -45,7 +45,8 @@ def show_about_dialog(parent, theme, open_url_callback):
     dlg = wx.Dialog(parent, title="About KiNotes", size=(800, 650),
                    style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
     dlg.SetMinSize((700, 500))
-    dlg.SetBackgroundColour(hex_to_colour(theme["bg_panel"]))
+    colours = theme_colours(theme)
+    dlg.SetBackgroundColour(colours["bg_panel"])
     debug_print(f"[KiNotes SIZE] AboutDialog created: size={dlg.GetSize()}, minSize={dlg.GetMinSize()}")
     
     main_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -53,7 +54,7 @@ def show_about_dialog(parent, theme, open_url_callback):
     # Scrolled content area
     scroll_win = wx.ScrolledWindow(dlg, style=wx.VSCROLL)
     scroll_win.SetScrollRate(0, 20)
-    scroll_win.SetBackgroundColour(hex_to_colour(theme["bg_panel"]))
+    scroll_win.SetBackgroundColour(colours["bg_panel"])
     
     content_sizer = wx.BoxSizer(wx.VERTICAL)
     content_sizer.AddSpacer(24)
@@ -70,12 +71,12 @@ def show_about_dialog(parent, theme, open_url_callback):
     title_box = wx.BoxSizer(wx.VERTICAL)
     title = wx.StaticText(scroll_win, label="KiNotes")
     title.SetFont(wx.Font(24, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-    title.SetForegroundColour(hex_to_colour(theme["text_primary"]))
+    title.SetForegroundColour(colours["text_primary"])
     title_box.Add(title, 0)
     
     version = wx.StaticText(scroll_win, label=f"Engineering Notes for KiCad • v{__version__}")
     version.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-    version.SetForegroundColour(hex_to_colour(theme["text_secondary"]))
+    version.SetForegroundColour(colours["text_secondary"])
     title_box.Add(version, 0, wx.TOP, 4)
     
     header_sizer.Add(title_box, 1)
@@ -92,7 +93,7 @@ def show_about_dialog(parent, theme, open_url_callback):
     # Story section header
     story_header = wx.StaticText(scroll_win, label="The Story Behind the Tool")
     story_header.SetFont(wx.Font(14, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-    story_header.SetForegroundColour(hex_to_colour(theme["text_primary"]))
+    story_header.SetForegroundColour(colours["text_primary"])
     content_sizer.Add(story_header, 0, wx.LEFT | wx.RIGHT, 32)
     
     content_sizer.AddSpacer(16)
@@ -118,7 +119,7 @@ Built for engineers who've learned that memory is unreliable, but good notes are
     
     story = wx.StaticText(scroll_win, label=story_text)
     story.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-    story.SetForegroundColour(hex_to_colour(theme["text_primary"]))
+    story.SetForegroundColour(colours["text_primary"])
     story.Wrap(700)  # Wrap text at 700px
     content_sizer.Add(story, 0, wx.LEFT | wx.RIGHT, 32)
     
@@ -135,21 +136,21 @@ Built for engineers who've learned that memory is unreliable, but good notes are
     
     website_link = wx.StaticText(scroll_win, label="🌐 pcbtools.xyz")
     website_link.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, underline=True))
-    website_link.SetForegroundColour(hex_to_colour(theme["accent_blue"]))
+    website_link.SetForegroundColour(colours["accent_blue"])
     website_link.SetCursor(wx.Cursor(wx.CURSOR_HAND))
     website_link.Bind(wx.EVT_LEFT_DOWN, lambda e: open_url_callback("https://pcbtools.xyz"))
     links_sizer.Add(website_link, 0, wx.RIGHT, 24)
     
     github_link = wx.StaticText(scroll_win, label="📦 GitHub")
     github_link.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, underline=True))
-    github_link.SetForegroundColour(hex_to_colour(theme["accent_blue"]))
+    github_link.SetForegroundColour(colours["accent_blue"])
     github_link.SetCursor(wx.Cursor(wx.CURSOR_HAND))
     github_link.Bind(wx.EVT_LEFT_DOWN, lambda e: open_url_callback("https://github.com/way2pramil/KiNotes"))
     links_sizer.Add(github_link, 0, wx.RIGHT, 24)
     
     donate_link = wx.StaticText(scroll_win, label="💝 Support Development")
     donate_link.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, underline=True))
-    donate_link.SetForegroundColour(hex_to_colour(theme["accent_blue"]))
+    donate_link.SetForegroundColour(colours["accent_blue"])
     donate_link.SetCursor(wx.Cursor(wx.CURSOR_HAND))
     donate_link.Bind(wx.EVT_LEFT_DOWN, lambda e: open_url_callback("https://pcbtools.xyz/donate"))
     links_sizer.Add(donate_link, 0)
@@ -161,7 +162,7 @@ Built for engineers who've learned that memory is unreliable, but good notes are
     # Copyright
     copyright_text = wx.StaticText(scroll_win, label="© 2024-2025 PCBtools.xyz • Open Source (Apache 2.0)")
     copyright_text.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-    copyright_text.SetForegroundColour(hex_to_colour(theme["text_secondary"]))
+    copyright_text.SetForegroundColour(colours["text_secondary"])
     content_sizer.Add(copyright_text, 0, wx.LEFT | wx.RIGHT, 32)
     
     content_sizer.AddSpacer(24)
@@ -173,7 +174,7 @@ Built for engineers who've learned that memory is unreliable, but good notes are
     
     # Close button panel - fixed at bottom
     btn_panel = wx.Panel(dlg)
-    btn_panel.SetBackgroundColour(hex_to_colour(theme["bg_panel"]))
+    btn_panel.SetBackgroundColour(colours["bg_panel"])
     btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
     btn_sizer.AddStretchSpacer()
     
@@ -26,7 +26,7 @@ import wx.adv
 import wx.lib.scrolledpanel as scrolled
 
 from ..themes import (
-    hex_to_colour,
+    hex_to_colour, theme_colours,
     BACKGROUND_COLORS, TEXT_COLORS,
     DARK_BACKGROUND_COLORS, DARK_TEXT_COLORS,
     DARK_THEME, LIGHT_THEME
@@ -45,19 +45,61 @@ except ImportError:
     )
 
 
+def _choice_table(presets):
+    """Return (names in display order, {name: index}) for a colour preset dict."""
+    names = list(presets)
+    return names, {name: i for i, name in enumerate(names)}
+
+# Built once at import - the settings dialog is reopened on every theme tweak
+_BG_CHOICES, _BG_INDEX = _choice_table(BACKGROUND_COLORS)
+_TXT_CHOICES, _TXT_INDEX = _choice_table(TEXT_COLORS)
+_DARK_BG_CHOICES, _DARK_BG_INDEX = _choice_table(DARK_BACKGROUND_COLORS)
+_DARK_TXT_CHOICES, _DARK_TXT_INDEX = _choice_table(DARK_TEXT_COLORS)
+
+
 # ------------------------------ Helpers ---------------------------------
 
+# Shared fonts keyed on (size, weight, style) - see _font()
+_FONTS = {}
+
+
+def _font(size, weight=wx.FONTWEIGHT_NORMAL, style=wx.FONTSTYLE_NORMAL):
+    """Return a shared wx.Font, creating it on first use. Never modify it."""
+    key = (size, weight, style)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = wx.Font(size, wx.FONTFAMILY_DEFAULT, style, weight)
+    return font
+
+
+def _current_settings(config):
+    """Saved settings passed in by the panel, else read via notes_manager."""
+    settings = config.get('settings')
+    if settings is None:
+        notes_manager = config.get('notes_manager')
+        settings = notes_manager.load_settings() if notes_manager else {}
+    return settings or {}
+
+
 def set_label_style(ctrl, theme, bold=False, size=10):
     """Apply consistent label styling."""
     weight = wx.FONTWEIGHT_BOLD if bold else wx.FONTWEIGHT_NORMAL
-    font = wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, weight)
-    ctrl.SetFont(font)
+    ctrl.SetFont(_font(size, weight))
     ctrl.SetForegroundColour(hex_to_colour(theme.get('text_primary', '#000000')))
 
 
 def apply_theme_recursive(widget, theme):
     """Apply theme colours recursively to widget and its children."""
-    bg = hex_to_colour(theme.get('bg_panel', '#FFFFFF'))
+    _apply_theme_colours(
+        widget,
+        hex_to_colour(theme.get('bg_panel', '#FFFFFF')),
+        hex_to_colour(theme.get('bg_editor', '#FFFFFF')),
+        hex_to_colour(theme.get('text_primary', '#000000')),
+    )
+
+
+def _apply_theme_colours(widget, bg, bg_editor, tp):
+    """Walk for apply_theme_recursive with the colours resolved once."""
     if bg.IsOk():
         try:
             widget.SetBackgroundColour(bg)
@@ -67,27 +109,23 @@ def apply_theme_recursive(widget, theme):
     for child in widget.GetChildren():
         # Static text
         if isinstance(child, wx.StaticText):
-            tp = hex_to_colour(theme.get('text_primary', '#000000'))
             if tp.IsOk():
                 child.SetForegroundColour(tp)
         # Text controls
         if isinstance(child, (wx.TextCtrl, wx.SpinCtrl)):
-            bg_editor = hex_to_colour(theme.get('bg_editor', '#FFFFFF'))
             if bg_editor.IsOk():
                 try:
                     child.SetBackgroundColour(bg_editor)
                 except Exception:
                     pass
-            tp = hex_to_colour(theme.get('text_primary', '#000000'))
             if tp.IsOk():
                 child.SetForegroundColour(tp)
         # Choice, Radio, Checkbox
         if isinstance(child, (wx.Choice, wx.RadioButton, wx.CheckBox)):
-            tp = hex_to_colour(theme.get('text_primary', '#000000'))
             if tp.IsOk():
                 child.SetForegroundColour(tp)
         # Recurse
-        apply_theme_recursive(child, theme)
+        _apply_theme_colours(child, bg, bg_editor, tp)
 
 
 # Layout constants
@@ -136,9 +174,11 @@ class SettingsDialog(wx.Dialog):
                 - visual_editor_available: bool
                 - beta_markdown, beta_bom, beta_version_log: bool
                 - notes_manager: NotesManager instance
+                - settings: Saved settings dict (optional, read via notes_manager if absent)
         """
         self._config = config
         self._theme = config['theme']
+        self._colours = theme_colours(self._theme)
         
         super().__init__(parent, title="Settings",
                         style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
@@ -171,17 +211,22 @@ class SettingsDialog(wx.Dialog):
         self.CentreOnScreen()
         debug_print(f"[KiNotes SIZE] SettingsDialog final size: {self.GetSize()}, pos: {self.GetPosition()}")
         
-        self.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        self.SetBackgroundColour(self._colours["bg_panel"])
         
         # Track selected theme state
         self._selected_theme_dark = config['dark_mode']
         self._save_mode = 'local'
         self._result = None
         
-        self._build_ui()
-        
-        # Apply theme to all children
-        apply_theme_recursive(self, self._theme)
+        # Build and theme all sections with a single repaint
+        self.Freeze()
+        try:
+            self._build_ui()
+            
+            # Apply theme to all children
+            apply_theme_recursive(self, self._theme)
+        finally:
+            self.Thaw()
     
     def _build_ui(self):
         """Build the dialog UI with ScrolledPanel for robust scrolling."""
@@ -190,7 +235,7 @@ class SettingsDialog(wx.Dialog):
         # ScrolledPanel for robust cross-platform scrolling
         self._scroll_panel = scrolled.ScrolledPanel(self, style=wx.VSCROLL)
         self._scroll_panel.SetupScrolling(scroll_x=False, scroll_y=True, scrollToTop=True)
-        self._scroll_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        self._scroll_panel.SetBackgroundColour(self._colours["bg_panel"])
         
         # Content sizer inside scroll panel
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -242,7 +287,7 @@ class SettingsDialog(wx.Dialog):
         
         # Dark Mode Toggle Section
         mode_panel = wx.Panel(parent)
-        mode_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        mode_panel.SetBackgroundColour(self._colours["bg_panel"])
         mode_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
         # Light button
@@ -275,8 +320,10 @@ class SettingsDialog(wx.Dialog):
         
         # Colors panel
         self._colors_panel = wx.Panel(parent)
-        self._colors_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
-        self._rebuild_color_options(self._colors_panel, is_dark)
+        self._colors_panel.SetBackgroundColour(self._colours["bg_panel"])
+        self._colors_panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self._color_options = {}  # is_dark -> (panel, bg_choice, txt_choice)
+        self._show_color_options(is_dark)
         sizer.Add(self._colors_panel, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 0)
         
         sizer.AddSpacer(SECTION_SPACING)
@@ -290,7 +337,7 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(time_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         time_track_panel = wx.Panel(parent)
-        time_track_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        time_track_panel.SetBackgroundColour(self._colours["bg_panel"])
         time_track_sizer = wx.BoxSizer(wx.VERTICAL)
         
         tracker = self._config.get('time_tracker')
@@ -300,15 +347,15 @@ class SettingsDialog(wx.Dialog):
         
         self._enable_time_tracking = wx.CheckBox(time_track_panel, label="  Enable Time Tracking")
         self._enable_time_tracking.SetValue(tracker.enable_time_tracking if tracker else True)
-        self._enable_time_tracking.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._enable_time_tracking.SetForegroundColour(self._colours["text_primary"])
         row1_sizer.Add(self._enable_time_tracking, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 30)
         
         self._time_24h = wx.RadioButton(time_track_panel, label="24h", style=wx.RB_GROUP)
         self._time_12h = wx.RadioButton(time_track_panel, label="12h")
         self._time_24h.SetValue(tracker.time_format_24h if tracker else True)
         self._time_12h.SetValue(not (tracker.time_format_24h if tracker else True))
-        self._time_24h.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self._time_12h.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._time_24h.SetForegroundColour(self._colours["text_primary"])
+        self._time_12h.SetForegroundColour(self._colours["text_primary"])
         row1_sizer.Add(self._time_24h, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
         row1_sizer.Add(self._time_12h, 0, wx.ALIGN_CENTER_VERTICAL)
         
@@ -317,7 +364,7 @@ class SettingsDialog(wx.Dialog):
         # Show work diary button
         self._show_work_diary = wx.CheckBox(time_track_panel, label="  Show Work Diary Button")
         self._show_work_diary.SetValue(tracker.show_work_diary_button if tracker else True)
-        self._show_work_diary.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._show_work_diary.SetForegroundColour(self._colours["text_primary"])
         time_track_sizer.Add(self._show_work_diary, 0, wx.LEFT | wx.BOTTOM, 8)
         
         time_track_panel.SetSizer(time_track_sizer)
@@ -336,47 +383,47 @@ class SettingsDialog(wx.Dialog):
         # Section guideline
         guideline = wx.StaticText(parent, 
             label="Click on component designators or net names in your notes to instantly highlight them on the PCB.")
-        guideline.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        guideline.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+        guideline.SetForegroundColour(self._colours["text_secondary"])
+        guideline.SetFont(_font(9, style=wx.FONTSTYLE_ITALIC))
         sizer.Add(guideline, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         crossprobe_panel = wx.Panel(parent)
-        crossprobe_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        crossprobe_panel.SetBackgroundColour(self._colours["bg_panel"])
         crossprobe_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Enable Net Cross-Probe (first)
         self._enable_net_crossprobe = wx.CheckBox(crossprobe_panel, label="  Enable Net Cross-Probe")
         self._enable_net_crossprobe.SetValue(self._config.get('net_crossprobe_enabled', True))
-        self._enable_net_crossprobe.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._enable_net_crossprobe.SetForegroundColour(self._colours["text_primary"])
         crossprobe_sizer.Add(self._enable_net_crossprobe, 0, wx.TOP | wx.BOTTOM, 6)
         
         net_desc = wx.StaticText(crossprobe_panel, 
             label="Click on net names (GND, VCC) to highlight pads, tracks & zones.")
-        net_desc.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        net_desc.SetForegroundColour(self._colours["text_secondary"])
         crossprobe_sizer.Add(net_desc, 0, wx.LEFT | wx.BOTTOM, 24)
         
         # Enable Designator Cross-Probe (second)
         self._enable_crossprobe = wx.CheckBox(crossprobe_panel, label="  Enable Designator Cross-Probe")
         self._enable_crossprobe.SetValue(self._config.get('crossprobe_enabled', True))
-        self._enable_crossprobe.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._enable_crossprobe.SetForegroundColour(self._colours["text_primary"])
         crossprobe_sizer.Add(self._enable_crossprobe, 0, wx.BOTTOM, 6)
         
         crossprobe_desc = wx.StaticText(crossprobe_panel, 
             label="Click on designators (R1, C5, U3) to highlight component on PCB.")
-        crossprobe_desc.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        crossprobe_desc.SetForegroundColour(self._colours["text_secondary"])
         crossprobe_sizer.Add(crossprobe_desc, 0, wx.LEFT | wx.BOTTOM, 24)
         
         # Custom designator prefixes input
         custom_row = wx.BoxSizer(wx.HORIZONTAL)
         custom_label = wx.StaticText(crossprobe_panel, label="Custom Prefixes:")
-        custom_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        custom_label.SetForegroundColour(self._colours["text_primary"])
         custom_row.Add(custom_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
         
         self._custom_designators = wx.TextCtrl(crossprobe_panel, size=(200, -1))
         self._custom_designators.SetValue(self._config.get('custom_designators', ''))
         self._custom_designators.SetHint("MOV, PC, NTC, PTC")
-        self._custom_designators.SetBackgroundColour(hex_to_colour(self._theme["bg_editor"]))
-        self._custom_designators.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._custom_designators.SetBackgroundColour(self._colours["bg_editor"])
+        self._custom_designators.SetForegroundColour(self._colours["text_primary"])
         custom_row.Add(self._custom_designators, 0)
         
         crossprobe_sizer.Add(custom_row, 0, wx.BOTTOM, 6)
@@ -384,8 +431,8 @@ class SettingsDialog(wx.Dialog):
         # Custom prefixes guideline
         custom_hint = wx.StaticText(crossprobe_panel, 
             label="Add non-standard prefixes (comma-separated). Built-in: R, C, L, D, U, Q, J, P, K, SW, LED, IC, TP, FB...")
-        custom_hint.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        custom_hint.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+        custom_hint.SetForegroundColour(self._colours["text_secondary"])
+        custom_hint.SetFont(_font(8, style=wx.FONTSTYLE_ITALIC))
         crossprobe_sizer.Add(custom_hint, 0, wx.LEFT | wx.BOTTOM, 4)
         
         crossprobe_panel.SetSizer(crossprobe_sizer)
@@ -402,14 +449,14 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(scale_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         scale_panel = wx.Panel(parent)
-        scale_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        scale_panel.SetBackgroundColour(self._colours["bg_panel"])
         scale_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Auto checkbox
         self._scale_auto_checkbox = wx.CheckBox(scale_panel, label="  Auto (Use System DPI)")
         current_scale = get_user_scale_factor()
         self._scale_auto_checkbox.SetValue(current_scale is None)
-        self._scale_auto_checkbox.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._scale_auto_checkbox.SetForegroundColour(self._colours["text_primary"])
         self._scale_auto_checkbox.Bind(wx.EVT_CHECKBOX, self._on_scale_auto_toggle)
         scale_sizer.Add(self._scale_auto_checkbox, 0, wx.ALL, 10)
         
@@ -417,7 +464,7 @@ class SettingsDialog(wx.Dialog):
         slider_row = wx.BoxSizer(wx.HORIZONTAL)
         
         min_label = wx.StaticText(scale_panel, label="100%")
-        min_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        min_label.SetForegroundColour(self._colours["text_secondary"])
         slider_row.Add(min_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         self._scale_slider = wx.Slider(scale_panel, value=100, minValue=100, maxValue=200, style=wx.SL_HORIZONTAL)
@@ -432,7 +479,7 @@ class SettingsDialog(wx.Dialog):
         slider_row.Add(self._scale_slider, 1, wx.EXPAND)
         
         max_label = wx.StaticText(scale_panel, label="200%")
-        max_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        max_label.SetForegroundColour(self._colours["text_secondary"])
         slider_row.Add(max_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 8)
         
         scale_sizer.Add(slider_row, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 10)
@@ -440,12 +487,12 @@ class SettingsDialog(wx.Dialog):
         # Current value
         current_factor = get_dpi_scale_factor(self)
         self._scale_value_label = wx.StaticText(scale_panel, label=f"Current: {int(current_factor * 100)}%")
-        self._scale_value_label.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-        self._scale_value_label.SetForegroundColour(hex_to_colour(self._theme["accent_blue"]))
+        self._scale_value_label.SetFont(_font(11, wx.FONTWEIGHT_BOLD))
+        self._scale_value_label.SetForegroundColour(self._colours["accent_blue"])
         scale_sizer.Add(self._scale_value_label, 0, wx.ALIGN_CENTER | wx.TOP, 8)
         
         scale_hint = wx.StaticText(scale_panel, label="Restart KiNotes for changes to take effect")
-        scale_hint.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        scale_hint.SetForegroundColour(self._colours["text_secondary"])
         scale_sizer.Add(scale_hint, 0, wx.ALIGN_CENTER | wx.TOP | wx.BOTTOM, 10)
         
         scale_panel.SetSizer(scale_sizer)
@@ -460,54 +507,53 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(panel_size_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         panel_size_panel = wx.Panel(parent)
-        panel_size_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        panel_size_panel.SetBackgroundColour(self._colours["bg_panel"])
         panel_size_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Get current settings (use centralized defaults)
-        notes_manager = self._config.get('notes_manager')
-        current_settings = notes_manager.load_settings() if notes_manager else {}
+        current_settings = _current_settings(self._config)
         current_width = current_settings.get("panel_width", WINDOW_DEFAULTS['panel_width'])
         current_height = current_settings.get("panel_height", WINDOW_DEFAULTS['panel_height'])
         
         size_row = wx.BoxSizer(wx.HORIZONTAL)
         
         width_label = wx.StaticText(panel_size_panel, label="Width:")
-        width_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        width_label.SetForegroundColour(self._colours["text_primary"])
         size_row.Add(width_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         self._panel_width_spin = wx.SpinCtrl(panel_size_panel, min=800, max=2000, initial=max(800, current_width))
         block_scroll_wheel(self._panel_width_spin)  # Prevent accidental value changes while scrolling
-        self._panel_width_spin.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self._panel_width_spin.SetBackgroundColour(hex_to_colour(self._theme["bg_editor"]))
+        self._panel_width_spin.SetForegroundColour(self._colours["text_primary"])
+        self._panel_width_spin.SetBackgroundColour(self._colours["bg_editor"])
         size_row.Add(self._panel_width_spin, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
         
         width_px_label = wx.StaticText(panel_size_panel, label="px")
-        width_px_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        width_px_label.SetForegroundColour(self._colours["text_secondary"])
         size_row.Add(width_px_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 20)
         
         sep_label = wx.StaticText(panel_size_panel, label="|")
-        sep_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        sep_label.SetForegroundColour(self._colours["text_secondary"])
         size_row.Add(sep_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 20)
         
         height_label = wx.StaticText(panel_size_panel, label="Height:")
-        height_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        height_label.SetForegroundColour(self._colours["text_primary"])
         size_row.Add(height_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         self._panel_height_spin = wx.SpinCtrl(panel_size_panel, min=600, max=2000, initial=max(600, current_height))
         block_scroll_wheel(self._panel_height_spin)  # Prevent accidental value changes while scrolling
-        self._panel_height_spin.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self._panel_height_spin.SetBackgroundColour(hex_to_colour(self._theme["bg_editor"]))
+        self._panel_height_spin.SetForegroundColour(self._colours["text_primary"])
+        self._panel_height_spin.SetBackgroundColour(self._colours["bg_editor"])
         size_row.Add(self._panel_height_spin, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
         
         height_px_label = wx.StaticText(panel_size_panel, label="px")
-        height_px_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        height_px_label.SetForegroundColour(self._colours["text_secondary"])
         size_row.Add(height_px_label, 0, wx.ALIGN_CENTER_VERTICAL)
         
         panel_size_sizer.Add(size_row, 0, wx.ALL, 10)
         
         panel_size_hint = wx.StaticText(panel_size_panel, 
             label="Restart KiNotes for size changes to take effect (Min: 800×600)")
-        panel_size_hint.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        panel_size_hint.SetForegroundColour(self._colours["text_secondary"])
         panel_size_sizer.Add(panel_size_hint, 0, wx.LEFT | wx.BOTTOM, 10)
         
         panel_size_panel.SetSizer(panel_size_sizer)
@@ -527,12 +573,11 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(perf_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         perf_panel = wx.Panel(parent)
-        perf_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        perf_panel.SetBackgroundColour(self._colours["bg_panel"])
         perf_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Get current settings
-        notes_manager = self._config.get('notes_manager')
-        current_settings = notes_manager.load_settings() if notes_manager else {}
+        current_settings = _current_settings(self._config)
         current_interval_ms = current_settings.get('timer_interval_ms', PERFORMANCE_DEFAULTS['timer_interval_ms'])
         current_interval_sec = current_interval_ms // 1000  # Convert to seconds for UI
         
@@ -540,7 +585,7 @@ class SettingsDialog(wx.Dialog):
         timer_row = wx.BoxSizer(wx.HORIZONTAL)
         
         timer_label = wx.StaticText(perf_panel, label="Auto-save interval:")
-        timer_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        timer_label.SetForegroundColour(self._colours["text_primary"])
         timer_row.Add(timer_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         # SpinCtrl for interval (3-60 seconds)
@@ -549,19 +594,19 @@ class SettingsDialog(wx.Dialog):
         self._timer_interval_spin = wx.SpinCtrl(perf_panel, min=min_sec, max=max_sec, 
                                                  initial=max(min_sec, min(current_interval_sec, max_sec)))
         block_scroll_wheel(self._timer_interval_spin)  # Prevent accidental value changes while scrolling
-        self._timer_interval_spin.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self._timer_interval_spin.SetBackgroundColour(hex_to_colour(self._theme["bg_editor"]))
+        self._timer_interval_spin.SetForegroundColour(self._colours["text_primary"])
+        self._timer_interval_spin.SetBackgroundColour(self._colours["bg_editor"])
         timer_row.Add(self._timer_interval_spin, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 4)
         
         sec_label = wx.StaticText(perf_panel, label="seconds")
-        sec_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        sec_label.SetForegroundColour(self._colours["text_secondary"])
         timer_row.Add(sec_label, 0, wx.ALIGN_CENTER_VERTICAL)
         
         perf_sizer.Add(timer_row, 0, wx.ALL, 10)
         
         perf_hint = wx.StaticText(perf_panel, 
             label="Higher values = better performance, lower = faster saves (Min: 3s)")
-        perf_hint.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+        perf_hint.SetForegroundColour(self._colours["text_secondary"])
         perf_sizer.Add(perf_hint, 0, wx.LEFT | wx.BOTTOM, 10)
         
         perf_panel.SetSizer(perf_sizer)
@@ -578,7 +623,7 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(pdf_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         pdf_panel = wx.Panel(parent)
-        pdf_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        pdf_panel.SetBackgroundColour(self._colours["bg_panel"])
         pdf_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Get current setting from config (passed from main_panel)
@@ -588,12 +633,12 @@ class SettingsDialog(wx.Dialog):
         # Radio buttons for PDF format
         self._pdf_markdown_radio = wx.RadioButton(pdf_panel, label="  📝 Markdown (Plain text, lightweight)", style=wx.RB_GROUP)
         self._pdf_markdown_radio.SetValue(not is_visual)
-        self._pdf_markdown_radio.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._pdf_markdown_radio.SetForegroundColour(self._colours["text_primary"])
         pdf_sizer.Add(self._pdf_markdown_radio, 0, wx.ALL, 8)
         
         self._pdf_visual_radio = wx.RadioButton(pdf_panel, label="  🎨 Formatted (Preserves bold, italic, lists)")
         self._pdf_visual_radio.SetValue(is_visual)
-        self._pdf_visual_radio.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._pdf_visual_radio.SetForegroundColour(self._colours["text_primary"])
         pdf_sizer.Add(self._pdf_visual_radio, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 8)
         
         # Requirement note with help link
@@ -601,7 +646,7 @@ class SettingsDialog(wx.Dialog):
         req_note = wx.StaticText(pdf_panel, 
             label="       ℹ️ Formatted export requires 'reportlab'. Install: pip install reportlab")
         req_note.SetForegroundColour(hex_to_colour(self._theme.get("text_secondary", "#888888")))
-        req_note.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+        req_note.SetFont(_font(9, style=wx.FONTSTYLE_ITALIC))
         req_row.Add(req_note, 0, wx.ALIGN_CENTER_VERTICAL)
         
         help_link = wx.adv.HyperlinkCtrl(pdf_panel, label="  ❓ Help", url="https://pcbtools.xyz/tools/kinotes#requirements")
@@ -625,35 +670,35 @@ class SettingsDialog(wx.Dialog):
         sizer.Add(beta_header, 0, wx.LEFT | wx.BOTTOM, SECTION_MARGIN)
         
         beta_panel = wx.Panel(parent)
-        beta_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        beta_panel.SetBackgroundColour(self._colours["bg_panel"])
         beta_sizer = wx.BoxSizer(wx.VERTICAL)
         
         self._beta_markdown_cb = wx.CheckBox(beta_panel, label="  📝 Markdown Editor Mode")
         self._beta_markdown_cb.SetValue(self._config.get('beta_markdown', False))
-        self._beta_markdown_cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._beta_markdown_cb.SetForegroundColour(self._colours["text_primary"])
         beta_sizer.Add(self._beta_markdown_cb, 0, wx.ALL, 8)
         
         self._beta_bom_cb = wx.CheckBox(beta_panel, label="  📋 BOM Tab (Bill of Materials)")
         self._beta_bom_cb.SetValue(self._config.get('beta_bom', False))
-        self._beta_bom_cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._beta_bom_cb.SetForegroundColour(self._colours["text_primary"])
         beta_sizer.Add(self._beta_bom_cb, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 8)
         
         self._beta_version_log_cb = wx.CheckBox(beta_panel, label="  📜 Changelog Tab (Version Log)")
         self._beta_version_log_cb.SetValue(self._config.get('beta_version_log', False))
-        self._beta_version_log_cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._beta_version_log_cb.SetForegroundColour(self._colours["text_primary"])
         beta_sizer.Add(self._beta_version_log_cb, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 8)
         
         # Hidden checkbox for backward compat - always enabled now
         self._beta_net_linker_cb = wx.CheckBox(beta_panel, label="")
         self._beta_net_linker_cb.SetValue(True)  # Always on since it's now a main feature
         self._beta_net_linker_cb.Hide()  # Hidden from UI
-        self._beta_net_linker_cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._beta_net_linker_cb.SetForegroundColour(self._colours["text_primary"])
         beta_sizer.Add(self._beta_net_linker_cb, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 8)
 
         # Debug panel activation
         self._beta_debug_panel_cb = wx.CheckBox(beta_panel, label="  🪛 Debug Panel (Event Log, Beta)")
         self._beta_debug_panel_cb.SetValue(self._config.get('beta_debug_panel', False))
-        self._beta_debug_panel_cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self._beta_debug_panel_cb.SetForegroundColour(self._colours["text_primary"])
         beta_sizer.Add(self._beta_debug_panel_cb, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 8)
         
         # Module checkboxes are now in the main debug panel itself
@@ -662,7 +707,7 @@ class SettingsDialog(wx.Dialog):
         beta_warning = wx.StaticText(beta_panel, 
             label="⚠ Experimental features may be unstable. Save project before activation. Restart required after changes.")
         beta_warning.SetForegroundColour(wx.Colour(220, 53, 69))  # Bootstrap danger red
-        beta_warning.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        beta_warning.SetFont(_font(9, wx.FONTWEIGHT_BOLD))
         beta_sizer.Add(beta_warning, 0, wx.ALL, 10)
         
         beta_panel.SetSizer(beta_sizer)
@@ -680,7 +725,7 @@ class SettingsDialog(wx.Dialog):
         dialog_sizer.Add(separator, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 10)
         
         btn_panel = wx.Panel(self)
-        btn_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        btn_panel.SetBackgroundColour(self._colours["bg_panel"])
         
         # Fixed height for button area - ensures it's always visible
         btn_height = 70  # Generous space for buttons + padding
@@ -710,7 +755,7 @@ class SettingsDialog(wx.Dialog):
         
         # Modern split button: "Save" + dropdown arrow
         split_panel = wx.Panel(btn_panel)
-        split_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        split_panel.SetBackgroundColour(self._colours["bg_panel"])
         split_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
         # Main Save button (saves locally by default)
@@ -787,7 +832,7 @@ class SettingsDialog(wx.Dialog):
         
         # Reset theme
         self._selected_theme_dark = DEFAULTS['dark_mode']
-        self._on_theme_select(self._selected_theme_dark)
+        self._on_theme_select(self._selected_theme_dark, force=True)
         
         # Reset time tracking
         self._enable_time_tracking.SetValue(TIME_TRACKER_DEFAULTS['enable_time_tracking'])
@@ -830,6 +875,64 @@ class SettingsDialog(wx.Dialog):
             wx.OK | wx.ICON_INFORMATION
         )
     
+    def reset(self, config):
+        """Re-load control values from config so a cached dialog can be shown again.
+
+        Only values are touched - the widget tree built in _build_ui() is kept.
+        """
+        self._config = config
+        self._save_mode = 'local'
+        self._result = None
+
+        # Theme buttons + colour choices (choices read self._config)
+        self._selected_theme_dark = config['dark_mode']
+        self._on_theme_select(self._selected_theme_dark, force=True)
+
+        # Time tracking
+        tracker = config.get('time_tracker')
+        self._enable_time_tracking.SetValue(tracker.enable_time_tracking if tracker else True)
+        fmt_24h = tracker.time_format_24h if tracker else True
+        self._time_24h.SetValue(fmt_24h)
+        self._time_12h.SetValue(not fmt_24h)
+        self._show_work_diary.SetValue(tracker.show_work_diary_button if tracker else True)
+
+        # Cross-probe
+        self._enable_net_crossprobe.SetValue(config.get('net_crossprobe_enabled', True))
+        self._enable_crossprobe.SetValue(config.get('crossprobe_enabled', True))
+        self._custom_designators.SetValue(config.get('custom_designators', ''))
+
+        # UI scale
+        current_scale = get_user_scale_factor()
+        self._scale_auto_checkbox.SetValue(current_scale is None)
+        if current_scale is not None:
+            self._scale_slider.SetValue(int(current_scale * 100))
+        else:
+            self._scale_slider.SetValue(int(get_dpi_scale_factor(self) * 100))
+        self._scale_slider.Enable(current_scale is not None)
+        self._scale_value_label.SetLabel(f"Current: {int(get_dpi_scale_factor(self) * 100)}%")
+
+        # Panel size + timer interval
+        current_settings = _current_settings(config)
+        self._panel_width_spin.SetValue(max(800, current_settings.get("panel_width", WINDOW_DEFAULTS['panel_width'])))
+        self._panel_height_spin.SetValue(max(600, current_settings.get("panel_height", WINDOW_DEFAULTS['panel_height'])))
+        interval_sec = current_settings.get('timer_interval_ms', PERFORMANCE_DEFAULTS['timer_interval_ms']) // 1000
+        min_sec = PERFORMANCE_DEFAULTS['timer_min_ms'] // 1000
+        max_sec = PERFORMANCE_DEFAULTS['timer_max_ms'] // 1000
+        self._timer_interval_spin.SetValue(max(min_sec, min(interval_sec, max_sec)))
+
+        # PDF format
+        is_visual = config.get('pdf_format', 'markdown') == 'visual'
+        self._pdf_markdown_radio.SetValue(not is_visual)
+        self._pdf_visual_radio.SetValue(is_visual)
+
+        # Beta features
+        self._beta_markdown_cb.SetValue(config.get('beta_markdown', False))
+        self._beta_bom_cb.SetValue(config.get('beta_bom', False))
+        self._beta_version_log_cb.SetValue(config.get('beta_version_log', False))
+        self._beta_debug_panel_cb.SetValue(config.get('beta_debug_panel', False))
+
+        self._scroll_panel.Scroll(0, 0)
+
     def get_save_mode(self) -> str:
         """Return the save mode: 'local' or 'global'."""
         return getattr(self, '_save_mode', 'local')
@@ -839,8 +942,14 @@ class SettingsDialog(wx.Dialog):
         sep = wx.StaticLine(parent)
         sizer.Add(sep, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, SECTION_MARGIN)
     
-    def _on_theme_select(self, is_dark):
-        """Handle theme button selection."""
+    def _on_theme_select(self, is_dark, force=False):
+        """Handle theme button selection.
+        
+        Clicking the already selected theme is a no-op; reset paths pass
+        force=True because the colour presets may have changed underneath.
+        """
+        if not force and is_dark == self._selected_theme_dark:
+            return
         self._selected_theme_dark = is_dark
         
         if is_dark:
@@ -850,14 +959,44 @@ class SettingsDialog(wx.Dialog):
             self._light_btn.SetColors(self._theme["accent_blue"], "#FFFFFF")
             self._dark_btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
         
-        self._rebuild_color_options(self._colors_panel, is_dark)
-        self.Layout()
+        # Swap the colour pickers and relayout in a single repaint
+        self.Freeze()
+        try:
+            self._show_color_options(is_dark)
+            self.Layout()
+        finally:
+            self.Thaw()
     
-    def _rebuild_color_options(self, panel, is_dark):
-        """Rebuild color options based on theme."""
-        for child in panel.GetChildren():
-            child.Destroy()
+    def _show_color_options(self, is_dark):
+        """Show the colour pickers for a theme, building them on first use.
         
+        Each theme keeps its own sub-panel in self._colors_panel, so flipping
+        the theme only swaps which one is shown. Selections are re-read from
+        self._config every time, as they were when the pickers were rebuilt.
+        """
+        entry = self._color_options.get(is_dark)
+        if entry is None:
+            entry = self._build_color_options(self._colors_panel, is_dark)
+            self._color_options[is_dark] = entry
+            self._colors_panel.GetSizer().Add(entry[0], 0, wx.EXPAND)
+        for dark, (sub_panel, _bg, _txt) in self._color_options.items():
+            sub_panel.Show(dark == is_dark)
+        
+        _sub_panel, self._bg_choice, self._txt_choice = entry
+        if is_dark:
+            bg_index = _DARK_BG_INDEX.get(self._config.get('dark_bg_color_name', 'Charcoal'), 0)
+            txt_index = _DARK_TXT_INDEX.get(self._config.get('dark_text_color_name', 'Pure White'), 0)
+        else:
+            bg_index = _BG_INDEX.get(self._config.get('bg_color_name', 'Ivory Paper'), 0)
+            txt_index = _TXT_INDEX.get(self._config.get('text_color_name', 'Carbon Black'), 0)
+        self._bg_choice.SetSelection(bg_index)
+        self._txt_choice.SetSelection(txt_index)
+        self._colors_panel.Layout()
+    
+    def _build_color_options(self, parent, is_dark):
+        """Build one theme's colour pickers; returns (panel, bg_choice, txt_choice)."""
+        panel = wx.Panel(parent)
+        panel.SetBackgroundColour(self._colours["bg_panel"])
         panel_sizer = wx.BoxSizer(wx.VERTICAL)
         
         theme_name = "Dark" if is_dark else "Light"
@@ -869,50 +1008,28 @@ class SettingsDialog(wx.Dialog):
         color_row = wx.BoxSizer(wx.HORIZONTAL)
         
         bg_label = wx.StaticText(panel, label="Background:")
-        bg_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-        bg_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        bg_label.SetFont(_font(10))
+        bg_label.SetForegroundColour(self._colours["text_primary"])
         color_row.Add(bg_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
-        if is_dark:
-            dark_bg_choices = list(DARK_BACKGROUND_COLORS.keys())
-            self._bg_choice = wx.Choice(panel, choices=dark_bg_choices)
-            block_scroll_wheel(self._bg_choice)  # Prevent accidental value changes while scrolling
-            dark_bg_name = self._config.get('dark_bg_color_name', 'Charcoal')
-            self._bg_choice.SetSelection(dark_bg_choices.index(dark_bg_name) if dark_bg_name in dark_bg_choices else 0)
-        else:
-            bg_choices = list(BACKGROUND_COLORS.keys())
-            self._bg_choice = wx.Choice(panel, choices=bg_choices)
-            block_scroll_wheel(self._bg_choice)  # Prevent accidental value changes while scrolling
-            bg_name = self._config.get('bg_color_name', 'Ivory Paper')
-            self._bg_choice.SetSelection(bg_choices.index(bg_name) if bg_name in bg_choices else 0)
-        
-        self._bg_choice.SetMinSize((140, -1))
-        color_row.Add(self._bg_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 30)
+        bg_choice = wx.Choice(panel, choices=_DARK_BG_CHOICES if is_dark else _BG_CHOICES)
+        block_scroll_wheel(bg_choice)  # Prevent accidental value changes while scrolling
+        bg_choice.SetMinSize((140, -1))
+        color_row.Add(bg_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 30)
         
         txt_label = wx.StaticText(panel, label="Text:")
-        txt_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-        txt_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        txt_label.SetFont(_font(10))
+        txt_label.SetForegroundColour(self._colours["text_primary"])
         color_row.Add(txt_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
-        if is_dark:
-            dark_txt_choices = list(DARK_TEXT_COLORS.keys())
-            self._txt_choice = wx.Choice(panel, choices=dark_txt_choices)
-            block_scroll_wheel(self._txt_choice)  # Prevent accidental value changes while scrolling
-            dark_txt_name = self._config.get('dark_text_color_name', 'Pure White')
-            self._txt_choice.SetSelection(dark_txt_choices.index(dark_txt_name) if dark_txt_name in dark_txt_choices else 0)
-        else:
-            txt_choices = list(TEXT_COLORS.keys())
-            self._txt_choice = wx.Choice(panel, choices=txt_choices)
-            block_scroll_wheel(self._txt_choice)  # Prevent accidental value changes while scrolling
-            txt_name = self._config.get('text_color_name', 'Carbon Black')
-            self._txt_choice.SetSelection(txt_choices.index(txt_name) if txt_name in txt_choices else 0)
-        
-        self._txt_choice.SetMinSize((140, -1))
-        color_row.Add(self._txt_choice, 0, wx.ALIGN_CENTER_VERTICAL)
+        txt_choice = wx.Choice(panel, choices=_DARK_TXT_CHOICES if is_dark else _TXT_CHOICES)
+        block_scroll_wheel(txt_choice)  # Prevent accidental value changes while scrolling
+        txt_choice.SetMinSize((140, -1))
+        color_row.Add(txt_choice, 0, wx.ALIGN_CENTER_VERTICAL)
         
         panel_sizer.Add(color_row, 0, wx.LEFT | wx.RIGHT, SECTION_MARGIN)
         panel.SetSizer(panel_sizer)
-        panel.Layout()
+        return panel, bg_choice, txt_choice
     
     def _on_scale_auto_toggle(self, event):
         """Handle auto scale checkbox toggle."""
@@ -940,15 +1057,11 @@ class SettingsDialog(wx.Dialog):
             Dict with all settings values, or None if cancelled
         """
         if self._selected_theme_dark:
-            dark_bg_choices = list(DARK_BACKGROUND_COLORS.keys())
-            dark_txt_choices = list(DARK_TEXT_COLORS.keys())
-            bg_color_name = dark_bg_choices[self._bg_choice.GetSelection()]
-            text_color_name = dark_txt_choices[self._txt_choice.GetSelection()]
+            bg_color_name = _DARK_BG_CHOICES[self._bg_choice.GetSelection()]
+            text_color_name = _DARK_TXT_CHOICES[self._txt_choice.GetSelection()]
         else:
-            bg_choices = list(BACKGROUND_COLORS.keys())
-            txt_choices = list(TEXT_COLORS.keys())
-            bg_color_name = bg_choices[self._bg_choice.GetSelection()]
-            text_color_name = txt_choices[self._txt_choice.GetSelection()]
+            bg_color_name = _BG_CHOICES[self._bg_choice.GetSelection()]
+            text_color_name = _TXT_CHOICES[self._txt_choice.GetSelection()]
         
         return {
             'dark_mode': self._selected_theme_dark,
@@ -979,25 +1092,32 @@ class SettingsDialog(wx.Dialog):
         }
 
 
-def show_settings_dialog(parent, config):
+def show_settings_dialog(parent, config, dlg=None):
     """
     Show settings dialog and return result.
-    
+
     Args:
         parent: Parent window
         config: Current settings configuration dict
-    
+        dlg: Optional cached SettingsDialog. It is reset from config and
+             hidden (not destroyed) on close; the owner destroys it.
+
     Returns:
         Tuple of (settings_dict, save_mode) if OK clicked, (None, None) if cancelled.
         save_mode is 'local' or 'global'.
     """
-    dlg = SettingsDialog(parent, config)
+    owned = dlg is None
+    if owned:
+        dlg = SettingsDialog(parent, config)
+    elif dlg._config is not config:
+        dlg.reset(config)  # Freshly built dialogs already hold this config
     result = None
     save_mode = None
-    
+
     if dlg.ShowModal() == wx.ID_OK:
         result = dlg.get_result()
         save_mode = dlg.get_save_mode()
-    
-    dlg.Destroy()
+
+    if owned:
+        dlg.Destroy()
     return result, save_mode
@@ -11,11 +11,21 @@ import wx.lib.scrolledpanel as scrolled
 import wx.richtext as rt
 import os
 import sys
-import datetime
 import json
 import time
 import re
 import fnmatch
+import functools
+import subprocess
+import traceback
+import webbrowser
+
+try:
+    import pcbnew
+    HAS_PCBNEW = True
+except ImportError:
+    HAS_PCBNEW = False
+    pcbnew = None
 
 # Import centralized defaults - handle both KiCad plugin and standalone context
 try:
@@ -44,12 +54,15 @@ try:
 except ImportError:
     MARKDOWN_EDITOR_AVAILABLE = False
 
+# Word lookup for @REF clicks - markdown_editor needs nothing beyond wx
+from .markdown_editor import get_word_at_pos
+
 # Import extracted modules
 from .themes import (
     DARK_THEME, LIGHT_THEME,
     BACKGROUND_COLORS, TEXT_COLORS,
     DARK_BACKGROUND_COLORS, DARK_TEXT_COLORS,
-    hex_to_colour
+    hex_to_colour, theme_colours
 )
 
 from .scaling import (
@@ -70,7 +83,7 @@ from .components import (
     Icons
 )
 
-from .dialogs import show_settings_dialog, show_about_dialog
+from .dialogs import SettingsDialog, show_settings_dialog, show_about_dialog
 from .tabs import VersionLogTabMixin, BomTabMixin, TodoTabMixin
 
 # Debug logger panel (AI-friendly, modular)
@@ -115,6 +128,51 @@ except ImportError:
     HAS_CRASH_SAFETY = False
     CrashSafetyManager = None
 
+# How _apply_theme_to_panel recolours a child, resolved once per widget class
+(_THEME_SKIP, _THEME_PANEL, _THEME_STATICBOX, _THEME_TEXT,
+ _THEME_CHOICE, _THEME_CHECKBOX, _THEME_LABEL) = range(7)
+
+
+@functools.lru_cache(maxsize=None)
+def _theme_kind(cls):
+    """Map a widget class to its _THEME_* kind (checked in the original order)."""
+    if issubclass(cls, wx.Panel):
+        return _THEME_PANEL
+    if issubclass(cls, wx.StaticBox):
+        return _THEME_STATICBOX
+    if issubclass(cls, wx.TextCtrl):
+        return _THEME_TEXT
+    if issubclass(cls, (wx.Choice, wx.ComboBox)):
+        return _THEME_CHOICE
+    if issubclass(cls, wx.CheckBox):
+        return _THEME_CHECKBOX
+    if issubclass(cls, wx.StaticText):
+        return _THEME_LABEL
+    return _THEME_SKIP
+
+# Import menu entries as (label, handler method name); None/None is a separator.
+# Visual Editor mode omits the table imports, which don't render there yet.
+_IMPORT_MENU_VISUAL = (
+    (Icons.BOARD + "  Fab Summary", "_import_fab_summary"),
+    (Icons.NETLIST + "  Differential Pairs", "_import_diff_pairs"),
+    (Icons.RULES + "  Design Rules", "_import_design_rules"),
+    (None, None),
+    ("⚠️  Table imports (BOM, Layers, etc.) require Markdown mode", None),
+)
+_IMPORT_MENU_FULL = (
+    (Icons.BOARD + "  Fab Summary", "_import_fab_summary"),
+    (Icons.BOM + "  Bill of Materials (BOM)", "_import_bom"),
+    (Icons.LAYERS + "  Layer Stackup", "_import_stackup"),
+    (Icons.LAYERS + "  Layer Info", "_import_layers"),
+    (None, None),
+    (Icons.NETLIST + "  Netlist", "_import_netlist"),
+    (Icons.NETLIST + "  Differential Pairs", "_import_diff_pairs"),
+    (Icons.RULES + "  Design Rules", "_import_design_rules"),
+    (Icons.DRILL + "  Drill Table", "_import_drill_table"),
+    (None, None),
+    (Icons.ALL + "  Import All", "_import_all"),
+)
+
 
 # ============================================================
 # MAIN PANEL
@@ -122,6 +180,19 @@ except ImportError:
 class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
     """Main panel with tabs, color picker, dark mode toggle, and bottom action buttons."""
     
+    # Tab index -> panel attribute, in top bar order
+    _TAB_PANEL_ATTRS = ("notes_panel", "todo_panel", "bom_panel", "version_log_panel")
+    # Tab index -> visibility of (save_btn, pdf_btn, export_diary_btn, time_panel)
+    # in the bottom bar; Import in the top bar is shown on the Notes tab only
+    _TAB_BOTTOM_BAR = (
+        (True, True, False, False),   # Notes
+        (False, False, True, True),   # Todo
+        (True, False, False, False),  # BOM - keep Save for BOM settings
+        (False, False, False, False), # Version Log
+    )
+    # Tab index -> scrolled window to FitInside after the tab is shown
+    _TAB_SCROLL_ATTRS = (None, "todo_scroll", "bom_panel", "version_log_scroll")
+    
     def __init__(self, parent, notes_manager, designator_linker, metadata_extractor, pdf_exporter):
         wx.Panel.__init__(self, parent)
         
@@ -130,20 +201,44 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         self.metadata_extractor = metadata_extractor
         self.pdf_exporter = pdf_exporter
         
-        self._auto_save_timer = None
-        self._modified = False
-        self._todo_items = []
+        self._display_timer = None
+        self._save_wakeup = None
+        self._todo_save_timer = None
+        self._settings_dirty = False  # Local settings changed but not yet written
+        self._settings_flush = None  # Pending wx.CallLater for _flush_settings
+        self._board_project_cache = None  # (board_file, (project_dir, project_name)), see _board_project()
+        self._diary_dir_ready = None  # .kinotes dir already created this session
+        self._settings_dlg = None  # Built on first open, reused afterwards
+        self._settings_dlg_theme = None
+        self._fonts = {}  # Shared wx.Font instances, see _font()
+        self._pending_refresh = False  # Time labels went stale while hidden
+        self._last_save_ts = 0.0
+        self._notes_dirty = False  # Note text edited since the last save
+        self._vlog_dirty = False  # Changelog descriptions edited since the last save
+        # False until _load_all_data has run; saves are skipped before that so
+        # an early close/deactivate cannot overwrite files with empty widgets
+        self._data_loaded = False
+        # Set while the panel mutates the editor itself, so the resulting
+        # EVT_TEXT does not mark the notes as modified
+        self._suppress_text_event = False
+        # (bg, fg, font) the Markdown buffer was last restyled with
+        self._editor_style_key = None
+        # wx.TextAttr for the current editor colours, rebuilt when they change
+        self._editor_attr = None
+        self._editor_attr_key = None
+        self._todo_items = []  # Display order
+        self._todo_by_id = {}  # id -> entry of _todo_items
         self._todo_id_counter = 0
         
         # Version log data
-        self._version_log_items = []
+        self._version_log_items = []  # Display order
+        self._version_log_by_id = {}  # id -> entry of _version_log_items
         self._version_log_id_counter = 0
         self._current_version = DEFAULTS['current_version']
         self._current_tab = 0
         
         # Time tracking system
         self.time_tracker = TimeTracker()
-        self._timer_update_tick = 0
         
         # Theme settings (from centralized defaults)
         self._dark_mode = DEFAULTS['dark_mode']
@@ -193,17 +288,20 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         self._safe_mode_active = False
         self._version_bumped = False
         
+        self._settings_cache = None  # See _get_settings()
         self._load_color_settings()
         
         self._theme = DARK_THEME if self._dark_mode else LIGHT_THEME
-        self.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        self._refresh_colour_cache()
+        self.SetBackgroundColour(self._colour_cache["bg_panel"])
         
         debug_print(f"[KiNotes SIZE] MainPanel init, parent size: {parent.GetSize()}")
         
         try:
             self._init_ui()
-            self._load_all_data()
-            self._start_auto_save_timer()
+            # Populate after the first paint so the panel appears immediately
+            wx.CallAfter(self._load_all_data)
+            self._start_auto_save()
             
             # Initialize crash safety AFTER UI is ready
             self._init_crash_safety()
@@ -212,14 +310,19 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             if self._safe_mode_active:
                 wx.CallAfter(self._show_crash_recovery_dialog)
         except Exception as e:
-            import traceback
             debug_print("KiNotes UI init error: " + str(e))
             traceback.print_exc()
     
+    def _get_settings(self):
+        """Settings dict, read from disk once and kept current by _save_color_settings."""
+        if self._settings_cache is None:
+            self._settings_cache = self.notes_manager.load_settings() or {}
+        return self._settings_cache
+
     def _load_color_settings(self):
         """Load saved color and editor settings."""
         try:
-            settings = self.notes_manager.load_settings()
+            settings = self._get_settings()
             if settings:
                 self._bg_color_name = settings.get("bg_color", "Ivory Paper")
                 self._text_color_name = settings.get("text_color", "Carbon Black")
@@ -253,15 +356,18 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
                 # Legacy: keep _beta_net_linker as alias for backward compat
                 self._beta_net_linker = self._net_crossprobe_enabled
                 self._beta_debug_panel = settings.get("beta_debug_panel", False)
-                self._debug_modules = settings.get("debug_modules", self._debug_modules)
+                # Copy so toggling a module can't alias the cached settings
+                self._debug_modules = dict(settings.get("debug_modules", self._debug_modules))
                 # Ensure required module keys exist
                 for key in ("save", "net", "designator"):
                     if key not in self._debug_modules:
                         self._debug_modules[key] = False
                 # PDF export format setting
                 self._pdf_format = settings.get("pdf_format", "markdown")
-        except:
-            pass
+        except (AttributeError, TypeError, ValueError) as e:
+            # load_settings() handles I/O and JSON errors; this only trips on
+            # a hand-edited settings file with values of the wrong type
+            debug_print(f"[KiNotes] Error loading settings: {e}")
     
     def _handle_crash_and_version_check(self):
         """Handle crash detection and version bump checks at startup."""
@@ -304,7 +410,6 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             
         except Exception as e:
             debug_print(f"[KiNotes] Error in crash/version check: {e}")
-            import traceback
             traceback.print_exc()
     
     def _init_crash_safety(self):
@@ -328,7 +433,8 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             save_mode: 'local' for project-specific, 'global' for user-wide defaults
         """
         try:
-            settings = self.notes_manager.load_settings() or {}
+            settings = self._get_settings()
+            stored = dict(settings)
             settings.update({
                 "bg_color": self._bg_color_name,
                 "text_color": self._text_color_name,
@@ -345,7 +451,7 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
                 "beta_bom": self._beta_bom,
                 "beta_version_log": self._beta_version_log,
                 "beta_debug_panel": self._beta_debug_panel,
-                "debug_modules": self._debug_modules,
+                "debug_modules": dict(self._debug_modules),
                 "pdf_format": getattr(self, '_pdf_format', 'markdown'),
             })
             # Save panel size from instance variables (set by settings dialog)
@@ -354,18 +460,53 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             if hasattr(self, '_panel_height') and self._panel_height:
                 settings["panel_height"] = self._panel_height
             
+            if save_mode != 'global' and settings == stored:
+                return  # Nothing changed - skip the disk write
+            
             # Save based on mode
             if save_mode == 'global':
                 # Save to global settings (user-wide defaults)
                 self.notes_manager.save_settings_globally(settings)
                 debug_print("[KiNotes] Settings saved globally")
             else:
-                # Save to local project settings
-                self.notes_manager.save_settings(settings)
-                debug_print("[KiNotes] Settings saved locally")
+                # Local project settings: coalesce bursts (e.g. debug module
+                # toggles) into one write; force_save/cleanup flush right away
+                self._settings_dirty = True
+                if self._settings_flush is None:
+                    self._settings_flush = wx.CallLater(
+                        PERFORMANCE_DEFAULTS['settings_flush_ms'], self._flush_settings)
+        except Exception as e:
+            debug_print(f"[KiNotes] Error saving settings: {e}")
+
+    def _flush_settings(self):
+        """Write pending local settings changes to disk."""
+        if self._settings_flush is not None:
+            self._settings_flush.Stop()
+            self._settings_flush = None
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        try:
+            self.notes_manager.save_settings(self._get_settings())
+            debug_print("[KiNotes] Settings saved locally")
         except Exception as e:
             debug_print(f"[KiNotes] Error saving settings: {e}")
 
+    def _font(self, size, weight=wx.FONTWEIGHT_NORMAL, style=wx.FONTSTYLE_NORMAL,
+              family=wx.FONTFAMILY_DEFAULT, underline=False, strikethrough=False):
+        """Return a shared wx.Font for these attributes, creating it once.
+        
+        Fonts are handed to many widgets - never modify the returned font.
+        """
+        key = (size, weight, style, family, underline, strikethrough)
+        font = self._fonts.get(key)
+        if font is None:
+            font = wx.Font(size, family, style, weight, underline=underline)
+            if strikethrough:
+                font.SetStrikethrough(True)
+            self._fonts[key] = font
+        return font
+    
     def _get_editor_bg(self):
         if self._dark_mode:
             return hex_to_colour(DARK_BACKGROUND_COLORS.get(self._dark_bg_color_name, "#1C1C1E"))
@@ -378,49 +519,76 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
     
     def _init_ui(self):
         """Initialize UI with new layout."""
-        main_sizer = wx.BoxSizer(wx.VERTICAL)
-        
-        # === TOP BAR: Tabs + Import + Settings ===
-        self.top_bar = self._create_top_bar()
-        main_sizer.Add(self.top_bar, 0, wx.EXPAND)
-        
-        # === CONTENT AREA ===
-        self.content_panel = wx.Panel(self)
-        # Use editor bg color to match notes panel and avoid gray strip
-        self.content_panel.SetBackgroundColour(self._get_editor_bg())
-        self.content_sizer = wx.BoxSizer(wx.VERTICAL)
-        
-        # Create all tab panels
-        self.notes_panel = self._create_notes_tab(self.content_panel)
-        self.todo_panel = self._create_todo_tab(self.content_panel)
-        self.bom_panel = self._create_bom_tab(self.content_panel)
-        self.version_log_panel = self._create_version_log_tab(self.content_panel)
-        
-        self.content_sizer.Add(self.notes_panel, 1, wx.EXPAND)
-        self.content_sizer.Add(self.todo_panel, 1, wx.EXPAND)
-        self.content_sizer.Add(self.bom_panel, 1, wx.EXPAND)
-        self.content_sizer.Add(self.version_log_panel, 1, wx.EXPAND)
-        
-        self.content_panel.SetSizer(self.content_sizer)
-        main_sizer.Add(self.content_panel, 1, wx.EXPAND)
-        
-        # === BOTTOM BAR: pcbtools.xyz + Save + Export PDF ===
-        self.bottom_bar = self._create_bottom_bar()
-        main_sizer.Add(self.bottom_bar, 0, wx.EXPAND)
+        # Freeze while the bars and tabs are built so the panel paints once
+        self.Freeze()
+        try:
+            main_sizer = wx.BoxSizer(wx.VERTICAL)
+            
+            # === TOP BAR: Tabs + Import + Settings ===
+            self.top_bar = self._create_top_bar()
+            main_sizer.Add(self.top_bar, 0, wx.EXPAND)
+            
+            # === CONTENT AREA ===
+            self.content_panel = wx.Panel(self)
+            # Use editor bg color to match notes panel and avoid gray strip
+            self.content_panel.SetBackgroundColour(self._get_editor_bg())
+            self.content_sizer = wx.BoxSizer(wx.VERTICAL)
+            
+            # Create all tab panels. Each is built once and afterwards only
+            # hidden/shown (see _set_tab_visible) - destroying and rebuilding a
+            # tab on switch or theme change is slow and drops its state.
+            self.notes_panel = self._create_notes_tab(self.content_panel)
+            # Todo, BOM and Version Log tabs are built on first _show_tab(); until
+            # then an empty panel holds their slot in the sizer (see _ensure_tab)
+            self.todo_panel = wx.Panel(self.content_panel)
+            self.bom_panel = wx.Panel(self.content_panel)
+            self.version_log_panel = wx.Panel(self.content_panel)
+            self._tab_factories = {
+                1: ("todo_panel", self._create_todo_tab, self._on_todo_tab_built),
+                2: ("bom_panel", self._create_bom_tab, None),
+                3: ("version_log_panel", self._create_version_log_tab, self._on_version_log_tab_built),
+            }
+            self._built_tabs = set()
+            self._pending_todos = []
+            
+            self.content_sizer.Add(self.notes_panel, 1, wx.EXPAND)
+            self.content_sizer.Add(self.todo_panel, 1, wx.EXPAND)
+            self.content_sizer.Add(self.bom_panel, 1, wx.EXPAND)
+            self.content_sizer.Add(self.version_log_panel, 1, wx.EXPAND)
+            
+            self.content_panel.SetSizer(self.content_sizer)
+            main_sizer.Add(self.content_panel, 1, wx.EXPAND)
+            
+            # === BOTTOM BAR: pcbtools.xyz + Save + Export PDF ===
+            self.bottom_bar = self._create_bottom_bar()
+            main_sizer.Add(self.bottom_bar, 0, wx.EXPAND)
+            
+            # (button, bg theme key, fg theme key or literal colour) for _apply_theme
+            self._themed_buttons = [
+                (self.import_btn, "bg_button", "text_primary"),
+                (self.help_btn, "bg_button", "text_primary"),
+                (self.settings_btn, "bg_button", "text_primary"),
+                (self.save_btn, "accent_green", "#FFFFFF"),
+                (self.pdf_btn, "accent_blue", "#FFFFFF"),
+                (self.export_diary_btn, "bg_button", "text_primary"),
+            ]
 
-        # === DEBUG PANEL (optional, beta) with drag resize ===
-        self.debug_panel = None
-        self._debug_sash_pos = 240  # Default height (doubled)
-        if self._beta_debug_panel:
-            self._create_resizable_debug_panel(main_sizer)
-        
-        self.SetSizer(main_sizer)
-        self._show_tab(0)
+            # === DEBUG PANEL (optional, beta) with drag resize ===
+            self.debug_panel = None
+            self._debug_sash_pos = 240  # Default height (doubled)
+            if self._beta_debug_panel:
+                self._create_resizable_debug_panel(main_sizer)
+            
+            self.SetSizer(main_sizer)
+            self._show_tab(0)
+            self.Layout()  # _show_tab() only lays out the parts it changes
+        finally:
+            self.Thaw()
     
     def _create_top_bar(self):
         """Create top bar with tabs + Import button on same line."""
         top_bar = wx.Panel(self)
-        top_bar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        top_bar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         top_bar.SetMinSize((-1, scale_size(70, self)))
         
         sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -436,13 +604,15 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             tabs.append(("VLog", 3))
         
         for label, idx in tabs:
+            # Notes (0) is the initial tab - style it active up front
+            active = idx == 0
             btn = RoundedButton(
                 top_bar, 
                 label=label,
                 icon="",
                 size=(100, 42),
-                bg_color=self._theme["bg_button"],
-                fg_color=self._theme["text_primary"],
+                bg_color=self._theme["accent_blue"] if active else self._theme["bg_button"],
+                fg_color="#FFFFFF" if active else self._theme["text_primary"],
                 corner_radius=10,
                 font_size=11,
                 font_weight=wx.FONTWEIGHT_BOLD
@@ -519,13 +689,12 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         sizer.Add(self.settings_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 16)
         
         top_bar.SetSizer(sizer)
-        wx.CallAfter(self._update_tab_styles, 0)
         return top_bar
     
     def _create_bottom_bar(self):
         """Create bottom bar with pcbtools.xyz link, Save and Export PDF buttons."""
         bottom_bar = wx.Panel(self)
-        bottom_bar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        bottom_bar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         bottom_bar.SetMinSize((-1, scale_size(70, self)))
         
         sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -533,8 +702,8 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         
         # pcbtools.xyz link on the left with globe icon
         link_text = wx.StaticText(bottom_bar, label="\U0001F310 pcbtools.xyz")
-        link_text.SetForegroundColour(hex_to_colour(self._theme["accent_blue"]))
-        link_text.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, underline=True))
+        link_text.SetForegroundColour(self._colour_cache["accent_blue"])
+        link_text.SetFont(self._font(9, underline=True))
         link_text.SetCursor(wx.Cursor(wx.CURSOR_HAND))
         link_text.Bind(wx.EVT_LEFT_DOWN, self._on_website_click)
         link_text.SetToolTip("Visit pcbtools.xyz")
@@ -544,8 +713,8 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         
         # Open work logs folder link
         folder_text = wx.StaticText(bottom_bar, label="📁 Directory")
-        folder_text.SetForegroundColour(hex_to_colour(self._theme["accent_blue"]))
-        folder_text.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, underline=True))
+        folder_text.SetForegroundColour(self._colour_cache["accent_blue"])
+        folder_text.SetFont(self._font(9, underline=True))
         folder_text.SetCursor(wx.Cursor(wx.CURSOR_HAND))
         folder_text.Bind(wx.EVT_LEFT_DOWN, self._on_open_work_logs_folder)
         folder_text.SetToolTip("Open work logs folder (.kinotes)")
@@ -556,13 +725,13 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         # Global time tracker display - right side before buttons
         # Use a panel with subtle background for gentle highlight
         self.time_panel = wx.Panel(bottom_bar)
-        self.time_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        self.time_panel.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         time_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.time_panel.SetSizer(time_sizer)
         
         self.global_time_label = wx.StaticText(self.time_panel, label="⏱ Total: 00:00:00")
-        self.global_time_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self.global_time_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.global_time_label.SetForegroundColour(self._colour_cache["text_primary"])
+        self.global_time_label.SetFont(self._font(10, wx.FONTWEIGHT_BOLD))
         time_sizer.Add(self.global_time_label, 0, wx.ALL, 8)
         
         sizer.Add(self.time_panel, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 16)
@@ -619,14 +788,14 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         """Create resizable debug panel with drag handle."""
         # Create a container with drag handle at top
         self.debug_container = wx.Panel(self)
-        self.debug_container.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        self.debug_container.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         self.debug_container.SetMinSize((-1, 80))
         
         container_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Drag handle bar (thicker for easier grabbing)
         self._drag_bar = wx.Panel(self.debug_container, size=(-1, 8))
-        self._drag_bar.SetBackgroundColour(hex_to_colour(self._theme["border"]))
+        self._drag_bar.SetBackgroundColour(self._colour_cache["border"])
         self._drag_bar.SetCursor(wx.Cursor(wx.CURSOR_SIZENS))
         
         # Bind drag events to the drag bar
@@ -696,14 +865,14 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
     def _create_debug_panel_content(self, parent):
         """Create debug panel content (used by resizable container)."""
         panel = wx.Panel(parent)
-        panel.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        panel.SetBackgroundColour(self._colour_cache["bg_toolbar"])
 
         wrapper = wx.BoxSizer(wx.VERTICAL)
 
         header = wx.BoxSizer(wx.HORIZONTAL)
         title = wx.StaticText(panel, label="🔍 Debug Panel (Beta)")
-        title.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        title.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        title.SetForegroundColour(self._colour_cache["text_primary"])
+        title.SetFont(self._font(9, wx.FONTWEIGHT_BOLD))
         header.Add(title, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
 
         # Module toggles (select which modules emit logs)
@@ -716,7 +885,7 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         for key, label in module_labels:
             cb = wx.CheckBox(panel, label=label)
             cb.SetValue(self._debug_modules.get(key, False))
-            cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+            cb.SetForegroundColour(self._colour_cache["text_primary"])
             cb.Bind(wx.EVT_CHECKBOX, lambda evt, k=key: self._on_debug_module_toggle(k, evt.IsChecked()))
             self._debug_module_checkboxes[key] = cb
             header.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
@@ -739,9 +908,8 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
     def _on_website_click(self, event):
         """Open pcbtools.xyz in browser."""
         try:
-            import webbrowser
             webbrowser.open("https://pcbtools.xyz")
-        except:
+        except (webbrowser.Error, OSError):
             pass
     
     def _on_help_click(self, event):
@@ -837,9 +1005,8 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
     def _open_url(self, url):
         """Open URL in default browser."""
         try:
-            import webbrowser
             webbrowser.open(url)
-        except:
+        except (webbrowser.Error, OSError):
             pass
     
     def _refresh_net_cache(self, show_message: bool = False):
@@ -869,7 +1036,7 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         try:
             # Change button color to green to show active state
             if hasattr(self, 'refresh_net_btn') and self.refresh_net_btn:
-                self.refresh_net_btn.SetBackgroundColour(hex_to_colour(self._theme["accent_green"]))
+                self.refresh_net_btn.SetBackgroundColour(self._colour_cache["accent_green"])
                 self.refresh_net_btn.Refresh()
         except Exception:
             pass
@@ -888,7 +1055,7 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         """Reset refresh button color back to blue."""
         try:
             if hasattr(self, 'refresh_net_btn') and self.refresh_net_btn:
-                self.refresh_net_btn.SetBackgroundColour(hex_to_colour(self._theme["accent_blue"]))
+                self.refresh_net_btn.SetBackgroundColour(self._colour_cache["accent_blue"])
                 self.refresh_net_btn.Refresh()
         except Exception:
             pass
@@ -948,7 +1115,7 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
         
         # Text control
         text_ctrl = wx.TextCtrl(dlg, value=debug_info, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        text_ctrl.SetFont(wx.Font(9, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        text_ctrl.SetFont(self._font(9, family=wx.FONTFAMILY_TELETYPE))
         sizer.Add(text_ctrl, 1, wx.EXPAND | wx.ALL, 10)
         
         # Close button
@@ -971,20 +1138,20 @@ class KiNotesMainPanel(TodoTabMixin, VersionLogTabMixin, BomTabMixin, wx.Panel):
             total_crashes = crash_summary.get('total_crashes', 0)
             
             dlg = wx.Dialog(self, title="Crash Recovery", size=(500, 400))
-            dlg.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+            dlg.SetBackgroundColour(self._colour_cache["bg_panel"])
             
             sizer = wx.BoxSizer(wx.VERTICAL)
             
             # Warning icon and title
             title_sizer = wx.BoxSizer(wx.HORIZONTAL)
             warning_text = wx.StaticText(dlg, label="⚠")
-            warning_text.SetFont(wx.Font(24, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-            warning_text.SetForegroundColour(hex_to_colour(self._theme["accent_red"]))
+            warning_text.SetFont(self._font(24, wx.FONTWEIGHT_BOLD))
+            warning_text.SetForegroundColour(self._colour_cache["accent_red"])
             title_sizer.Add(warning_text, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
             
             title_label = wx.StaticText(dlg, label="KiNotes Recovered from Crash")
-            title_label.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-            title_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+            title_label.SetFont(self._font(12, wx.FONTWEIGHT_BOLD))
+            title_label.SetForegroundColour(self._colour_cache["text_primary"])
             title_sizer.Add(title_label, 0, wx.ALIGN_CENTER_VERTICAL)
             sizer.Add(title_sizer, 0, wx.ALL, 20)
             
@@ -1002,9 +1169,9 @@ Your notes, todos, and settings have been automatically backed up.
 You can safely continue working."""
             
             msg_text = wx.TextCtrl(dlg, value=message, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_WORDWRAP)
-            msg_text.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
-            msg_text.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-            msg_text.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            msg_text.SetBackgroundColour(self._colour_cache["bg_panel"])
+            msg_text.SetForegroundColour(self._colour_cache["text_primary"])
+            msg_text.SetFont(self._font(10))
             sizer.Add(msg_text, 1, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 20)
             
             # Buttons
@@ -1053,16 +1220,32 @@ You can safely continue working."""
         except Exception as e:
             debug_print(f"[KiNotes] Error clearing crash history: {e}")
     
+    def _board_project(self):
+        """(project_dir, project_name) of the open board, or None.
+        
+        The board file name is read on every call, so switching boards is
+        picked up; only the path splitting is cached, keyed on that name.
+        Unsaved boards and standalone mode return None.
+        """
+        try:
+            board = pcbnew.GetBoard() if HAS_PCBNEW else None
+            board_file = board.GetFileName() if board else ""
+        except (AttributeError, RuntimeError):
+            return None
+        if not board_file:
+            return None
+        cached = self._board_project_cache
+        if cached is None or cached[0] != board_file:
+            cached = self._board_project_cache = (board_file, (
+                os.path.dirname(board_file),
+                os.path.splitext(os.path.basename(board_file))[0],
+            ))
+        return cached[1]
+    
     def _get_project_name(self):
         """Get the current project name from KiCad board or fallback."""
-        try:
-            import pcbnew
-            board = pcbnew.GetBoard()
-            if board and board.GetFileName():
-                return os.path.splitext(os.path.basename(board.GetFileName()))[0]
-        except:
-            pass
-        return "KiCad Project"
+        project = self._board_project()
+        return project[1] if project else "KiCad Project"
     
     def _get_work_diary_path(self):
         """
@@ -1070,28 +1253,18 @@ You can safely continue working."""
         Uses a SINGLE daily file per project - overwrites on each save.
         Format: <project>_worklog_<YYYYMMDD>.md
         """
-        # Try to get KiCad project directory, fallback to home directory
-        try:
-            import pcbnew
-            board = pcbnew.GetBoard()
-            if board and board.GetFileName():
-                project_dir = os.path.dirname(board.GetFileName())
-                project_name = os.path.splitext(os.path.basename(board.GetFileName()))[0]
-            else:
-                project_dir = os.path.expanduser("~")
-                project_name = "kinotes"
-        except:
-            # Standalone mode: use home directory
-            project_dir = os.path.expanduser("~")
-            project_name = "kinotes"
+        # KiCad project directory, or home directory in standalone mode
+        project_dir, project_name = self._board_project() or (os.path.expanduser("~"), "kinotes")
         
-        # Create .kinotes subdirectory
+        # Create .kinotes subdirectory (once per session)
         kinotes_dir = os.path.join(project_dir, ".kinotes")
-        os.makedirs(kinotes_dir, exist_ok=True)
+        if self._diary_dir_ready != kinotes_dir:
+            os.makedirs(kinotes_dir, exist_ok=True)
+            self._diary_dir_ready = kinotes_dir
         
         # Generate filename with DATE ONLY (not time) - one file per day
         # Format: <project_title>_worklog_<YYYYMMDD>.md
-        date_str = datetime.datetime.now().strftime("%Y%m%d")
+        date_str = time.strftime("%Y%m%d")
         filename = f"{project_name}_worklog_{date_str}.md"
         filepath = os.path.join(kinotes_dir, filename)
         
@@ -1131,7 +1304,7 @@ You can safely continue working."""
                 except:
                     pass
                 
-                self._modified = True
+                self._notes_dirty = True
                 wx.MessageBox("Work diary inserted in Notes.", "Export Diary", wx.OK | wx.ICON_INFORMATION)
             else:
                 wx.MessageBox("Visual editor not available.", "Export Error", wx.OK | wx.ICON_ERROR)
@@ -1140,6 +1313,9 @@ You can safely continue working."""
     
     def _auto_export_diary_on_close(self):
         """Automatically save work diary to file on close - safe, no UI operations."""
+        if not self._is_tab_built(1):
+            # No tasks were loaded into the tracker; keep today's diary as-is
+            return
         try:
             # Only export to file, don't touch UI during close
             project_name = self._get_project_name()
@@ -1158,19 +1334,10 @@ You can safely continue working."""
         
         # Get actual project directory from board (most reliable)
         kinotes_dir = None
-        try:
-            import pcbnew
-            board = pcbnew.GetBoard()
-            debug_print(f"[KiNotes Directory] board: {board}")
-            if board:
-                board_file = board.GetFileName()
-                debug_print(f"[KiNotes Directory] board.GetFileName(): {board_file}")
-                if board_file:
-                    project_dir = os.path.dirname(board_file)
-                    kinotes_dir = os.path.join(project_dir, ".kinotes")
-                    debug_print(f"[KiNotes Directory] From board: {kinotes_dir}")
-        except Exception as e:
-            debug_print(f"[KiNotes Directory] pcbnew error: {e}")
+        project = self._board_project()
+        if project:
+            kinotes_dir = os.path.join(project[0], ".kinotes")
+            debug_print(f"[KiNotes Directory] From board: {kinotes_dir}")
         
         # Fallback to notes_manager's notes_dir (canonical location)
         if not kinotes_dir:
@@ -1208,7 +1375,6 @@ You can safely continue working."""
                 return
         
         # Open folder in system file explorer
-        import subprocess
         try:
             debug_print(f"[KiNotes Directory] Opening: {kinotes_dir}")
             if sys.platform.startswith("win"):
@@ -1226,76 +1392,93 @@ You can safely continue working."""
             )
     
     def _update_tab_styles(self, active_idx):
-        """Update tab button styles."""
+        """Update tab button styles.
+        
+        Callers run this inside Freeze() so the recoloured buttons repaint
+        together on Thaw().
+        """
         for btn in self.tab_buttons:
-            try:
-                if btn.tab_index == active_idx:
-                    btn.SetColors(self._theme["accent_blue"], "#FFFFFF")
-                else:
-                    btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-            except:
-                pass
+            if btn.tab_index == active_idx:
+                btn.SetColors(self._theme["accent_blue"], "#FFFFFF")
+            else:
+                btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
     
     def _on_tab_click(self, idx):
+        if idx == self._current_tab:
+            return  # Already showing - skip the hide/show/layout pass
         self._show_tab(idx)
     
+    def _ensure_tab(self, idx):
+        """Build a lazily-created tab on first use, swapping out its placeholder."""
+        if idx in self._built_tabs or idx not in self._tab_factories:
+            return
+        attr, factory, on_built = self._tab_factories[idx]
+        placeholder = getattr(self, attr)
+        panel = factory(self.content_panel)
+        self.content_sizer.Replace(placeholder, panel)
+        placeholder.Destroy()
+        setattr(self, attr, panel)
+        self._built_tabs.add(idx)
+        if on_built:
+            on_built()
+    
+    def _is_tab_built(self, idx):
+        """True once a lazily-created tab has replaced its placeholder."""
+        return idx not in self._tab_factories or idx in self._built_tabs
+    
+    def _on_todo_tab_built(self):
+        """Fill the freshly built Todo tab with the todos loaded at startup."""
+        todos, self._pending_todos = self._pending_todos, []
+        self._load_todo_items(todos)
+        self._refresh_time_displays()
+    
+    def _on_version_log_tab_built(self):
+        """Read the changelog into the freshly built Version Log tab."""
+        if self._data_loaded:
+            self._load_version_log()
+    
+    def _set_tab_visible(self, idx, visible):
+        """Show or hide a tab panel - never destroys it."""
+        panel = getattr(self, self._TAB_PANEL_ATTRS[idx])
+        panel.Show(visible)
+    
     def _show_tab(self, idx):
         """Show selected tab."""
+        self._flush_todo_save()
+        self._ensure_tab(idx)
         self._current_tab = idx
-        self._update_tab_styles(idx)
-        
-        self.notes_panel.Hide()
-        self.todo_panel.Hide()
-        self.bom_panel.Hide()
-        self.version_log_panel.Hide()
-        
-        # Show/hide buttons based on tab
-        if idx == 0:  # Notes tab
-            self.notes_panel.Show()
-            self.import_btn.Show()
-            self.save_btn.Show()
-            self.pdf_btn.Show()
-            self.export_diary_btn.Hide()
-            self.time_panel.Hide()
-        elif idx == 1:  # Todo tab
-            self.todo_panel.Show()
-            self.import_btn.Hide()
-            self.save_btn.Hide()
-            self.pdf_btn.Hide()
-            self.export_diary_btn.Show()
-            self.time_panel.Show()
-            try:
-                self.todo_scroll.FitInside()
-            except:
-                pass
-        elif idx == 2:  # BOM tab
-            self.bom_panel.Show()
-            self.import_btn.Hide()
-            self.save_btn.Show()  # Keep Save for BOM settings
-            self.pdf_btn.Hide()
-            self.export_diary_btn.Hide()
-            self.time_panel.Hide()
-            try:
-                self.bom_panel.FitInside()
-            except:
-                pass
-        elif idx == 3:  # Version Log tab
-            self.version_log_panel.Show()
-            self.import_btn.Hide()
-            self.save_btn.Hide()
-            self.pdf_btn.Hide()
-            self.export_diary_btn.Hide()
-            self.time_panel.Hide()
-            try:
-                self.version_log_scroll.FitInside()
-            except:
-                pass
         
-        self.top_bar.Layout()
-        self.bottom_bar.Layout()
-        self.content_panel.Layout()
-        self.Layout()
-        self.Refresh()
+        self.Freeze()
+        try:
+            self._update_tab_styles(idx)
+            for tab_idx in range(len(self._TAB_PANEL_ATTRS)):
+                self._set_tab_visible(tab_idx, tab_idx == idx)
+            
+            # Show/hide bar buttons for this tab. Window.Show() reports whether
+            # the state changed, so a bar is only re-laid out when it has to be
+            top_changed = self.import_btn.Show(idx == 0)
+            bottom_widgets = (self.save_btn, self.pdf_btn, self.export_diary_btn, self.time_panel)
+            bottom_changed = False
+            for widget, visible in zip(bottom_widgets, self._TAB_BOTTOM_BAR[idx]):
+                bottom_changed |= widget.Show(visible)
+            
+            scroll_attr = self._TAB_SCROLL_ATTRS[idx]
+            if scroll_attr:
+                try:
+                    getattr(self, scroll_attr).FitInside()
+                except (RuntimeError, AttributeError):
+                    pass
+            
+            # The bars and content area keep their size, so laying out self
+            # would not reach them - lay out just the containers that changed
+            if top_changed:
+                self.top_bar.Layout()
+            if bottom_changed:
+                self.bottom_bar.Layout()
+            self.content_panel.Layout()
+        finally:
+            self.Thaw()
+        self.Refresh(eraseBackground=False)
     
     # ============================================================
     # SETTINGS DIALOG
@@ -1324,14 +1507,38 @@ You can safely continue working."""
             'beta_debug_panel': self._beta_debug_panel,
             'debug_modules': self._debug_modules,
             'notes_manager': self.notes_manager,
+            'settings': self._get_settings(),
             'pdf_format': getattr(self, '_pdf_format', 'markdown'),
         }
         
-        result, save_mode = show_settings_dialog(self, config)
+        result, save_mode = show_settings_dialog(self, config, self._build_settings_dlg(config))
         
         if result:
             self._apply_settings_result(result, save_mode)
     
+    def _build_settings_dlg(self, config):
+        """Return the cached settings dialog, building it on first use.
+
+        The dialog bakes theme colours into its widgets, so it is rebuilt
+        only when the panel switched between light and dark themes.
+        """
+        dlg = self._settings_dlg
+        if dlg is not None and self._settings_dlg_theme is self._theme:
+            return dlg
+        if dlg is not None:
+            try:
+                dlg.Destroy()
+            except:
+                pass
+        self._settings_dlg = SettingsDialog(self, config)
+        self._settings_dlg_theme = self._theme
+        return self._settings_dlg
+    
+    def _theme_colour_state(self):
+        """Everything that decides panel and editor colours."""
+        return (self._dark_mode, self._bg_color_name, self._text_color_name,
+                self._dark_bg_color_name, self._dark_text_color_name)
+    
     def _apply_settings_result(self, result, save_mode='local'):
         """Apply settings from dialog result.
         
@@ -1342,6 +1549,8 @@ You can safely continue working."""
         # Store save mode for later use
         self._last_save_mode = save_mode
         
+        old_colours = self._theme_colour_state()
+        
         # Update theme
         self._dark_mode = result['dark_mode']
         if self._dark_mode:
@@ -1357,15 +1566,14 @@ You can safely continue working."""
         self.time_tracker.show_work_diary_button = result['show_work_diary']
         
         # Show/hide export diary button based on setting AND current tab
-        if self.time_tracker.show_work_diary_button and self._current_tab == 1:
-            self.export_diary_btn.Show()
-        else:
-            self.export_diary_btn.Hide()
+        diary_btn_changed = self.export_diary_btn.Show(
+            self.time_tracker.show_work_diary_button and self._current_tab == 1)
         
         # Update cross-probe setting
         self._crossprobe_enabled = result['crossprobe_enabled']
+        old_custom_designators = getattr(self, '_custom_designators', '')
         self._custom_designators = result.get('custom_designators', '')
-        if self.designator_linker:
+        if self.designator_linker and self._custom_designators != old_custom_designators:
             self.designator_linker.set_custom_prefixes(self._custom_designators)
         if hasattr(self, 'visual_editor') and self.visual_editor:
             self.visual_editor.set_crossprobe_enabled(self._crossprobe_enabled)
@@ -1383,7 +1591,7 @@ You can safely continue working."""
         set_user_scale_factor(new_scale_factor)
         
         # Check panel size changes and store new values
-        current_settings = self.notes_manager.load_settings() or {}
+        current_settings = self._get_settings()
         old_width = current_settings.get("panel_width", 1300)
         old_height = current_settings.get("panel_height", 1170)
         new_width = result['panel_width']
@@ -1427,8 +1635,9 @@ You can safely continue working."""
             # If markdown beta is disabled but visual editor is available, use visual
             self._use_visual_editor = VISUAL_EDITOR_AVAILABLE
         
-        # Refresh nets if net linker is enabled
-        if self._beta_net_linker and self.net_linker:
+        # Refresh nets when net cross-probe was just switched on (the toolbar
+        # refresh button covers board edits)
+        if self._beta_net_linker and self.net_linker and not old_net_crossprobe:
             try:
                 self.net_linker.refresh_nets()
                 debug_print("[KiNotes] Net linker cache refreshed")
@@ -1506,16 +1715,19 @@ You can safely continue working."""
         # Propagate logger targets to editors
         self._apply_debug_logger_targets()
         
-        self._theme = DARK_THEME if self._dark_mode else LIGHT_THEME
-        self._apply_theme()
-        self._apply_editor_colors()
+        # Re-theme only if the mode or a colour preset actually changed
+        if self._theme_colour_state() != old_colours:
+            self._theme = DARK_THEME if self._dark_mode else LIGHT_THEME
+            self._apply_theme()
+            self._apply_editor_colors()
         self._save_color_settings(save_mode)
         # Persist everything immediately to avoid data loss before restart/close
         try:
             self.force_save()
         except Exception as e:
             debug_print(f"[KiNotes] Settings apply save warning: {e}")
-        self.Layout()
+        if diary_btn_changed:
+            self.bottom_bar.Layout()
     
     def _apply_theme_to_panel(self, panel):
         """Apply current theme to a panel and all its children recursively."""
@@ -1523,97 +1735,108 @@ You can safely continue working."""
             return
         
         try:
-            panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+            colours = self._colour_cache
+            panel.SetBackgroundColour(colours["bg_panel"])
             
             # Recursively apply to all children
             for child in panel.GetChildren():
-                if isinstance(child, wx.Panel):
+                kind = _theme_kind(type(child))
+                if kind == _THEME_PANEL:
                     self._apply_theme_to_panel(child)
-                elif isinstance(child, wx.TextCtrl):
+                elif kind == _THEME_STATICBOX:
+                    # Section boxes (BOM options) parent their own controls
+                    child.SetForegroundColour(colours["text_secondary"])
+                    for box_child in child.GetChildren():
+                        if _theme_kind(type(box_child)) == _THEME_CHECKBOX:
+                            box_child.SetForegroundColour(colours["text_primary"])
+                elif kind == _THEME_TEXT:
                     child.SetBackgroundColour(self._get_editor_bg())
                     child.SetForegroundColour(self._get_editor_text())
-                elif isinstance(child, (wx.Choice, wx.ComboBox)):
-                    child.SetBackgroundColour(hex_to_colour(self._theme["bg_button"]))
-                    child.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-                elif isinstance(child, wx.CheckBox):
-                    child.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-                elif isinstance(child, wx.StaticText):
-                    child.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        except:
-            pass
+                elif kind == _THEME_CHOICE:
+                    child.SetBackgroundColour(colours["bg_button"])
+                    child.SetForegroundColour(colours["text_primary"])
+                elif kind == _THEME_CHECKBOX:
+                    child.SetForegroundColour(colours["text_primary"])
+                elif kind == _THEME_LABEL:
+                    child.SetForegroundColour(colours["text_secondary"])
+        except RuntimeError:
+            pass  # Widget destroyed while walking the tree
+    
+    def _refresh_colour_cache(self):
+        """Resolve every key of the current theme to its wx.Colour once."""
+        self._colour_cache = theme_colours(self._theme)
     
     def _apply_theme(self):
         """Apply current theme to all UI elements."""
-        self.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
-        self.top_bar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
-        self.bottom_bar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
-        # Use editor bg color for content area to avoid gray strip around notes
-        self.content_panel.SetBackgroundColour(self._get_editor_bg())
-        
-        # Apply theme to formatting toolbar
-        try:
-            self.format_toolbar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
-            for btn in self.format_buttons:
-                btn.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
-                btn.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        except:
-            pass
-        
-        # Apply theme to all tab panels
-        self._apply_theme_to_panel(self.notes_panel)
-        self._apply_theme_to_panel(self.todo_panel)
-        self._apply_theme_to_panel(self.bom_panel)
-        self._apply_theme_to_panel(self.version_log_panel)
-        
-        # Update tab buttons
-        for btn in self.tab_buttons:
-            if btn.tab_index == self._current_tab:
-                btn.SetColors(self._theme["accent_blue"], "#FFFFFF")
-            else:
-                btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-        
-        # Update other buttons
-        self.import_btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-        self.help_btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-        self.settings_btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-        self.save_btn.SetColors(self._theme["accent_green"], "#FFFFFF")
-        self.pdf_btn.SetColors(self._theme["accent_blue"], "#FFFFFF")
-        self.export_diary_btn.SetColors(self._theme["bg_button"], self._theme["text_primary"])
-        
-        # Update global time label and panel
-        try:
-            self.time_panel.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
-            self.global_time_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-            self.time_panel.Refresh()
-        except:
-            pass
-        
-        # Update todo counter
+        # Freeze so the recolouring below is painted in one pass
+        self.Freeze()
         try:
-            self.todo_count.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        except:
-            pass
+            self._refresh_colour_cache()
+            self.SetBackgroundColour(self._colour_cache["bg_panel"])
+            self.top_bar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
+            self.bottom_bar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
+            # Use editor bg color for content area to avoid gray strip around notes
+            self.content_panel.SetBackgroundColour(self._get_editor_bg())
         
-        # Update all todo items
-        for item in self._todo_items:
+            # Apply theme to formatting toolbar
             try:
-                item["panel"].SetBackgroundColour(
-                    hex_to_colour(self._theme["bg_panel"]) if self._dark_mode else wx.WHITE
-                )
-                item["checkbox"].SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-                item["text"].SetBackgroundColour(
-                    hex_to_colour(self._theme["bg_panel"]) if self._dark_mode else wx.WHITE
-                )
-                item["text"].SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-                item["timer_label"].SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-                item["del_btn"].SetBackgroundColour(
-                    hex_to_colour(self._theme["bg_panel"]) if self._dark_mode else wx.WHITE
-                )
-            except:
+                self.format_toolbar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
+                for btn in self.format_buttons:
+                    btn.SetBackgroundColour(self._colour_cache["bg_toolbar"])
+                    btn.SetForegroundColour(self._colour_cache["text_primary"])
+            except AttributeError:
+                pass  # Visual editor has no separate format toolbar
+        
+            # Apply theme to all tab panels (unbuilt tabs pick it up on creation)
+            self._apply_theme_to_panel(self.notes_panel)
+            if self._is_tab_built(1):
+                self._apply_theme_to_panel(self.todo_panel)
+            if self._is_tab_built(2):
+                self._apply_theme_to_panel(self.bom_panel)
+            if self._is_tab_built(3):
+                self._apply_theme_to_panel(self.version_log_panel)
+        
+            # Update tab buttons (active state) and the other toolbar buttons
+            self._update_tab_styles(self._current_tab)
+            for btn, bg_key, fg_key in self._themed_buttons:
+                btn.SetColors(self._theme[bg_key], self._theme.get(fg_key, fg_key))
+        
+            # Update global time label and panel
+            try:
+                self.time_panel.SetBackgroundColour(self._colour_cache["bg_toolbar"])
+                self.global_time_label.SetForegroundColour(self._colour_cache["text_primary"])
+                self.time_panel.Refresh()
+            except RuntimeError:
                 pass
         
+            # Update todo counter
+            try:
+                self.todo_count.SetForegroundColour(self._colour_cache["text_secondary"])
+            except AttributeError:
+                pass  # Todo tab not built yet
+        
+            # Update all todo items - colours resolved once for the whole list.
+            # No Get*Colour() pre-check: wx already ignores a Set*Colour() that
+            # doesn't change anything, so comparing first would only add calls
+            item_bg = self._colour_cache["bg_panel"] if self._dark_mode else wx.WHITE
+            text_primary = self._colour_cache["text_primary"]
+            text_secondary = self._colour_cache["text_secondary"]
+            for item in self._todo_items:
+                try:
+                    item["panel"].SetBackgroundColour(item_bg)
+                    item["checkbox"].SetForegroundColour(text_primary)
+                    item["text"].SetBackgroundColour(item_bg)
+                    item["text"].SetForegroundColour(text_primary)
+                    item["timer_label"].SetForegroundColour(text_secondary)
+                    item["del_btn"].SetBackgroundColour(item_bg)
+                except (KeyError, RuntimeError):
+                    pass
+        finally:
+            self.Thaw()
+        
+        # One coalesced repaint; no Update() - painting synchronously here
+        # would stall the settings dialog close for nothing
         self.Refresh()
-        self.Update()
     
     def _apply_editor_colors(self):
         """Apply selected colors to editor (supports both Visual and Markdown modes)."""
@@ -1638,9 +1861,23 @@ You can safely continue working."""
                 
                 # Apply to all text
                 font = self.text_editor.GetFont()
-                text_attr = wx.TextAttr(fg, bg, font)
+                style_key = (bg.GetRGB(), fg.GetRGB(), font.GetNativeFontInfoDesc())
+                if style_key != self._editor_attr_key:
+                    self._editor_attr = wx.TextAttr(fg, bg, font)
+                    self._editor_attr_key = style_key
+                text_attr = self._editor_attr
                 self.text_editor.SetDefaultStyle(text_attr)
-                self.text_editor.SetStyle(0, self.text_editor.GetLastPosition(), text_attr)
+                # Text inserted since the last restyle already carries the
+                # default style; only restyle the buffer when the style changed
+                if style_key != self._editor_style_key:
+                    self.text_editor.Freeze()
+                    self._suppress_text_event = True
+                    try:
+                        self.text_editor.SetStyle(0, self.text_editor.GetLastPosition(), text_attr)
+                    finally:
+                        self._suppress_text_event = False
+                        self.text_editor.Thaw()
+                    self._editor_style_key = style_key
                 if self.text_editor.IsShown():
                     self.text_editor.Refresh()
         except Exception:
@@ -1697,20 +1934,18 @@ You can safely continue working."""
                 debug_print(f"[KiNotes] Custom colors applied: bg={bg}, fg={fg}")
             except Exception as e:
                 debug_print(f"[KiNotes] Custom colors warning: {e}")
-                import traceback
                 traceback.print_exc()
             
             # Apply user's font size setting
             debug_print("[KiNotes] About to set font size...")
             try:
-                settings = self.notes_manager.load_settings() or {}
+                settings = self._get_settings()
                 font_size = settings.get("font_size", 11)
                 debug_print(f"[KiNotes] Font size setting: {font_size}")
                 self.visual_editor.set_font_size(font_size)
                 debug_print("[KiNotes] Font size applied")
             except Exception as e:
                 debug_print(f"[KiNotes] Font size warning: {e}")
-                import traceback
                 traceback.print_exc()
             
             # Set up cross-probe functionality
@@ -1722,7 +1957,6 @@ You can safely continue working."""
                 debug_print("[KiNotes] Crossprobe setup complete")
             except Exception as e:
                 debug_print(f"[KiNotes] Crossprobe setup warning: {e}")
-                import traceback
                 traceback.print_exc()
             
             # Set up net highlighting (Beta)
@@ -1749,7 +1983,6 @@ You can safely continue working."""
                 debug_print("[KiNotes] Debug logger setup complete")
             except Exception as e:
                 debug_print(f"[KiNotes] Debug logger setup warning: {e}")
-                import traceback
                 traceback.print_exc()
             
             # Reference for unified API
@@ -1766,7 +1999,6 @@ You can safely continue working."""
             sizer.Add(self.visual_editor, 1, wx.EXPAND | wx.ALL, 0)
             debug_print("[KiNotes] Visual editor added to sizer")
         except Exception as e:
-            import traceback
             debug_print(f"[KiNotes ERROR] Failed to create visual editor: {e}")
             traceback.print_exc()
             # Fall back to markdown editor
@@ -1788,6 +2020,7 @@ You can safely continue working."""
         
         # Alias for unified API
         self.text_editor = self.markdown_editor._editor
+        self._editor_style_key = None  # New buffer, restyle on next apply
         self.visual_editor = None  # Not using visual editor
 
     def _get_note_content(self):
@@ -1830,38 +2063,15 @@ You can safely continue working."""
         # in Visual Editor mode as they don't render properly yet
         is_visual_mode = self._use_visual_editor and hasattr(self, 'visual_editor') and self.visual_editor
         
-        if is_visual_mode:
-            # Limited menu for Visual Editor - only non-table imports
-            items = [
-                (Icons.BOARD + "  Fab Summary", self._import_fab_summary),
-                (Icons.NETLIST + "  Differential Pairs", self._import_diff_pairs),
-                (Icons.RULES + "  Design Rules", self._import_design_rules),
-                (None, None),
-                ("⚠️  Table imports (BOM, Layers, etc.) require Markdown mode", None),
-            ]
-        else:
-            # Full menu for Markdown mode
-            items = [
-                (Icons.BOARD + "  Fab Summary", self._import_fab_summary),
-                (Icons.BOM + "  Bill of Materials (BOM)", self._import_bom),
-                (Icons.LAYERS + "  Layer Stackup", self._import_stackup),
-                (Icons.LAYERS + "  Layer Info", self._import_layers),
-                (None, None),
-                (Icons.NETLIST + "  Netlist", self._import_netlist),
-                (Icons.NETLIST + "  Differential Pairs", self._import_diff_pairs),
-                (Icons.RULES + "  Design Rules", self._import_design_rules),
-                (Icons.DRILL + "  Drill Table", self._import_drill_table),
-                (None, None),
-                (Icons.ALL + "  Import All", self._import_all),
-            ]
+        items = _IMPORT_MENU_VISUAL if is_visual_mode else _IMPORT_MENU_FULL
         
-        for label, handler in items:
+        for label, handler_name in items:
             if label is None:
                 menu.AppendSeparator()
             else:
                 item = menu.Append(wx.ID_ANY, label)
-                if handler:
-                    menu.Bind(wx.EVT_MENU, handler, item)
+                if handler_name:
+                    menu.Bind(wx.EVT_MENU, getattr(self, handler_name), item)
                 else:
                     # Disabled item (info text)
                     item.Enable(False)
@@ -1869,9 +2079,10 @@ You can safely continue working."""
         self.PopupMenu(menu)
         menu.Destroy()
     
-    def _get_import_header(self, title):
+    def _get_import_header(self, title, date_str=None):
         """Generate header with title and date for imported content."""
-        date_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        if date_str is None:
+            date_str = time.strftime("%Y-%m-%d %H:%M")
         return f"## {title}\n**Imported:** {date_str}\n\n"
     
     def _import_fab_summary(self, event):
@@ -1970,8 +2181,10 @@ You can safely continue working."""
     def _import_all(self, event):
         """Import all metadata."""
         try:
-            header = self._get_import_header("Complete Board Metadata")
-            info = self.metadata_extractor.extract('all')
+            # One timestamp for the import header and the extractor's own header
+            date_str = time.strftime("%Y-%m-%d %H:%M")
+            header = self._get_import_header("Complete Board Metadata", date_str)
+            info = self.metadata_extractor.extract_all(date_str)
             self._insert_text(header + info)
         except Exception as e:
             wx.MessageBox(f"Error importing all metadata: {e}", "Import Error", wx.OK | wx.ICON_ERROR)
@@ -1994,13 +2207,22 @@ You can safely continue working."""
                 self.visual_editor._modified = True
             else:
                 # Markdown mode - insert text as-is
-                current = self._get_note_content()
-                if current and not current.endswith("\n"):
-                    current += "\n"
-                current += "\n" + text
-                self._set_note_content(current)
-                if self.text_editor:
-                    self.text_editor.SetInsertionPointEnd()
+                editor = self.text_editor
+                if editor:
+                    # Append in place: no full-buffer GetValue/SetValue copy.
+                    # New text picks up the editor's default style, so no restyle.
+                    last = editor.GetLastPosition()
+                    sep = "\n"
+                    if last > 0 and editor.GetRange(last - 1, last) != "\n":
+                        sep = "\n\n"
+                    editor.AppendText(sep + text)
+                    editor.SetInsertionPointEnd()
+                else:
+                    current = self._get_note_content()
+                    if current and not current.endswith("\n"):
+                        current += "\n"
+                    current += "\n" + text
+                    self._set_note_content(current)
             
             # Switch to notes tab
             self._show_tab(0)
@@ -2039,7 +2261,8 @@ You can safely continue working."""
             pass
     
     def _on_text_changed(self, event):
-        self._modified = True
+        if not self._suppress_text_event:
+            self._notes_dirty = True
         event.Skip()
     
     def _on_text_click(self, event):
@@ -2051,7 +2274,7 @@ You can safely continue working."""
             pos = self.text_editor.HitTestPos(event.GetPosition())[1]
             if pos >= 0:
                 text = self.text_editor.GetValue()
-                word = self._get_word_at_pos(text, pos)
+                word = get_word_at_pos(text, pos)
                 if word.startswith("@"):
                     self._highlight_component(word[1:])
                     return
@@ -2059,16 +2282,6 @@ You can safely continue working."""
             pass
         event.Skip()
     
-    def _get_word_at_pos(self, text, pos):
-        if pos < 0 or pos >= len(text):
-            return ""
-        start = end = pos
-        while start > 0 and (text[start-1].isalnum() or text[start-1] in "@_"):
-            start -= 1
-        while end < len(text) and (text[end].isalnum() or text[end] in "@_"):
-            end += 1
-        return text[start:end]
-    
     def _highlight_component(self, ref):
         """Highlight component in PCB."""
         try:
@@ -2081,46 +2294,100 @@ You can safely continue working."""
     # DATA MANAGEMENT
     # ============================================================
     
-    def _start_auto_save_timer(self):
-        """Start auto-save timer - uses configurable interval from settings."""
+    def _start_auto_save(self):
+        """Start idle-driven auto-save - uses configurable interval from settings.
+        
+        Saving happens from EVT_IDLE once content is modified and at least
+        one interval has passed since the last save, so an untouched panel
+        does no periodic work. The stopwatch display timer only runs while
+        a task timer is running (see _sync_display_timer).
+        """
         try:
             # Load interval from settings, fallback to default
-            settings = self.notes_manager.load_settings() or {}
+            settings = self._get_settings()
             self._timer_interval_ms = settings.get('timer_interval_ms', PERFORMANCE_DEFAULTS['timer_interval_ms'])
             # Enforce min/max bounds
             self._timer_interval_ms = max(PERFORMANCE_DEFAULTS['timer_min_ms'], 
                                           min(self._timer_interval_ms, PERFORMANCE_DEFAULTS['timer_max_ms']))
             
-            self._auto_save_timer = wx.Timer(self)
-            self.Bind(wx.EVT_TIMER, self._on_auto_save, self._auto_save_timer)
-            self._auto_save_timer.Start(self._timer_interval_ms)
-            debug_print(f"[KiNotes] Auto-save timer started: {self._timer_interval_ms}ms interval")
+            self._last_save_ts = time.monotonic()
+            self.Bind(wx.EVT_IDLE, self._on_idle_save)
+            
+            self._display_timer = wx.Timer(self)
+            self.Bind(wx.EVT_TIMER, self._on_display_tick, self._display_timer)
+            self.Bind(wx.EVT_SHOW, self._on_panel_show)
+            
+            self._todo_save_timer = wx.Timer(self)
+            self.Bind(wx.EVT_TIMER, lambda e: self._save_todos(), self._todo_save_timer)
+            self._refresh_time_displays()
+            debug_print(f"[KiNotes] Idle auto-save enabled: {self._timer_interval_ms}ms interval")
         except:
             pass
     
-    def _on_auto_save(self, event):
-        """Auto-save if modified and update timer displays."""
-        # Update timer displays
-        self._timer_update_tick += 1
+    def _on_idle_save(self, event):
+        """Save when idle, modified, and the save interval has elapsed."""
+        event.Skip()
+        if not (self._notes_dirty or self._vlog_dirty):
+            return
         
-        # Update timer display every tick (timer already throttled by interval)
-        self._update_timer_displays()
+        remaining_ms = self._timer_interval_ms - (time.monotonic() - self._last_save_ts) * 1000
+        if remaining_ms > 0:
+            # Not due yet - make sure an idle event arrives once it is
+            if self._save_wakeup is None:
+                self._save_wakeup = wx.CallLater(int(remaining_ms) + 1, self._on_save_wakeup)
+            return
         
-        # Update global timer display
+        # Only write the channels that changed; todos save on their own debounce
         try:
-            self.global_time_label.SetLabel(self.time_tracker.get_total_time_string())
+            if self._notes_dirty:
+                self._save_notes()
+                self._notes_dirty = False
+            if self._vlog_dirty:
+                self._save_version_log()
+        except:
+            pass
+        self._last_save_ts = time.monotonic()
+    
+    def _on_save_wakeup(self):
+        """Re-trigger idle processing for a deferred auto-save."""
+        self._save_wakeup = None
+        wx.WakeUpIdle()
+    
+    def _on_display_tick(self, event):
+        """Refresh stopwatch labels while a task timer is running."""
+        if self.IsShownOnScreen():
+            self._refresh_time_displays()
+        else:
+            # Nobody can see the labels - catch up once we are shown again
+            self._pending_refresh = True
+        self._sync_display_timer()
+    
+    def _on_panel_show(self, event):
+        """Replay a time label refresh skipped while the panel was hidden."""
+        event.Skip()
+        if event.IsShown() and self._pending_refresh:
+            self._pending_refresh = False
+            self._refresh_time_displays()
+    
+    def _refresh_time_displays(self):
+        """Update per-task timer labels and the global time label."""
+        now = time.time()
+        self._update_timer_displays(now)
+        try:
+            self.global_time_label.SetLabel(self.time_tracker.get_total_time_string(now))
         except:
             pass
-        
-        # Save if content modified
-        if self._modified:
-            try:
-                self._save_notes()
-                self._save_todos()
-                self._modified = False
-            except:
-                pass
-        self._timer_update_tick = 0
+    
+    def _sync_display_timer(self):
+        """Run the display timer only while some task timer is running."""
+        timer = self._display_timer
+        if not timer:
+            return
+        running = self.time_tracker.current_running_task_id is not None
+        if running and not timer.IsRunning():
+            timer.Start(self._timer_interval_ms)
+        elif not running and timer.IsRunning():
+            timer.Stop()
     
     def _load_all_data(self):
         """Load saved data."""
@@ -2134,42 +2401,53 @@ You can safely continue working."""
         
         try:
             todos = self.notes_manager.load_todos()
-            if todos:
-                for todo in todos:
-                    time_spent = todo.get("time_spent", 0)
-                    history = todo.get("history", [])
-                    self._add_todo_item(
-                        todo.get("text", ""), 
-                        todo.get("done", False),
-                        time_spent,
-                        history
-                    )
+            if self._is_tab_built(1):
+                self._load_todo_items(todos)
             else:
-                # Create 3 default template tasks for new projects
-                self._add_todo_item("Schematic Review", False)
-                self._add_todo_item("Layout Check", False)
-                self._add_todo_item("Design Verification", False)
-                self._save_todos()  # Save defaults
+                # Widgets are created when the Todo tab is first shown
+                self._pending_todos = todos
         except:
             pass
         
-        # Load version log
+        # Load version log (otherwise read when its tab is first shown)
         try:
-            self._load_version_log()
+            if self._is_tab_built(3):
+                self._load_version_log()
         except:
             pass
         
-        self._modified = False
+        self._notes_dirty = False
+        self._vlog_dirty = False
+        self._data_loaded = True
     
     def _save_notes(self):
         """Save notes."""
+        if not self._data_loaded:
+            return
         try:
             self.notes_manager.save(self._get_note_content())
         except:
             pass
     
+    def _schedule_todo_save(self):
+        """Save todos once typing pauses instead of on every keystroke."""
+        if self._todo_save_timer:
+            self._todo_save_timer.StartOnce(PERFORMANCE_DEFAULTS['todo_save_debounce_ms'])
+        else:
+            self._save_todos()
+    
+    def _flush_todo_save(self):
+        """Write a pending debounced todo save right away."""
+        if self._todo_save_timer and self._todo_save_timer.IsRunning():
+            self._save_todos()
+    
     def _save_todos(self):
         """Save todos with time tracking data."""
+        if self._todo_save_timer:
+            self._todo_save_timer.Stop()  # This save covers any pending one
+        if not self._data_loaded or not self._is_tab_built(1):
+            # Not loaded yet, or Todo tab never opened - nothing to write
+            return
         try:
             todos = []
             for item in self._todo_items:
@@ -2188,6 +2466,8 @@ You can safely continue working."""
     
     def force_save(self):
         """Force save all data with full error protection."""
+        if not self._data_loaded:
+            return
         try:
             self._save_notes()
         except Exception as e:
@@ -2206,6 +2486,7 @@ You can safely continue working."""
         try:
             # CRITICAL: Save settings to prevent corruption on restart
             self._save_color_settings()
+            self._flush_settings()
         except Exception as e:
             print(f"[KiNotes] Settings save error: {e}")
         
@@ -2228,17 +2509,34 @@ You can safely continue working."""
         except Exception as e:
             print(f"[KiNotes] Task timer cleanup error: {e}")
         
-        # 2. Stop auto-save timer
+        # 2. Stop display timer and pending auto-save wakeup
+        try:
+            if self._display_timer:
+                self._display_timer.Stop()
+                self._display_timer = None
+            if self._save_wakeup:
+                self._save_wakeup.Stop()
+                self._save_wakeup = None
+            if self._todo_save_timer:
+                self._todo_save_timer.Stop()  # force_save below writes todos
+                self._todo_save_timer = None
+            self._flush_settings()  # Settings don't wait for _data_loaded
+            print("[KiNotes] Display timer stopped")
+        except Exception as e:
+            print(f"[KiNotes] Display timer cleanup error: {e}")
+        
+        # Cached settings dialog
         try:
-            if hasattr(self, '_auto_save_timer') and self._auto_save_timer:
-                self._auto_save_timer.Stop()
-                self._auto_save_timer = None
-                print("[KiNotes] Auto-save timer stopped")
+            if self._settings_dlg:
+                self._settings_dlg.Destroy()
+                self._settings_dlg = None
         except Exception as e:
-            print(f"[KiNotes] Auto-save timer cleanup error: {e}")
+            print(f"[KiNotes] Settings dialog cleanup warning: {e}")
         
         # 3. Unbind all event handlers
         try:
+            self.Unbind(wx.EVT_IDLE)
+            self.Unbind(wx.EVT_SHOW)
             self.Unbind(wx.EVT_TIMER)
             self.Unbind(wx.EVT_TEXT)
             self.Unbind(wx.EVT_TEXT_ENTER)
@@ -35,6 +35,15 @@ except ImportError:
             pass
 
 
+# Inline Markdown patterns - compiled once, used for every parsed line
+_INLINE_BOLD_LINK = re.compile(r'\*\*\[([^\]]+)\]\(([^)]+)\)\*\*')  # **[text](url)**
+_INLINE_ITALIC_LINK = re.compile(r'(?<!\*)\*(?!\*)\[([^\]]+)\]\(([^)]+)\)\*(?!\*)')  # *[text](url)*
+_INLINE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')  # [text](url)
+_INLINE_BOLD = re.compile(r'\*\*([^*\[\]]+?)\*\*')  # **text**
+_INLINE_ITALIC = re.compile(r'(?<!\*)\*(?!\*)([^*\[\]]+?)\*(?!\*)')  # *text*
+_INLINE_CODE = re.compile(r'`([^`]+)`')  # `text`
+
+
 # ============================================================
 # DATA STRUCTURES
 # ============================================================
@@ -241,20 +250,13 @@ class MarkdownParser:
         # Handle nested formatting: **[text](url)** or *[text](url)*
         # Strategy: Process outer formatting first, then inner
         
-        import re
-        
-        # Pattern for bold link: **[text](url)** 
-        bold_link_pattern = re.compile(r'\*\*\[([^\]]+)\]\(([^)]+)\)\*\*')
-        # Pattern for italic link: *[text](url)*
-        italic_link_pattern = re.compile(r'(?<!\*)\*(?!\*)\[([^\]]+)\]\(([^)]+)\)\*(?!\*)')
-        # Pattern for plain link: [text](url)
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-        # Pattern for bold: **text**
-        bold_pattern = re.compile(r'\*\*([^*\[\]]+?)\*\*')
-        # Pattern for italic: *text*
-        italic_pattern = re.compile(r'(?<!\*)\*(?!\*)([^*\[\]]+?)\*(?!\*)')
-        # Pattern for code: `text`
-        code_pattern = re.compile(r'`([^`]+)`')
+        # Patterns are compiled once at module level (see _INLINE_* below imports)
+        bold_link_pattern = _INLINE_BOLD_LINK
+        italic_link_pattern = _INLINE_ITALIC_LINK
+        link_pattern = _INLINE_LINK
+        bold_pattern = _INLINE_BOLD
+        italic_pattern = _INLINE_ITALIC
+        code_pattern = _INLINE_CODE
         
         pos = 0
         while pos < len(text):
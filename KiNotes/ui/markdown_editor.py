@@ -48,6 +48,29 @@ except ImportError:
         }
         EDITOR_LAYOUT = {'margin_left': 12, 'margin_right': 8, 'padding_horizontal': 4, 'padding_bottom': 4}
 
+# Designator/word under the cursor: letters, digits, "_" and "@"
+_WORD_RE = re.compile(r"[@\w]+")
+_WORD_WINDOW = 64
+
+
+def get_word_at_pos(text: str, pos: int) -> str:
+    """Get the word at a text position, "" if there is none.
+    
+    Shared with the main panel's Markdown-mode click handler.
+    """
+    if pos < 0 or pos >= len(text):
+        return ""
+    # Regex over a small window instead of a Python-level char scan;
+    # a word touching pos on either side counts (as the old scan did)
+    w_start = max(0, pos - _WORD_WINDOW)
+    rel = pos - w_start
+    for m in _WORD_RE.finditer(text, w_start, pos + _WORD_WINDOW):
+        if m.start() - w_start > rel:
+            break
+        if rel <= m.end() - w_start:
+            return m.group()
+    return ""
+
 
 class MarkdownEditor(wx.Panel):
     """
@@ -266,7 +289,7 @@ class MarkdownEditor(wx.Panel):
             pos = self._editor.HitTestPos(event.GetPosition())[1]
             if pos >= 0:
                 text = self._editor.GetValue()
-                word = self._get_word_at_pos(text, pos)
+                word = get_word_at_pos(text, pos)
                 if word.startswith("@"):
                     self._designator_linker.highlight(word[1:])
                     return
@@ -274,17 +297,6 @@ class MarkdownEditor(wx.Panel):
             pass
         event.Skip()
     
-    def _get_word_at_pos(self, text: str, pos: int) -> str:
-        """Get word at text position."""
-        if pos < 0 or pos >= len(text):
-            return ""
-        start = end = pos
-        while start > 0 and (text[start-1].isalnum() or text[start-1] in "@_"):
-            start -= 1
-        while end < len(text) and (text[end].isalnum() or text[end] in "@_"):
-            end += 1
-        return text[start:end]
-    
     def _on_key_down(self, event):
         """Handle keyboard shortcuts for formatting."""
         keycode = event.GetKeyCode()
@@ -8,12 +8,68 @@ This mixin provides:
 
 import wx
 import wx.lib.scrolledpanel as scrolled
-import datetime
+import fnmatch
+import functools
 import re
+import time
+from operator import itemgetter
+
+try:
+    import pcbnew
+    HAS_PCBNEW = True
+except ImportError:
+    HAS_PCBNEW = False
+    pcbnew = None
 
-from ..themes import hex_to_colour
 from ..components.buttons import RoundedButton
 
+_GLOB_CHARS = "*?["
+
+# Optional BOM table columns in output order: (header, row template field)
+_BOM_COLUMNS = (
+    ("Qty", "{qty}"),
+    ("Value", "{value}"),
+    ("Footprint", "{footprint}"),
+    ("References", "{refs}"),
+)
+
+# Slots of a BOM group list: [refs, value, footprint, natural sort key]
+_G_REFS, _G_VALUE, _G_FP, _G_SORTKEY = range(4)
+
+_NAT_SPLIT = re.compile(r"(\d+)").split
+
+# Large enough for panelized boards: a cache smaller than the ref count
+# evicts every entry before it is reused and only adds overhead.
+_NAT_KEY_CACHE_SIZE = 32768
+
+
+@functools.lru_cache(maxsize=_NAT_KEY_CACHE_SIZE)
+def _natural_key(s):
+    """Sort key that orders R2 before R10. Cached - refs repeat across sorts."""
+    return tuple([int(c) if c.isdigit() else c.lower() for c in _NAT_SPLIT(s)])
+
+
+def _split_blacklist(patterns):
+    """Split upper-cased blacklist globs by how cheaply they can be matched.
+    
+    Returns (literals, prefixes, glob_match): exact names as a set, "PREFIX*"
+    patterns as a tuple usable with str.startswith, and everything else
+    compiled into one regex match function (None if there are none).
+    """
+    literals = set()
+    prefixes = []
+    globs = []
+    for pattern in patterns:
+        pattern = pattern.upper()
+        if not any(c in pattern for c in _GLOB_CHARS):
+            literals.add(pattern)
+        elif pattern.endswith("*") and not any(c in pattern[:-1] for c in _GLOB_CHARS):
+            prefixes.append(pattern[:-1])
+        else:
+            globs.append(fnmatch.translate(pattern))
+    glob_match = re.compile("|".join(globs)).match if globs else None
+    return literals, tuple(prefixes), glob_match
+
 
 class BomTabMixin:
     """Mixin class providing BOM tab functionality.
@@ -33,37 +89,29 @@ class BomTabMixin:
     def _create_bom_tab(self, parent):
         """Create BOM Tool tab."""
         panel = scrolled.ScrolledPanel(parent)
-        panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        panel.SetBackgroundColour(self._colour_cache["bg_panel"])
         panel.SetupScrolling(scroll_x=False)
         sizer = wx.BoxSizer(wx.VERTICAL)
         sizer.AddSpacer(20)
         
-        # Section helper
+        # Section helper - one StaticBox per section holds the title and the
+        # checkboxes, instead of a header label plus a shaded option panel
         def add_section(title, checkboxes):
-            header = wx.StaticText(panel, label=title)
-            header.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-            header.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-            sizer.Add(header, 0, wx.LEFT | wx.BOTTOM, 16)
-            
-            opt_panel = wx.Panel(panel)
-            # Use darker shade for section panels in both modes
-            if self._dark_mode:
-                opt_panel.SetBackgroundColour(hex_to_colour("#2D2D2D"))
-            else:
-                opt_panel.SetBackgroundColour(hex_to_colour("#F5F5F5"))
-            opt_sizer = wx.BoxSizer(wx.VERTICAL)
+            box_sizer = wx.StaticBoxSizer(wx.VERTICAL, panel, title)
+            box = box_sizer.GetStaticBox()
+            box.SetForegroundColour(self._colour_cache["text_secondary"])
+            box.SetFont(self._font(9, wx.FONTWEIGHT_BOLD))
             
             widgets = []
             for label, default in checkboxes:
-                cb = wx.CheckBox(opt_panel, label="  " + label)
+                cb = wx.CheckBox(box, label="  " + label)
                 cb.SetValue(default)
-                cb.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-                cb.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-                opt_sizer.Add(cb, 0, wx.ALL, 12)
+                cb.SetForegroundColour(self._colour_cache["text_primary"])
+                cb.SetFont(self._font(10))
+                box_sizer.Add(cb, 0, wx.ALL, 12)
                 widgets.append(cb)
             
-            opt_panel.SetSizer(opt_sizer)
-            sizer.Add(opt_panel, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 16)
+            sizer.Add(box_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 16)
             return widgets
         
         # Columns section
@@ -87,8 +135,8 @@ class BomTabMixin:
         
         # Grouping
         grp_header = wx.StaticText(panel, label="GROUPING")
-        grp_header.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        grp_header.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        grp_header.SetForegroundColour(self._colour_cache["text_secondary"])
+        grp_header.SetFont(self._font(9, wx.FONTWEIGHT_BOLD))
         sizer.Add(grp_header, 0, wx.LEFT | wx.BOTTOM, 16)
         
         self.bom_group_by = wx.Choice(panel, choices=[
@@ -98,14 +146,14 @@ class BomTabMixin:
             "No grouping"
         ])
         self.bom_group_by.SetSelection(0)
-        self.bom_group_by.SetBackgroundColour(hex_to_colour(self._theme["bg_button"]))
-        self.bom_group_by.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self.bom_group_by.SetBackgroundColour(self._colour_cache["bg_button"])
+        self.bom_group_by.SetForegroundColour(self._colour_cache["text_primary"])
         sizer.Add(self.bom_group_by, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 16)
         
         # Sort
         sort_header = wx.StaticText(panel, label="SORT BY")
-        sort_header.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        sort_header.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        sort_header.SetForegroundColour(self._colour_cache["text_secondary"])
+        sort_header.SetFont(self._font(9, wx.FONTWEIGHT_BOLD))
         sizer.Add(sort_header, 0, wx.LEFT | wx.BOTTOM, 16)
         
         self.bom_sort_by = wx.Choice(panel, choices=[
@@ -115,14 +163,14 @@ class BomTabMixin:
             "Quantity"
         ])
         self.bom_sort_by.SetSelection(0)
-        self.bom_sort_by.SetBackgroundColour(hex_to_colour(self._theme["bg_button"]))
-        self.bom_sort_by.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
+        self.bom_sort_by.SetBackgroundColour(self._colour_cache["bg_button"])
+        self.bom_sort_by.SetForegroundColour(self._colour_cache["text_primary"])
         sizer.Add(self.bom_sort_by, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 16)
         
         # Blacklist
         bl_header = wx.StaticText(panel, label="CUSTOM BLACKLIST (one per line)")
-        bl_header.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        bl_header.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        bl_header.SetForegroundColour(self._colour_cache["text_secondary"])
+        bl_header.SetFont(self._font(9, wx.FONTWEIGHT_BOLD))
         sizer.Add(bl_header, 0, wx.LEFT | wx.BOTTOM, 16)
         
         self.bom_blacklist = wx.TextCtrl(panel, style=wx.TE_MULTILINE, size=(-1, 80))
@@ -154,13 +202,19 @@ class BomTabMixin:
         try:
             bom_text = self._generate_bom_text()
             if bom_text:
-                current = self._get_note_content()
-                if current and not current.endswith("\n"):
-                    current += "\n"
-                current += "\n" + bom_text
-                self._set_note_content(current)
+                parts = [self._get_note_content()]
+                if parts[0] and not parts[0].endswith("\n"):
+                    parts.append("\n")
+                parts.append("\n")
+                parts.append(bom_text)
+                content = "".join(parts)
                 if self.text_editor:
+                    # ChangeValue: no EVT_TEXT round-trip; flag the edit directly
+                    self.text_editor.ChangeValue(content)
                     self.text_editor.SetInsertionPointEnd()
+                else:
+                    self._set_note_content(content)
+                self._notes_dirty = True
                 self._apply_editor_colors()
                 self._show_tab(0)
         except Exception as e:
@@ -168,10 +222,7 @@ class BomTabMixin:
     
     def _generate_bom_text(self):
         """Generate BOM text."""
-        try:
-            import pcbnew
-            import fnmatch
-        except ImportError:
+        if not HAS_PCBNEW:
             return "## BOM\n\n*pcbnew not available*\n"
         
         try:
@@ -193,116 +244,121 @@ class BomTabMixin:
         if custom_bl:
             blacklist.extend([p.strip() for p in custom_bl.split("\n") if p.strip()])
         
-        components = []
+        bl_literals, bl_prefixes, bl_glob_match = _split_blacklist(blacklist)
+        
+        # Read checkbox state once - GetValue() is a native call per footprint otherwise.
+        # Both exclusions fold into one attribute mask (0 when neither applies).
+        exclude_mask = 0
+        if self.bom_exclude_dnp.GetValue():
+            exclude_mask |= getattr(pcbnew, "FP_EXCLUDE_FROM_BOM", 0)
+        if self.bom_exclude_virtual.GetValue():
+            exclude_mask |= getattr(pcbnew, "FP_BOARD_ONLY", 0)
+        
+        # Group while iterating - plain lists, not dicts: only index access
+        # in the hot loop. Group list slots are the _G_* constants.
+        group_mode = self.bom_group_by.GetSelection()
+        grouped = {}
+        total = 0
         try:
             for fp in board.GetFootprints():
-                ref = fp.GetReference()
-                value = fp.GetValue()
-                footprint = fp.GetFPIDAsString().split(":")[-1] if fp.GetFPIDAsString() else ""
-                
-                if self.bom_exclude_dnp.GetValue():
+                # Attribute exclusions first - skipped parts never pay for
+                # the GetReference() call
+                if exclude_mask:
                     try:
-                        attrs = fp.GetAttributes()
-                        if hasattr(pcbnew, "FP_EXCLUDE_FROM_BOM") and (attrs & pcbnew.FP_EXCLUDE_FROM_BOM):
+                        if fp.GetAttributes() & exclude_mask:
                             continue
                     except:
                         pass
                 
-                if self.bom_exclude_virtual.GetValue():
-                    try:
-                        attrs = fp.GetAttributes()
-                        if hasattr(pcbnew, "FP_BOARD_ONLY") and (attrs & pcbnew.FP_BOARD_ONLY):
-                            continue
-                    except:
-                        pass
+                ref = fp.GetReference()
                 
-                skip = False
-                for pattern in blacklist:
-                    if fnmatch.fnmatch(ref.upper(), pattern.upper()):
-                        skip = True
-                        break
-                if skip:
+                # Exact names and plain "PREFIX*" patterns skip the regex entirely
+                ref_upper = ref.upper()
+                if ref_upper in bl_literals or ref_upper.startswith(bl_prefixes):
+                    continue
+                if bl_glob_match and bl_glob_match(ref_upper):
                     continue
                 
-                components.append({"ref": ref, "value": value, "footprint": footprint})
+                # Value/footprint are only fetched for parts that survive the filters
+                value = fp.GetValue()
+                fpid = fp.GetFPIDAsString()
+                footprint = fpid.split(":")[-1] if fpid else ""
+                
+                if group_mode == 0:
+                    key = (value, footprint)
+                elif group_mode == 1:
+                    key = (value, "")
+                elif group_mode == 2:
+                    key = ("", footprint)
+                else:
+                    key = (ref, value, footprint)
+                
+                # get() rather than setdefault(): setdefault would build a new
+                # group list for every footprint just to throw most away
+                group = grouped.get(key)
+                if group is None:
+                    group = grouped[key] = [[], value, footprint, None]
+                group[_G_REFS].append(ref)
+                total += 1
         except:
             return "## BOM\n\n*Error reading components*\n"
         
-        if not components:
+        if not grouped:
             return "## BOM\n\n*No components found*\n"
         
-        # Group
-        group_mode = self.bom_group_by.GetSelection()
-        grouped = {}
-        
-        for comp in components:
-            if group_mode == 0:
-                key = (comp["value"], comp["footprint"])
-            elif group_mode == 1:
-                key = (comp["value"], "")
-            elif group_mode == 2:
-                key = ("", comp["footprint"])
-            else:
-                key = (comp["ref"], comp["value"], comp["footprint"])
-            
-            if key not in grouped:
-                grouped[key] = {"refs": [], "value": comp["value"], "footprint": comp["footprint"]}
-            grouped[key]["refs"].append(comp["ref"])
-        
-        # Sort refs naturally
-        def natural_key(s):
-            return [int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", s)]
-        
-        for data in grouped.values():
-            data["refs"].sort(key=natural_key)
+        # Sort refs naturally; the first ref's key doubles as the group sort key
+        for group in grouped.values():
+            refs = group[_G_REFS]
+            refs.sort(key=_natural_key)
+            group[_G_SORTKEY] = _natural_key(refs[0])
         
-        # Sort groups
+        # Sort groups. dicts keep insertion order, so items arrive in board
+        # order - usually close to ref order, which list.sort() handles in
+        # near-linear time for the default sort-by-ref mode.
         sort_mode = self.bom_sort_by.GetSelection()
         items = list(grouped.values())
         
         if sort_mode == 0:
-            items.sort(key=lambda x: natural_key(x["refs"][0]))
+            items.sort(key=itemgetter(_G_SORTKEY))
         elif sort_mode == 1:
-            items.sort(key=lambda x: x["value"].lower())
+            items.sort(key=lambda g: g[_G_VALUE].lower())
         elif sort_mode == 2:
-            items.sort(key=lambda x: x["footprint"].lower())
+            items.sort(key=lambda g: g[_G_FP].lower())
         elif sort_mode == 3:
-            items.sort(key=lambda x: -len(x["refs"]))
+            items.sort(key=lambda g: -len(g[_G_REFS]))
         
-        # Build output
-        lines = ["## BOM - " + datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), ""]
+        # Build output (the dated title is prepended at the end)
+        lines = []
         
-        # Header
-        header_parts = []
-        if self.bom_show_qty.GetValue():
-            header_parts.append("Qty")
-        if self.bom_show_value.GetValue():
-            header_parts.append("Value")
-        if self.bom_show_fp.GetValue():
-            header_parts.append("Footprint")
-        if self.bom_show_refs.GetValue():
-            header_parts.append("References")
+        # Header and row template are chosen once from the column checkboxes
+        column_flags = (self.bom_show_qty, self.bom_show_value, self.bom_show_fp, self.bom_show_refs)
+        shown_flags = [cb.GetValue() for cb in column_flags]
+        shown = [col for col, on in zip(_BOM_COLUMNS, shown_flags) if on]
+        header_parts = [name for name, _ in shown]
+        row_template = "| " + " | ".join(field for _, field in shown) + " |"
+        show_refs = shown_flags[3]
         
         lines.append("| " + " | ".join(header_parts) + " |")
         lines.append("|" + "|".join(["---"] * len(header_parts)) + "|")
         
-        for item in items:
-            row = []
-            if self.bom_show_qty.GetValue():
-                row.append(str(len(item["refs"])))
-            if self.bom_show_value.GetValue():
-                row.append(item["value"])
-            if self.bom_show_fp.GetValue():
-                row.append(item["footprint"])
-            if self.bom_show_refs.GetValue():
-                refs_str = ", ".join(["@" + r for r in item["refs"][:5]])
-                if len(item["refs"]) > 5:
-                    refs_str += " +" + str(len(item["refs"])-5) + " more"
-                row.append(refs_str)
-            lines.append("| " + " | ".join(row) + " |")
+        # Column choice is fixed for the whole table, so branch once here
+        # rather than per row; the template already drops hidden columns
+        append = lines.append
+        format_row = row_template.format
+        if show_refs:
+            for refs, value, footprint, _ in items:
+                # One join, no per-ref "@" + r temporaries
+                refs_str = "@" + ", @".join(refs[:5])
+                if len(refs) > 5:
+                    refs_str = "%s +%d more" % (refs_str, len(refs) - 5)
+                append(format_row(qty=len(refs), value=value, footprint=footprint, refs=refs_str))
+        else:
+            for refs, value, footprint, _ in items:
+                append(format_row(qty=len(refs), value=value, footprint=footprint, refs=""))
         
         lines.append("")
         lines.append("**Total unique groups:** " + str(len(items)))
-        lines.append("**Total components:** " + str(sum(len(i["refs"]) for i in items)))
+        lines.append("**Total components:** " + str(total))
         
-        return "\n".join(lines)
+        title = "## BOM - " + time.strftime("%Y-%m-%d %H:%M")
+        return title + "\n\n" + "\n".join(lines)
@@ -9,10 +9,11 @@ Provides todo list functionality including:
 - Task counter
 - Time tracking integration
 """
+import time
+
 import wx
 import wx.lib.scrolledpanel as scrolled
 
-from ..themes import hex_to_colour
 from ..components import RoundedButton, Icons
 
 
@@ -22,12 +23,12 @@ class TodoTabMixin:
     def _create_todo_tab(self, parent):
         """Create Todo tab with checkboxes."""
         panel = wx.Panel(parent)
-        panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        panel.SetBackgroundColour(self._colour_cache["bg_panel"])
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Toolbar
         toolbar = wx.Panel(panel)
-        toolbar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        toolbar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         toolbar.SetMinSize((-1, 60))
         tb_sizer = wx.BoxSizer(wx.HORIZONTAL)
         tb_sizer.AddSpacer(16)
@@ -45,8 +46,8 @@ class TodoTabMixin:
         
         # Counter
         self.todo_count = wx.StaticText(toolbar, label="0 / 0")
-        self.todo_count.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        self.todo_count.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.todo_count.SetForegroundColour(self._colour_cache["text_secondary"])
+        self.todo_count.SetFont(self._font(12, wx.FONTWEIGHT_BOLD))
         tb_sizer.Add(self.todo_count, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 20)
         
         toolbar.SetSizer(tb_sizer)
@@ -54,7 +55,7 @@ class TodoTabMixin:
         
         # Todo list scroll area
         self.todo_scroll = scrolled.ScrolledPanel(panel)
-        self.todo_scroll.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        self.todo_scroll.SetBackgroundColour(self._colour_cache["bg_panel"])
         self.todo_scroll.SetupScrolling(scroll_x=False)
         
         self.todo_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -65,8 +66,12 @@ class TodoTabMixin:
         panel.SetSizer(sizer)
         return panel
     
-    def _add_todo_item(self, text="", done=False, time_spent=0, history=None):
-        """Add a todo item with time tracking and expandable session memo."""
+    def _add_todo_item(self, text="", done=False, time_spent=0, history=None, defer_layout=False):
+        """Add a todo item with time tracking and expandable session memo.
+        
+        defer_layout: Skip the per-item FitInside/Layout/count refresh; the
+            caller must run _finish_todo_batch() once after a batch insert.
+        """
         item_id = self._todo_id_counter
         self._todo_id_counter += 1
         
@@ -81,27 +86,32 @@ class TodoTabMixin:
         if done:
             self.time_tracker.task_timers[item_id]["done"] = done
         
+        # Resolve theme colours once per row - this runs for every loaded todo
+        colours = self._colour_cache
+        container_bg = colours["bg_toolbar"]
+        fg_secondary = colours["text_secondary"]
+        
         # Main container panel - use theme colors
         container_panel = wx.Panel(self.todo_scroll)
-        container_bg = self._theme["bg_toolbar"]
-        memo_bg = self._theme["bg_button"]
         
         # Get user's custom editor colors (same as Notes panel)
         editor_bg = self._get_editor_bg()
         editor_text = self._get_editor_text()
         
-        container_panel.SetBackgroundColour(hex_to_colour(container_bg))
+        container_panel.SetBackgroundColour(container_bg)
         container_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # === ROW 1: Main task row ===
         item_panel = wx.Panel(container_panel)
-        item_panel.SetBackgroundColour(hex_to_colour(container_bg))
+        item_panel.SetBackgroundColour(container_bg)
         item_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
-        # Checkbox
+        # Checkbox. Row widgets carry their task id as .todo_id so every row
+        # binds the same handler methods instead of per-row lambdas
         cb = wx.CheckBox(item_panel)
         cb.SetValue(done)
-        cb.Bind(wx.EVT_CHECKBOX, lambda e, iid=item_id: self._on_todo_toggle(iid))
+        cb.todo_id = item_id
+        cb.Bind(wx.EVT_CHECKBOX, self._on_todo_toggle)
         item_sizer.Add(cb, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 14)
         item_sizer.AddSpacer(12)
         
@@ -112,7 +122,8 @@ class TodoTabMixin:
             fg_color="#FFFFFF",
             corner_radius=6, font_size=10, font_weight=wx.FONTWEIGHT_BOLD
         )
-        timer_btn.Bind_Click(lambda e, iid=item_id: self._on_timer_toggle(iid, None))
+        timer_btn.todo_id = item_id
+        timer_btn.Bind_Click(self._on_timer_toggle)
         item_sizer.Add(timer_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 12)
         
         # Text input - use user's custom editor colors (matches Notes panel)
@@ -121,31 +132,30 @@ class TodoTabMixin:
         txt.SetForegroundColour(editor_text)  # Set default text color first
         
         if done:
-            font = wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-            font.SetStrikethrough(True)
-            txt.SetFont(font)
-            txt.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
+            txt.SetFont(self._font(11, strikethrough=True))
+            txt.SetForegroundColour(fg_secondary)
         else:
-            txt.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            txt.SetFont(self._font(11))
         
         txt.Refresh()  # Force refresh to apply colors on Windows
         
-        txt.Bind(wx.EVT_TEXT, lambda e, iid=item_id: self._on_todo_text_change(iid))
-        txt.Bind(wx.EVT_TEXT_ENTER, lambda e: self._on_add_todo(None))
+        txt.todo_id = item_id
+        txt.Bind(wx.EVT_TEXT, self._on_todo_text_change)
+        txt.Bind(wx.EVT_TEXT_ENTER, self._on_add_todo)
         item_sizer.Add(txt, 1, wx.EXPAND | wx.ALL, 12)
         item_sizer.AddSpacer(12)
         
         # Timer label
         timer_label = wx.StaticText(item_panel, label="⏱ 00:00:00")
-        timer_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        timer_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        timer_label.SetForegroundColour(fg_secondary)
+        timer_label.SetFont(self._font(10))
         timer_label.SetMinSize((100, -1))
         item_sizer.Add(timer_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 10)
         
         # RTC session label
         rtc_label = wx.StaticText(item_panel, label="")
-        rtc_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        rtc_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        rtc_label.SetForegroundColour(fg_secondary)
+        rtc_label.SetFont(self._font(9))
         rtc_label.SetMinSize((140, -1))
         
         if history and len(history) > 0:
@@ -157,22 +167,60 @@ class TodoTabMixin:
         
         # Delete button - use theme colors
         del_btn = wx.Button(item_panel, label=Icons.DELETE, size=(40, 40), style=wx.BORDER_NONE)
-        del_btn.SetBackgroundColour(hex_to_colour(container_bg))
-        del_btn.SetForegroundColour(hex_to_colour(self._theme["accent_red"]))
-        del_btn.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-        del_btn.Bind(wx.EVT_BUTTON, lambda e, iid=item_id: self._on_delete_todo(iid))
+        del_btn.SetBackgroundColour(container_bg)
+        del_btn.SetForegroundColour(colours["accent_red"])
+        del_btn.SetFont(self._font(12))
+        del_btn.todo_id = item_id
+        del_btn.Bind(wx.EVT_BUTTON, self._on_delete_todo)
         item_sizer.Add(del_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         item_panel.SetSizer(item_sizer)
         container_sizer.Add(item_panel, 0, wx.EXPAND)
         
-        # === ROW 2: Session memo row - use theme colors ===
+        # ROW 2 (session memo) is built on first timer start - see _ensure_memo_row
+        
+        container_panel.SetSizer(container_sizer)
+        
+        item = {
+            "id": item_id,
+            "container": container_panel,
+            "panel": item_panel,
+            "memo_panel": None,
+            "memo_text": None,
+            "checkbox": cb,
+            "timer_switch": timer_btn,
+            "text": txt,
+            "timer_label": timer_label,
+            "rtc_label": rtc_label,
+            "del_btn": del_btn,
+            "done": done
+        }
+        self._todo_items.append(item)
+        self._todo_by_id[item_id] = item
+        
+        self.todo_sizer.Add(container_panel, 0, wx.EXPAND | wx.BOTTOM, 8)
+        if not defer_layout:
+            self._finish_todo_batch()
+        return txt
+    
+    def _ensure_memo_row(self, item):
+        """Build a task's session memo row the first time its timer starts.
+        
+        Most tasks are never timed, so creating the row up front would cost
+        three hidden native windows per task.
+        """
+        if item["memo_panel"]:
+            return
+        container_panel = item["container"]
+        editor_bg = self._get_editor_bg()
+        editor_text = self._get_editor_text()
+        
         memo_panel = wx.Panel(container_panel)
-        memo_panel.SetBackgroundColour(hex_to_colour(memo_bg))
+        memo_panel.SetBackgroundColour(self._colour_cache["bg_button"])
         memo_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
         memo_icon = wx.StaticText(memo_panel, label="📝")
-        memo_icon.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        memo_icon.SetFont(self._font(12))
         memo_sizer.Add(memo_icon, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 76)
         
         memo_txt = wx.TextCtrl(memo_panel, value="", style=wx.BORDER_SIMPLE)
@@ -180,50 +228,59 @@ class TodoTabMixin:
         # Use user's custom editor colors (matches Notes panel and task text)
         memo_txt.SetBackgroundColour(editor_bg)
         memo_txt.SetForegroundColour(editor_text)
-        memo_txt.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+        memo_txt.SetFont(self._font(10, style=wx.FONTSTYLE_ITALIC))
         memo_txt.Refresh()  # Force refresh to apply colors on Windows
-        memo_txt.Bind(wx.EVT_TEXT, lambda e, iid=item_id: self._on_memo_change(iid))
+        memo_txt.todo_id = item["id"]
+        memo_txt.Bind(wx.EVT_TEXT, self._on_memo_change)
         memo_sizer.Add(memo_txt, 1, wx.EXPAND | wx.ALL, 8)
         
         memo_panel.SetSizer(memo_sizer)
         memo_panel.Hide()
-        container_sizer.Add(memo_panel, 0, wx.EXPAND)
+        container_panel.GetSizer().Add(memo_panel, 0, wx.EXPAND)
         
-        container_panel.SetSizer(container_sizer)
-        
-        self._todo_items.append({
-            "id": item_id,
-            "container": container_panel,
-            "panel": item_panel,
-            "memo_panel": memo_panel,
-            "memo_text": memo_txt,
-            "checkbox": cb,
-            "timer_switch": timer_btn,
-            "text": txt,
-            "timer_label": timer_label,
-            "rtc_label": rtc_label,
-            "del_btn": del_btn,
-            "done": done
-        })
-        
-        self.todo_sizer.Add(container_panel, 0, wx.EXPAND | wx.BOTTOM, 8)
+        item["memo_panel"] = memo_panel
+        item["memo_text"] = memo_txt
+    
+    def _finish_todo_batch(self):
+        """Single layout pass after todo items were added or removed."""
         self.todo_scroll.FitInside()
         self.todo_scroll.Layout()
         self._update_todo_count()
-        return txt
-    
+
+    def _load_todo_items(self, todos):
+        """Populate the todo list from saved data, or default tasks if empty."""
+        # Batch insert: one Freeze/Thaw and a single layout pass at the end
+        self.todo_scroll.Freeze()
+        try:
+            if todos:
+                for todo in todos:
+                    self._add_todo_item(
+                        todo.get("text", ""),
+                        todo.get("done", False),
+                        todo.get("time_spent", 0),
+                        todo.get("history", []),
+                        defer_layout=True
+                    )
+            else:
+                # Create 3 default template tasks for new projects
+                self._add_todo_item("Schematic Review", False, defer_layout=True)
+                self._add_todo_item("Layout Check", False, defer_layout=True)
+                self._add_todo_item("Design Verification", False, defer_layout=True)
+        finally:
+            self.todo_scroll.Thaw()
+            self._finish_todo_batch()
+        if not todos:
+            self._save_todos()  # Save defaults
+
     def _on_add_todo(self, event):
         txt = self._add_todo_item()
         txt.SetFocus()
         self._save_todos()
     
-    def _on_timer_toggle(self, item_id, _unused):
+    def _on_timer_toggle(self, event):
         """Handle timer start/stop for a task."""
-        current_item = None
-        for item in self._todo_items:
-            if item["id"] == item_id:
-                current_item = item
-                break
+        item_id = event.GetEventObject().todo_id
+        current_item = self._todo_by_id.get(item_id)
         
         # Get current running state and toggle
         is_currently_running = self.time_tracker.is_task_running(item_id)
@@ -237,23 +294,22 @@ class TodoTabMixin:
             if current_item:
                 self._update_timer_button(current_item, True)
             
-            if prev_running is not None and prev_running != item_id:
-                for item in self._todo_items:
-                    if item["id"] == prev_running:
-                        self._update_timer_button(item, False)
-                        if "memo_panel" in item and item["memo_panel"]:
-                            memo_text = item["memo_text"].GetValue().strip()
-                            if memo_text:
-                                self._save_memo_to_last_session(prev_running, memo_text)
-                            item["memo_text"].SetValue("")
-                            item["memo_panel"].Hide()
-                        break
+            prev_item = self._todo_by_id.get(prev_running) if prev_running != item_id else None
+            if prev_item:
+                self._update_timer_button(prev_item, False)
+                if prev_item["memo_panel"]:
+                    memo_text = prev_item["memo_text"].GetValue().strip()
+                    if memo_text:
+                        self._save_memo_to_last_session(prev_running, memo_text)
+                    prev_item["memo_text"].SetValue("")
+                    prev_item["memo_panel"].Hide()
             
-            if current_item and "memo_panel" in current_item:
+            if current_item:
+                self._ensure_memo_row(current_item)
                 current_item["memo_panel"].Show()
                 current_item["container"].Layout()
         else:
-            if current_item and "memo_text" in current_item:
+            if current_item and current_item["memo_text"]:
                 memo_text = current_item["memo_text"].GetValue().strip()
                 if memo_text:
                     self.time_tracker.task_timers[item_id]["pending_memo"] = memo_text
@@ -264,7 +320,7 @@ class TodoTabMixin:
             if current_item:
                 self._update_timer_button(current_item, False)
             
-            if current_item and "memo_panel" in current_item:
+            if current_item and current_item["memo_panel"]:
                 current_item["memo_text"].SetValue("")
                 current_item["memo_panel"].Hide()
                 current_item["container"].Layout()
@@ -272,6 +328,7 @@ class TodoTabMixin:
         self.todo_scroll.FitInside()
         self.todo_scroll.Layout()
         self._update_timer_displays()
+        self._sync_display_timer()
         self._save_todos()
     
     def _update_timer_button(self, item, is_running):
@@ -282,12 +339,10 @@ class TodoTabMixin:
         
         if is_running:
             btn.label = "Stop"
-            btn.bg_color = hex_to_colour(self._theme["accent_red"])
-            btn.fg_color = hex_to_colour("#FFFFFF")
+            btn.SetColors(self._colour_cache["accent_red"], "#FFFFFF")
         else:
             btn.label = "Start"
-            btn.bg_color = hex_to_colour(self._theme["accent_green"])
-            btn.fg_color = hex_to_colour("#FFFFFF")
+            btn.SetColors(self._colour_cache["accent_green"], "#FFFFFF")
         btn.Refresh()
     
     def _save_memo_to_last_session(self, item_id, memo_text):
@@ -297,71 +352,64 @@ class TodoTabMixin:
             if history:
                 history[-1]["memo"] = memo_text
     
-    def _on_memo_change(self, item_id):
+    def _on_memo_change(self, event):
         """Handle memo text changes."""
         pass
     
-    def _on_todo_text_change(self, item_id):
+    def _on_todo_text_change(self, event):
         """Update timer text data when task text changes."""
-        for item in self._todo_items:
-            if item["id"] == item_id:
-                self.time_tracker.task_timers[item_id]["text"] = item["text"].GetValue()
-                break
-        self._save_todos()
+        item_id = event.GetEventObject().todo_id
+        item = self._todo_by_id.get(item_id)
+        if item:
+            self.time_tracker.task_timers[item_id]["text"] = item["text"].GetValue()
+        self._schedule_todo_save()
     
-    def _on_todo_toggle(self, item_id):
-        for item in self._todo_items:
-            if item["id"] == item_id:
-                item["done"] = item["checkbox"].GetValue()
-                
-                if item["done"]:
-                    self.time_tracker.mark_task_done(item_id)
-                    self._update_timer_button(item, False)  # Reset to "Start" state
-                    if "memo_panel" in item and item["memo_panel"]:
-                        item["memo_panel"].Hide()
-                        item["container"].Layout()
-                
-                font = wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-                if item["done"]:
-                    font.SetStrikethrough(True)
-                    item["text"].SetFont(font)
-                    item["text"].SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-                else:
-                    font.SetStrikethrough(False)
-                    item["text"].SetFont(font)
-                    # Use custom editor text color when unchecked
-                    item["text"].SetForegroundColour(self._get_editor_text())
-                
-                item["text"].Refresh()
-                break
+    def _on_todo_toggle(self, event):
+        item_id = event.GetEventObject().todo_id
+        item = self._todo_by_id.get(item_id)
+        if item:
+            item["done"] = item["checkbox"].GetValue()
+            
+            if item["done"]:
+                self.time_tracker.mark_task_done(item_id)
+                self._update_timer_button(item, False)  # Reset to "Start" state
+                if item["memo_panel"]:
+                    item["memo_panel"].Hide()
+                    item["container"].Layout()
+            
+            item["text"].SetFont(self._font(11, strikethrough=item["done"]))
+            if item["done"]:
+                item["text"].SetForegroundColour(self._colour_cache["text_secondary"])
+            else:
+                # Use custom editor text color when unchecked
+                item["text"].SetForegroundColour(self._get_editor_text())
+            
+            item["text"].Refresh()
         self._update_todo_count()
         self._save_todos()
     
-    def _on_delete_todo(self, item_id):
-        for i, item in enumerate(self._todo_items):
-            if item["id"] == item_id:
-                if "container" in item:
-                    item["container"].Destroy()
-                else:
-                    item["panel"].Destroy()
-                self._todo_items.pop(i)
-                self.time_tracker.delete_task(item_id)
-                break
-        self.todo_scroll.FitInside()
-        self._update_todo_count()
+    def _on_delete_todo(self, event):
+        item_id = event.GetEventObject().todo_id
+        item = self._todo_by_id.pop(item_id, None)
+        if item:
+            item["container"].Destroy()
+            self._todo_items.remove(item)
+            self.time_tracker.delete_task(item_id)
+        self._finish_todo_batch()
         self._save_todos()
     
     def _on_clear_done(self, event):
         to_remove = [item for item in self._todo_items if item["done"]]
-        for item in to_remove:
-            if "container" in item:
+        self.todo_scroll.Freeze()
+        try:
+            for item in to_remove:
                 item["container"].Destroy()
-            else:
-                item["panel"].Destroy()
-            self.time_tracker.delete_task(item["id"])
-            self._todo_items.remove(item)
-        self.todo_scroll.FitInside()
-        self._update_todo_count()
+                del self._todo_by_id[item["id"]]
+                self.time_tracker.delete_task(item["id"])
+            self._todo_items = [item for item in self._todo_items if not item["done"]]
+        finally:
+            self.todo_scroll.Thaw()
+        self._finish_todo_batch()
         self._save_todos()
     
     def _update_todo_count(self):
@@ -369,20 +417,31 @@ class TodoTabMixin:
         done = sum(1 for item in self._todo_items if item["done"])
         self.todo_count.SetLabel(str(done) + " / " + str(total))
     
-    def _update_timer_displays(self):
+    def _update_timer_displays(self, now=None):
         """Update all timer labels and RTC inline displays with current state."""
+        if now is None:
+            now = time.time()  # One clock read for every label in this pass
+        tracker = self.time_tracker
+        task_timers = tracker.task_timers
+        format_24h = tracker.time_format_24h
         for item in self._todo_items:
             item_id = item["id"]
             
-            time_str = self.time_tracker.get_task_time_string(item_id)
+            time_str = tracker.get_task_time_string(item_id, now)
             item["timer_label"].SetLabel(time_str)
             
-            rtc_str = self.time_tracker.get_last_session_string(item_id, self.time_tracker.time_format_24h)
+            # Session text only changes when a session starts/stops, not per tick
+            task_data = task_timers.get(item_id, {})
+            history = task_data.get("history", [])
+            session_key = (id(history), len(history), task_data.get("is_running", False), format_24h)
+            if item.get("session_key") == session_key:
+                continue
+            item["session_key"] = session_key
+            
+            rtc_str = tracker.get_last_session_string(item_id, format_24h)
             item["rtc_label"].SetLabel(rtc_str)
             
-            task_data = self.time_tracker.task_timers.get(item_id, {})
-            history = task_data.get("history", [])
-            if history and len(history) > 0:
-                tooltip_text = self.time_tracker.get_session_history_tooltip(item_id, self.time_tracker.time_format_24h)
+            if history:
+                tooltip_text = tracker.get_session_history_tooltip(item_id, format_24h)
                 if tooltip_text:
                     item["rtc_label"].SetToolTip(tooltip_text)
@@ -20,34 +20,36 @@ class VersionLogTabMixin:
     - self._dark_mode: bool
     - self._current_version: str
     - self._version_log_items: list
+    - self._version_log_by_id: dict, id -> entry of _version_log_items
     - self._version_log_id_counter: int
     - self.notes_manager: NotesManager instance
-    - self._modified: bool
+    - self._vlog_dirty: bool
+    - self._is_tab_built(idx): False until the tab (index 3) replaced its placeholder
     """
     
     def _create_version_log_tab(self, parent):
         """Create Version Log tab with changelog entries."""
         panel = wx.Panel(parent)
-        panel.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        panel.SetBackgroundColour(self._colour_cache["bg_panel"])
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Toolbar
         toolbar = wx.Panel(panel)
-        toolbar.SetBackgroundColour(hex_to_colour(self._theme["bg_toolbar"]))
+        toolbar.SetBackgroundColour(self._colour_cache["bg_toolbar"])
         toolbar.SetMinSize((-1, 60))
         tb_sizer = wx.BoxSizer(wx.HORIZONTAL)
         tb_sizer.AddSpacer(16)
         
         # Version display/edit
         ver_label = wx.StaticText(toolbar, label="Version:")
-        ver_label.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        ver_label.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        ver_label.SetForegroundColour(self._colour_cache["text_primary"])
+        ver_label.SetFont(self._font(11, wx.FONTWEIGHT_BOLD))
         tb_sizer.Add(ver_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         self.version_input = wx.TextCtrl(toolbar, value=self._current_version, size=(100, 32), style=wx.BORDER_SIMPLE)
-        self.version_input.SetBackgroundColour(hex_to_colour(self._theme["bg_button"]))
-        self.version_input.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        self.version_input.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.version_input.SetBackgroundColour(self._colour_cache["bg_button"])
+        self.version_input.SetForegroundColour(self._colour_cache["text_primary"])
+        self.version_input.SetFont(self._font(11, wx.FONTWEIGHT_BOLD))
         self.version_input.Bind(wx.EVT_TEXT, self._on_version_change)
         tb_sizer.Add(self.version_input, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 16)
         
@@ -73,8 +75,8 @@ class VersionLogTabMixin:
         
         # Entry counter
         self.version_log_count = wx.StaticText(toolbar, label="0 entries")
-        self.version_log_count.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        self.version_log_count.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.version_log_count.SetForegroundColour(self._colour_cache["text_secondary"])
+        self.version_log_count.SetFont(self._font(12, wx.FONTWEIGHT_BOLD))
         tb_sizer.Add(self.version_log_count, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 20)
         
         toolbar.SetSizer(tb_sizer)
@@ -82,7 +84,7 @@ class VersionLogTabMixin:
         
         # Scroll area for entries
         self.version_log_scroll = scrolled.ScrolledPanel(panel)
-        self.version_log_scroll.SetBackgroundColour(hex_to_colour(self._theme["bg_panel"]))
+        self.version_log_scroll.SetBackgroundColour(self._colour_cache["bg_panel"])
         self.version_log_scroll.SetupScrolling(scroll_x=False)
         
         self.version_log_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -93,8 +95,13 @@ class VersionLogTabMixin:
         panel.SetSizer(sizer)
         return panel
     
-    def _add_version_log_item(self, version="", change_type="Added", description="", date=""):
-        """Add a version log entry."""
+    def _add_version_log_item(self, version="", change_type="Added", description="", date="",
+                              defer_layout=False):
+        """Add a version log entry.
+        
+        defer_layout: Skip the per-entry FitInside/Layout/count refresh; the
+            caller must run _finish_version_log_batch() once afterwards.
+        """
         item_id = self._version_log_id_counter
         self._version_log_id_counter += 1
         
@@ -106,17 +113,17 @@ class VersionLogTabMixin:
         # Container panel
         container = wx.Panel(self.version_log_scroll)
         if self._dark_mode:
-            container_bg = "#3A3A3A"
-            input_bg = "#4A4A4A"
+            container_bg = hex_to_colour("#3A3A3A")
+            input_bg = hex_to_colour("#4A4A4A")
         else:
-            container_bg = "#FAFAFA"
-            input_bg = "#FFFFFF"
-        container.SetBackgroundColour(hex_to_colour(container_bg))
+            container_bg = hex_to_colour("#FAFAFA")
+            input_bg = hex_to_colour("#FFFFFF")
+        container.SetBackgroundColour(container_bg)
         container_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Row 1: Type selector + Description
         row1 = wx.Panel(container)
-        row1.SetBackgroundColour(hex_to_colour(container_bg))
+        row1.SetBackgroundColour(container_bg)
         row1_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
         # Change type dropdown (Keep a Changelog standard)
@@ -129,9 +136,9 @@ class VersionLogTabMixin:
         
         # Description input
         desc_input = wx.TextCtrl(row1, value=description, style=wx.BORDER_SIMPLE | wx.TE_PROCESS_ENTER)
-        desc_input.SetBackgroundColour(hex_to_colour(input_bg))
-        desc_input.SetForegroundColour(hex_to_colour(self._theme["text_primary"]))
-        desc_input.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        desc_input.SetBackgroundColour(input_bg)
+        desc_input.SetForegroundColour(self._colour_cache["text_primary"])
+        desc_input.SetFont(self._font(11))
         desc_input.SetHint("Describe the change...")
         desc_input.Bind(wx.EVT_TEXT, lambda e, iid=item_id: self._on_log_desc_change(iid))
         desc_input.Bind(wx.EVT_TEXT_ENTER, lambda e: self._on_add_version_log(None))
@@ -139,23 +146,23 @@ class VersionLogTabMixin:
         
         # Version label for this entry
         ver_label = wx.StaticText(row1, label=f"v{version}")
-        ver_label.SetForegroundColour(hex_to_colour(self._theme["accent_blue"]))
-        ver_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        ver_label.SetForegroundColour(self._colour_cache["accent_blue"])
+        ver_label.SetFont(self._font(10, wx.FONTWEIGHT_BOLD))
         ver_label.SetMinSize((70, -1))
         row1_sizer.Add(ver_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         # Date label
         date_label = wx.StaticText(row1, label=date[:10])
-        date_label.SetForegroundColour(hex_to_colour(self._theme["text_secondary"]))
-        date_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        date_label.SetForegroundColour(self._colour_cache["text_secondary"])
+        date_label.SetFont(self._font(9))
         date_label.SetMinSize((80, -1))
         row1_sizer.Add(date_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
         # Delete button
         del_btn = wx.Button(row1, label=Icons.DELETE, size=(40, 40), style=wx.BORDER_NONE)
-        del_btn.SetBackgroundColour(hex_to_colour(container_bg))
-        del_btn.SetForegroundColour(hex_to_colour(self._theme["accent_red"]))
-        del_btn.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        del_btn.SetBackgroundColour(container_bg)
+        del_btn.SetForegroundColour(self._colour_cache["accent_red"])
+        del_btn.SetFont(self._font(12))
         del_btn.Bind(wx.EVT_BUTTON, lambda e, iid=item_id: self._on_delete_version_log(iid))
         row1_sizer.Add(del_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 8)
         
@@ -163,7 +170,7 @@ class VersionLogTabMixin:
         container_sizer.Add(row1, 0, wx.EXPAND)
         container.SetSizer(container_sizer)
         
-        self._version_log_items.append({
+        item = {
             "id": item_id,
             "container": container,
             "type_choice": type_choice,
@@ -172,13 +179,20 @@ class VersionLogTabMixin:
             "date_label": date_label,
             "version": version,
             "date": date
-        })
+        }
+        self._version_log_items.append(item)
+        self._version_log_by_id[item_id] = item
         
         self.version_log_sizer.Add(container, 0, wx.EXPAND | wx.BOTTOM, 8)
+        if not defer_layout:
+            self._finish_version_log_batch()
+        return desc_input
+    
+    def _finish_version_log_batch(self):
+        """Single layout pass after version log entries were added."""
         self.version_log_scroll.FitInside()
         self.version_log_scroll.Layout()
         self._update_version_log_count()
-        return desc_input
     
     def _on_add_version_log(self, event):
         """Add new version log entry."""
@@ -197,15 +211,14 @@ class VersionLogTabMixin:
     
     def _on_log_desc_change(self, item_id):
         """Handle description text change."""
-        self._modified = True
+        self._vlog_dirty = True
     
     def _on_delete_version_log(self, item_id):
         """Delete a version log entry."""
-        for item in self._version_log_items:
-            if item["id"] == item_id:
-                item["container"].Destroy()
-                self._version_log_items.remove(item)
-                break
+        item = self._version_log_by_id.pop(item_id, None)
+        if item:
+            item["container"].Destroy()
+            self._version_log_items.remove(item)
         self.version_log_scroll.FitInside()
         self.version_log_scroll.Layout()
         self._update_version_log_count()
@@ -218,6 +231,8 @@ class VersionLogTabMixin:
     
     def _save_version_log(self):
         """Save version log to JSON."""
+        if not self._is_tab_built(3):
+            return  # Tab never opened - the file on disk is still current
         try:
             entries = []
             for item in self._version_log_items:
@@ -234,6 +249,7 @@ class VersionLogTabMixin:
                 "entries": entries
             }
             self.notes_manager.save_version_log(data)
+            self._vlog_dirty = False
         except Exception as e:
             print(f"[KiNotes] Version log save warning: {e}")
     
@@ -243,16 +259,23 @@ class VersionLogTabMixin:
             data = self.notes_manager.load_version_log()
             self._current_version = data.get("current_version", "0.1.0")
             if hasattr(self, 'version_input'):
-                self.version_input.SetValue(self._current_version)
+                self.version_input.ChangeValue(self._current_version)
             
             entries = data.get("entries", [])
-            for entry in entries:
-                self._add_version_log_item(
-                    version=entry.get("version", self._current_version),
-                    change_type=entry.get("type", "Added"),
-                    description=entry.get("description", ""),
-                    date=entry.get("date", "")
-                )
+            # Batch insert: one Freeze/Thaw and a single layout pass at the end
+            self.version_log_scroll.Freeze()
+            try:
+                for entry in entries:
+                    self._add_version_log_item(
+                        version=entry.get("version", self._current_version),
+                        change_type=entry.get("type", "Added"),
+                        description=entry.get("description", ""),
+                        date=entry.get("date", ""),
+                        defer_layout=True
+                    )
+            finally:
+                self.version_log_scroll.Thaw()
+                self._finish_version_log_batch()
         except Exception as e:
             print(f"[KiNotes] Version log load warning: {e}")
     
@@ -5,6 +5,7 @@ This module provides:
 - DARK_THEME / LIGHT_THEME: Main UI theme dictionaries
 - Color presets for editor backgrounds and text
 - hex_to_colour() utility for wx.Colour conversion
+- theme_colours() per-theme table of resolved wx.Colour values
 
 NOTE: Theme definitions are centralized in core/defaultsConfig.py
       This module re-exports them for backward compatibility.
@@ -14,6 +15,8 @@ Usage:
     theme = DARK_THEME if dark_mode else LIGHT_THEME
     panel.SetBackgroundColour(hex_to_colour(theme["bg_panel"]))
 """
+import functools
+
 import wx
 
 # Import from centralized defaults - handle both KiCad plugin and standalone context
@@ -33,9 +36,14 @@ DARK_THEME = THEMES['dark']
 LIGHT_THEME = THEMES['light']
 
 
+@functools.lru_cache(maxsize=128)
 def hex_to_colour(hex_str):
     """Convert hex color string to wx.Colour.
     
+    Results are memoized - the palette is small and this is called from
+    paint handlers and widget builders. Callers must not mutate the
+    returned colour in place.
+    
     Args:
         hex_str: Hex color like "#FFFFFF" or "FFFFFF"
     
@@ -49,6 +57,28 @@ def hex_to_colour(hex_str):
     return wx.Colour(r, g, b)
 
 
+_THEME_COLOURS = {}
+
+
+def theme_colours(theme):
+    """Return {key: wx.Colour} for a theme dict, resolved once per theme.
+    
+    The theme dicts are fixed, so every widget builder can share one table
+    instead of parsing the same hex strings again. Do not mutate the result.
+    
+    Args:
+        theme: Theme dictionary (DARK_THEME / LIGHT_THEME)
+    
+    Returns:
+        Dict mapping theme keys to wx.Colour
+    """
+    entry = _THEME_COLOURS.get(id(theme))
+    if entry is None or entry[0] is not theme:
+        entry = (theme, {k: hex_to_colour(v) for k, v in theme.items()})
+        _THEME_COLOURS[id(theme)] = entry
+    return entry[1]
+
+
 def get_theme(dark_mode=False):
     """Get the appropriate theme dictionary.
     
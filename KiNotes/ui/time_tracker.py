@@ -15,7 +15,6 @@ Usage:
     tracker.stop_task(task_id)
 """
 import time
-import datetime
 
 # Handle import in both KiCad plugin context and standalone
 try:
@@ -90,17 +89,24 @@ class TimeTracker:
             if self.current_running_task_id == task_id:
                 self.current_running_task_id = None
     
-    def get_task_time_string(self, task_id):
-        """Return formatted time string for a task."""
-        if task_id not in self.task_timers:
-            return "⏱ 00:00:00"
-        
-        data = self.task_timers[task_id]
+    @staticmethod
+    def _task_seconds(data, now):
+        """Seconds spent on a task, including the running session at `now`."""
         total_seconds = int(data["time_spent"])
-        
-        # Add running time if currently active
         if data["is_running"] and data["last_start_time"]:
-            total_seconds += int(time.time() - data["last_start_time"])
+            total_seconds += int(now - data["last_start_time"])
+        return total_seconds
+    
+    def get_task_time_string(self, task_id, now=None):
+        """Return formatted time string for a task.
+        
+        Pass `now` (time.time()) when formatting several tasks in one refresh.
+        """
+        data = self.task_timers.get(task_id)
+        if data is None:
+            return "⏱ 00:00:00"
+        
+        total_seconds = self._task_seconds(data, time.time() if now is None else now)
         
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
@@ -108,9 +114,9 @@ class TimeTracker:
         
         return f"⏱ {hours:02d}:{minutes:02d}:{seconds:02d}"
     
-    def get_total_time_string(self):
+    def get_total_time_string(self, now=None):
         """Return total time across all tasks."""
-        total_seconds = self.get_total_seconds()
+        total_seconds = self.get_total_seconds(now)
         
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
@@ -118,14 +124,12 @@ class TimeTracker:
         
         return f"⏱ Total Time: {hours:02d}:{minutes:02d}:{seconds:02d}"
     
-    def get_total_seconds(self):
+    def get_total_seconds(self, now=None):
         """Get total time in seconds."""
-        total_seconds = 0
-        for data in self.task_timers.values():
-            total_seconds += int(data["time_spent"])
-            if data["is_running"] and data["last_start_time"]:
-                total_seconds += int(time.time() - data["last_start_time"])
-        return total_seconds
+        if now is None:
+            now = time.time()
+        task_seconds = self._task_seconds
+        return sum(task_seconds(data, now) for data in self.task_timers.values())
     
     def mark_task_done(self, task_id):
         """Mark task as done and stop timer."""
@@ -147,6 +151,7 @@ class TimeTracker:
         
         # Choose time format based on setting
         time_fmt = "%H:%M" if format_24h else "%I:%M %p"
+        localtime, strftime = time.localtime, time.strftime
         
         # Use project name if provided, otherwise generic
         title = project_name if project_name else "KiCad Project"
@@ -166,8 +171,8 @@ class TimeTracker:
                 lines.append(f"## Task: {data['text']}")
                 
                 for session in data["history"]:
-                    start_dt = datetime.datetime.fromtimestamp(session['start']).strftime(time_fmt)
-                    stop_dt = datetime.datetime.fromtimestamp(session['stop']).strftime(time_fmt)
+                    start_dt = strftime(time_fmt, localtime(session['start']))
+                    stop_dt = strftime(time_fmt, localtime(session['stop']))
                     sess_sec = session['stop'] - session['start']
                     sess_min = sess_sec // 60
                     session_line = f"- Session: {start_dt} → {stop_dt} ({sess_min} min)"
@@ -209,12 +214,9 @@ class TimeTracker:
             return ""
         
         # Format times
-        if format_24h:
-            start_time = datetime.datetime.fromtimestamp(start_ts).strftime("%H:%M")
-            stop_time = datetime.datetime.fromtimestamp(stop_ts).strftime("%H:%M")
-        else:
-            start_time = datetime.datetime.fromtimestamp(start_ts).strftime("%I:%M %p")
-            stop_time = datetime.datetime.fromtimestamp(stop_ts).strftime("%I:%M %p")
+        time_fmt = "%H:%M" if format_24h else "%I:%M %p"
+        start_time = time.strftime(time_fmt, time.localtime(start_ts))
+        stop_time = time.strftime(time_fmt, time.localtime(stop_ts))
         
         # Calculate duration
         duration = stop_ts - start_ts
@@ -235,6 +237,8 @@ class TimeTracker:
         
         lines = []
         total_seconds = 0
+        time_fmt = "%H:%M" if format_24h else "%I:%M %p"
+        localtime, strftime = time.localtime, time.strftime
         
         for session in history:
             start_ts = session.get("start", 0)
@@ -243,12 +247,8 @@ class TimeTracker:
             if not start_ts or not stop_ts:
                 continue
             
-            if format_24h:
-                start_time = datetime.datetime.fromtimestamp(start_ts).strftime("%H:%M")
-                stop_time = datetime.datetime.fromtimestamp(stop_ts).strftime("%H:%M")
-            else:
-                start_time = datetime.datetime.fromtimestamp(start_ts).strftime("%I:%M %p")
-                stop_time = datetime.datetime.fromtimestamp(stop_ts).strftime("%I:%M %p")
+            start_time = strftime(time_fmt, localtime(start_ts))
+            stop_time = strftime(time_fmt, localtime(stop_ts))
             
             duration = stop_ts - start_ts
             total_seconds += duration
@@ -117,6 +117,18 @@ def scale_size(size, window=None):
     return int(size * factor)
 
 
+# Click-to-probe patterns - compiled once instead of on every click
+_DESIGNATOR_PREFIXES = ['R', 'C', 'L', 'D', 'U', 'Q', 'J', 'P', 'K', 'SW', 'S', 'F', 'FB',
+                        'TP', 'Y', 'X', 'T', 'M', 'LED', 'IC', 'CON', 'RLY', 'XTAL', 'ANT',
+                        'BT', 'VR', 'RV', 'TR', 'FID', 'MH', 'JP', 'LS', 'SP', 'MIC']
+_DESIGNATOR_RE = re.compile(
+    r'^(' + '|'.join(sorted(_DESIGNATOR_PREFIXES, key=len, reverse=True)) + r')(\d+[A-Z]?)$',
+    re.IGNORECASE
+)
+_NET_EXPLICIT_RE = re.compile(r'\[\[NET:([A-Za-z0-9_+\-]+)\]\]')  # [[NET:VCC]]
+_NET_SHORT_RE = re.compile(r'@([A-Za-z0-9_+\-]+)')  # @VCC
+
+
 # ============================================================
 # VISUAL EDITOR STYLES - Dark/Light Theme Aware
 # ============================================================
@@ -1702,19 +1714,8 @@ class VisualNoteEditor(wx.Panel):
         # Check if it matches a designator pattern
         word_upper = word.upper()
         
-        # Use the smart pattern from designator linker
-        import re
-        # Standard EE designator prefixes
-        prefixes = ['R', 'C', 'L', 'D', 'U', 'Q', 'J', 'P', 'K', 'SW', 'S', 'F', 'FB', 
-                   'TP', 'Y', 'X', 'T', 'M', 'LED', 'IC', 'CON', 'RLY', 'XTAL', 'ANT', 
-                   'BT', 'VR', 'RV', 'TR', 'FID', 'MH', 'JP', 'LS', 'SP', 'MIC']
-        
-        pattern = re.compile(
-            r'^(' + '|'.join(sorted(prefixes, key=len, reverse=True)) + r')(\d+[A-Z]?)$',
-            re.IGNORECASE
-        )
-        
-        if pattern.match(word_upper):
+        # Standard EE designator prefixes (pattern compiled once at module level)
+        if _DESIGNATOR_RE.match(word_upper):
             return word_upper
         
         return None
@@ -1777,11 +1778,8 @@ class VisualNoteEditor(wx.Panel):
         
         self._log_debug("net", EventLevel.DEBUG, f"[KiNotes Net Detection] Search snippet: '{search_text}'")
         
-        import re
-        
         # Try explicit syntax first: [[NET:NETNAME]] (supports special chars like +3V3, AC_N)
-        pattern_explicit = r'\[\[NET:([A-Za-z0-9_+\-]+)\]\]'
-        for match in re.finditer(pattern_explicit, search_text):
+        for match in _NET_EXPLICIT_RE.finditer(search_text):
             match_start = search_start + match.start()
             match_end = search_start + match.end()
             if match_start <= pos < match_end:
@@ -1790,8 +1788,7 @@ class VisualNoteEditor(wx.Panel):
                 return (net_name, match_start, match_end)
         
         # Try short form: @NETNAME (supports special chars like +3V3, AC_N)
-        pattern_short = r'@([A-Za-z0-9_+\-]+)'
-        for match in re.finditer(pattern_short, search_text):
+        for match in _NET_SHORT_RE.finditer(search_text):
             match_start = search_start + match.start()
             match_end = search_start + match.end()
             if match_start <= pos < match_end: